@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """Custom YAML/JSON Configuration Parser with Advanced Features"""
 
+import copy
 import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import yaml
@@ -20,17 +21,29 @@ class ConfigValidationError(Exception):
     pass
 
 
+# Marks schema entries without a 'default' rule
+NO_DEFAULT = object()
+
+
 class ConfigParser:
     """Advanced configuration parser with env vars, includes, and validation."""
 
-    def __init__(self, schema: Optional[Dict] = None):
+    def __init__(self, schema: Optional[Dict] = None, loader: Optional[type] = None,
+                 apply_defaults: bool = False):
         """
         Initialize parser with optional schema.
 
         Args:
             schema: Validation schema for the configuration
+            loader: PyYAML loader class for YAML files (default: yaml.SafeLoader),
+                e.g. tools/validators/yaml_core_schema.CoreSchemaLoader to keep
+                dates and yes/no as strings
+            apply_defaults: Fill in missing keys from the schema's 'default' rules
         """
         self.schema = schema
+        self.loader = loader or yaml.SafeLoader
+        # Built once here, so each parse only walks the keys that have defaults
+        self.defaults = self._build_defaults(schema) if apply_defaults and schema else {}
 
     def parse(self, file_path: str) -> Dict[str, Any]:
         """
@@ -50,7 +63,7 @@ class ConfigParser:
         # Load file
         with open(file_path, 'r') as f:
             if file_path.suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=self.loader)
             elif file_path.suffix == '.json':
                 data = json.load(f)
             else:
@@ -59,6 +72,10 @@ class ConfigParser:
         # Process configuration
         data = self._process_data(data, file_path.parent)
 
+        # Fill in defaults before validation, so defaulted keys count as present
+        if self.defaults and isinstance(data, dict):
+            self._apply_defaults(data, self.defaults)
+
         # Validate if schema provided
         if self.schema:
             self._validate(data, self.schema)
@@ -104,6 +121,35 @@ class ConfigParser:
         """Process list items."""
         return [self._process_data(item, base_path) for item in data]
 
+    def _build_defaults(self, schema: Dict) -> Dict[str, Tuple[Any, Dict]]:
+        """
+        Collect the 'default' rules of a schema into a tree.
+
+        Args:
+            schema: Validation schema
+
+        Returns:
+            Mapping of key to (default or NO_DEFAULT, defaults of the nested
+            schema), containing only keys that lead to a default
+        """
+        tree = {}
+        for key, rules in schema.items():
+            nested = self._build_defaults(rules['schema']) if 'schema' in rules else {}
+            default = rules.get('default', NO_DEFAULT)
+            if default is not NO_DEFAULT or nested:
+                tree[key] = (default, nested)
+        return tree
+
+    def _apply_defaults(self, data: Dict, tree: Dict[str, Tuple[Any, Dict]]) -> None:
+        """Fill in missing keys from a defaults tree, in one pass over the data."""
+        for key, (default, nested) in tree.items():
+            if key not in data:
+                if default is NO_DEFAULT:
+                    continue
+                data[key] = copy.deepcopy(default)
+            if nested and isinstance(data[key], dict):
+                self._apply_defaults(data[key], nested)
+
     def _expand_env_vars(self, value: str) -> str:
         """
         Expand environment variables in string.
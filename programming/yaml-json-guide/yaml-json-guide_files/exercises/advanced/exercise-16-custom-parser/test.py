@@ -3,6 +3,7 @@
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Import the parser
@@ -130,6 +131,76 @@ def test_missing_env_var():
             return False
 
 
+def test_schema_defaults():
+    """Test filling in defaults from the schema."""
+    print("\nTesting schema defaults...")
+
+    os.environ['DB_USERNAME'] = 'admin'
+
+    schema = {
+        'server': {
+            'required': True,
+            'type': dict,
+            'schema': {
+                'port': {'required': True, 'type': int},
+                'ssl': {'type': bool, 'default': False},
+                'tls': {'type': dict, 'default': {'ciphers': ['modern']}},
+            }
+        },
+        'metrics': {'required': True, 'type': dict, 'default': {'enabled': True}},
+    }
+
+    parser = ConfigParser(schema=schema, apply_defaults=True)
+    config_path = Path(__file__).parent / 'config.yaml'
+
+    try:
+        config = parser.parse(str(config_path))
+    except ConfigValidationError as e:
+        print(f"❌ Defaults not applied before validation: {e}")
+        return False
+
+    if config['server']['ssl'] is not False or config['metrics'] != {'enabled': True}:
+        print(f"❌ Defaults not applied: {config['server']}, {config.get('metrics')}")
+        return False
+
+    if config['server']['port'] != 8080:
+        print("❌ Default overwrote an existing value")
+        return False
+
+    config['server']['tls']['ciphers'].append('legacy')
+    if parser.parse(str(config_path))['server']['tls'] != {'ciphers': ['modern']}:
+        print("❌ Default values are shared between parses")
+        return False
+
+    print("✅ Schema defaults applied")
+    return True
+
+
+def test_core_schema_loader():
+    """Test loading with the YAML 1.2 core schema loader from tools/."""
+    print("\nTesting YAML 1.2 core schema loader...")
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'tools' / 'validators'))
+    try:
+        from yaml_core_schema import CoreSchemaLoader
+    except ImportError:
+        print("❌ Could not import CoreSchemaLoader from tools/validators")
+        return False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / 'config.yaml'
+        config_path.write_text("released: 2024-01-05\ncountry: NO\nmode: 0755\nenabled: true\n")
+        config = ConfigParser(loader=CoreSchemaLoader).parse(str(config_path))
+
+    expected = {'released': '2024-01-05', 'country': 'NO', 'mode': 755, 'enabled': True}
+    if config != expected:
+        print(f"❌ Unexpected values: {config}")
+        return False
+
+    print("✅ Dates and yes/no stay strings with the core schema")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -148,6 +219,8 @@ def main():
         test_default_values,
         test_validation,
         test_missing_env_var,
+        test_schema_defaults,
+        test_core_schema_loader,
     ]
 
     passed = 0
@@ -175,7 +248,9 @@ def main():
         print("  ✓ Schema validation")
         print("  ✓ Type checking")
         print("  ✓ Range validation")
+        print("  ✓ Schema defaults")
         print("  ✓ Error handling")
+        print("  ✓ Pluggable YAML loader")
         return True
     else:
         print(f"\n❌ {failed} test(s) failed")
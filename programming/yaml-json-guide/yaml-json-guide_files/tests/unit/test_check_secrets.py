@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/check_secrets.py"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import check_secrets  # noqa: E402
+
+# Pieces of text around the pattern keywords, in varied case and spacing
+FRAGMENTS = ['pass' + 'word', 'PassWord', 'api_' + 'key', 'API-KEY', 'apikey', 'sec' + 'ret', 'SECRET', 'tok' + 'en',
+             'secretoken', 'private_' + 'key', 'privatekey', 'AKIA', 'ABCDEFGHIJ0123456789', 'xox',
+             '-----BEGIN', ' RSA PRIVATE KEY-----', ':', '=', ': ', ' = ', '"', "'", 'hunter22', 'abc',
+             'changeme', '${VAR}', ' ', '  ', '#', '//', 'x', '\n', '\n', '\n']
+
+
+def reference_scan(text):
+    """The original line-by-line scan: re.findall with every pattern on every non-comment line."""
+    findings = []
+    for line_num, line in enumerate(text.split('\n'), start=1):
+        if line.strip().startswith('#') or line.strip().startswith('//'):
+            continue
+        for secret_type, pattern in check_secrets.SECRET_PATTERNS.items():
+            for match in pattern.findall(line):
+                value = match if isinstance(match, str) else match[0]
+                findings.append((line_num, secret_type, line.strip(), value))
+    return findings
+
+
+def test_matcher_matches_reference_scan():
+    """SecretMatcher finds what running every pattern on every line finds."""
+    rng = random.Random(43)
+    for _ in range(2000):
+        text = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+        found = [tuple(finding) for finding in check_secrets.MATCHER.scan(text.encode('ascii'))]
+        assert found == reference_scan(text), text
+    print("✅ Test passed")
+
+
+def test_matches_across_chunks():
+    """Keywords straddling the matcher's chunk boundary are found."""
+    line = 'api_' + 'key: hunter22'
+    for padding in range(len(line) + 1):
+        text = 'x' * (check_secrets.SecretMatcher.CHUNK_SIZE - padding) + '\n' + line + '\n'
+        assert [finding.line_content for finding in check_secrets.MATCHER.scan(text.encode('ascii'))] == [line]
+    print("✅ Test passed")
+
+
+def test_scan_text_skips_safe_values():
+    """Placeholder values are dropped and results are (line, type, content) unless values are asked for."""
+    text = 'pass' + 'word: changeme\n' + 'tok' + 'en: hunter22\n'
+    assert check_secrets.scan_text(text) == [(2, 'token', 'tok' + 'en: hunter22')]
+    assert check_secrets.scan_text(text, with_values=True)[0].value == 'hunter22'
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_matcher_matches_reference_scan()
+    test_matches_across_chunks()
+    test_scan_text_skips_safe_values()
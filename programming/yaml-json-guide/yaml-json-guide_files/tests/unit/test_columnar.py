@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/columnar.py"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import jsonschema  # noqa: E402
+
+import columnar  # noqa: E402
+
+
+COLUMNAR = columnar.extend_validator(jsonschema.Draft7Validator)
+
+
+def errors(validator_class, schema, data):
+    """Sorted (path, message) pairs of a validation run."""
+    return sorted((list(error.absolute_path), error.message)
+                  for error in validator_class(schema).iter_errors(data))
+
+
+def assert_same_errors(schema, rows):
+    """The columnar validator reports exactly what Draft7Validator reports."""
+    expected = errors(jsonschema.Draft7Validator, schema, rows)
+    assert errors(COLUMNAR, schema, rows) == expected, schema
+    return expected
+
+
+def test_boolean_and_required_only_columns():
+    """Required names without a property schema and `true` properties match the normal validator."""
+    schema = {
+        'type': 'array',
+        'items': {
+            'properties': {'name': {'type': 'string'}, 'extra': True, 'never': False},
+            'required': ['id', 'name'],
+        },
+    }
+    rows = [{'id': index, 'name': f'user{index}', 'extra': [index]} for index in range(100)]
+    del rows[5]['id']
+    rows[7]['name'] = 7
+    rows[9]['never'] = None
+
+    expected = assert_same_errors(schema, rows)
+    assert [path[0] for path, _ in expected] == [5, 7, 9]
+    print("✅ Test passed")
+
+
+def test_enum_and_const_together():
+    """A value must be in the enum and equal the const."""
+    schema = {'type': 'array', 'items': {'properties': {'level': {'enum': [0, None, 2.5], 'const': 1}}}}
+    rows = [{'level': 0} for _ in range(100)]
+
+    expected = assert_same_errors(schema, rows)
+    assert len(expected) == 100
+    print("✅ Test passed")
+
+
+def test_required_only_names_under_closed_records():
+    """Required names that are not properties are still additional properties."""
+    schema = {
+        'type': 'array',
+        'items': {
+            'properties': {'name': {'type': 'string'}},
+            'required': ['name', 'id'],
+            'additionalProperties': False,
+        },
+    }
+    rows = [{'id': index, 'name': f'user{index}'} for index in range(100)]
+
+    expected = assert_same_errors(schema, rows)
+    assert {message for _, message in expected} == {
+        "Additional properties are not allowed ('id' was unexpected)"}
+    print("✅ Test passed")
+
+
+def test_random_schemas_match_draft7():
+    """Randomly built record schemas and rows give the same errors as Draft7Validator."""
+    rng = random.Random(42)
+    values = [0, 1, 1.0, 2.5, -3, None, True, False, 'a', 'bb', '', [1], {'x': 1}]
+    keywords = {
+        'type': lambda: rng.choice(['integer', 'number', 'string', 'null', 'boolean', ['string', 'null']]),
+        'enum': lambda: rng.sample([0, 1, 2.5, None, 'a', 'bb'], rng.randint(1, 3)),
+        'const': lambda: rng.choice([0, 1, 'a', None, 2.5]),
+        'minimum': lambda: rng.randint(0, 2),
+        'maximum': lambda: rng.randint(0, 2),
+        'exclusiveMinimum': lambda: rng.randint(0, 2),
+        'minLength': lambda: rng.randint(0, 2),
+        'maxLength': lambda: rng.randint(0, 2),
+    }
+
+    def property_schema():
+        if rng.random() < 0.1:
+            return rng.choice([True, False])
+        return {keyword: keywords[keyword]() for keyword in rng.sample(sorted(keywords), rng.randint(0, 3))}
+
+    for _ in range(300):
+        items = {'properties': {name: property_schema()
+                                for name in rng.sample(['p', 'q', 'r', 's'], rng.randint(1, 3))}}
+        if rng.random() < 0.6:
+            items['required'] = rng.sample(['p', 'q', 'r', 's', 'z'], rng.randint(0, 3))
+        if rng.random() < 0.5:
+            items['additionalProperties'] = rng.choice([True, False])
+        rows = [{name: rng.choice(values) for name in rng.sample(['p', 'q', 'r', 's', 'z'], rng.randint(0, 5))}
+                for _ in range(columnar.MIN_ROWS + 6)]
+        assert_same_errors({'type': 'array', 'items': items}, rows)
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_boolean_and_required_only_columns()
+    test_enum_and_const_together()
+    test_required_only_names_under_closed_records()
+    test_random_schemas_match_draft7()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/entropy.py"""
+
+import math
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import entropy  # noqa: E402
+
+
+def flagged(text):
+    """Tokens of a text that iter_high_entropy reports."""
+    buffer = text.encode('ascii')
+    return [buffer[start:end].decode('ascii') for start, end, _, _ in entropy.iter_high_entropy(buffer)]
+
+
+def test_shortest_token_can_reach_threshold():
+    """No shorter token could reach the base64 threshold; the shortest can."""
+    assert math.log2(entropy.MIN_TOKEN_LENGTH - 1) < entropy.BASE64_THRESHOLD
+    assert math.log2(entropy.MIN_TOKEN_LENGTH) >= entropy.BASE64_THRESHOLD
+
+    distinct = string.ascii_uppercase[:entropy.MIN_TOKEN_LENGTH]
+    assert flagged(f'value: {distinct}\n') == [distinct]
+    print("✅ Test passed")
+
+
+def test_paths_and_urls_are_not_flagged():
+    """Paths and URLs are split at '/' instead of being read as one base64 token."""
+    text = ('repo: https://github.com/YOUR_USERNAME/yaml-json-guide\n'
+            'script: tools/validators/check_secrets.py\n'
+            'docs: src/Main_Application/Config-Loader/Settings_Store\n')
+    assert flagged(text) == []
+    print("✅ Test passed")
+
+
+def test_standard_base64_keeps_slashes():
+    """A standard base64 value containing '/' is still one candidate."""
+    rng = random.Random(7)
+    alphabet = string.ascii_letters + string.digits + '+/'
+    token = ''.join(rng.choice(alphabet) for _ in range(40))
+    assert '/' in token
+    assert flagged(f'signing: {token}\n') == [token]
+    print("✅ Test passed")
+
+
+def test_numpy_and_python_entropy_agree():
+    """Both entropy implementations give the same values."""
+    rng = random.Random(3)
+    tokens = [bytes(rng.choice(b'abcdef0123') for _ in range(rng.randint(1, 80))) for _ in range(50)]
+    expected = entropy._entropy_python(tokens)
+    assert all(abs(a - b) < 1e-9 for a, b in zip(entropy.shannon_entropy(tokens), expected))
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_shortest_token_can_reach_threshold()
+    test_paths_and_urls_are_not_flagged()
+    test_standard_base64_keeps_slashes()
+    test_numpy_and_python_entropy_agree()
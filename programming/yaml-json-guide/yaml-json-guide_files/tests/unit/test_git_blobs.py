@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/git_blobs.py"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import git_blobs  # noqa: E402
+
+
+def git(repo, *args):
+    """Run git in repo and return its output."""
+    return subprocess.run(['git', '-C', str(repo), '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+                           *args], check=True, capture_output=True).stdout
+
+
+def commit_files(repo, message, files):
+    """Write (or, for None, delete) files and commit them."""
+    for name, content in files.items():
+        path = repo / name
+        if content is None:
+            path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', message)
+
+
+def make_repo(repo):
+    """A repository with edits, a deletion, a file name with a space and a merge."""
+    git(repo, 'init', '-q', '-b', 'main')
+    commit_files(repo, 'first', {'a.yaml': b'a: 1\n', 'dir/b c.json': b'{}\n', 'bin.dat': bytes(range(256))})
+    commit_files(repo, 'second', {'a.yaml': b'a: 2\n', 'bin.dat': None})
+    git(repo, 'checkout', '-q', '-b', 'side')
+    commit_files(repo, 'side', {'side.yaml': b'side: true\n'})
+    git(repo, 'checkout', '-q', 'main')
+    commit_files(repo, 'third', {'dir/b c.json': b'{"b": 3}\n'})
+    git(repo, 'merge', '-q', '--no-edit', 'side')
+
+
+def test_history_matches_git_show(tmp_path):
+    """Every listed version is a file a commit added or modified, with the blob git show reads."""
+    make_repo(tmp_path)
+    refs = list(git_blobs.iter_history(str(tmp_path)))
+
+    for ref in refs:
+        assert git(tmp_path, 'rev-parse', f'{ref.commit}:{ref.path}').decode().strip() == ref.blob
+    # Non-merge commits list the files they add or modify (deleted files are left out)
+    for commit in git(tmp_path, 'rev-list', '--no-merges', 'HEAD').decode().split():
+        changed = git(tmp_path, 'show', '--root', '--name-only', '--diff-filter=d', '--format=', commit)
+        assert sorted(ref.path for ref in refs if ref.commit == commit) == sorted(changed.decode().split('\n')[:-1])
+    # Oldest commit first, and the merge brings side.yaml in again (diffed against main)
+    assert refs[0].commit == git(tmp_path, 'rev-list', '--max-parents=0', 'HEAD').decode().strip()
+    assert [ref.path for ref in refs].count('side.yaml') == 2
+    print("✅ Test passed")
+
+
+def test_staged_and_blob_contents(tmp_path):
+    """Staged files are listed and the reader returns their content, or None for unknown objects."""
+    make_repo(tmp_path)
+    (tmp_path / 'new.yaml').write_bytes(b'new: 1\n')
+    (tmp_path / 'a.yaml').write_bytes(b'a: 3\n')
+    git(tmp_path, 'add', 'new.yaml', 'a.yaml')
+
+    staged = sorted(git_blobs.iter_staged(str(tmp_path)))
+    assert [(ref.path, ref.commit, ref.label) for ref in staged] == [
+        ('a.yaml', None, ':a.yaml'), ('new.yaml', None, ':new.yaml')]
+
+    missing = '0' * 40
+    hashes = [ref.blob for ref in staged] + [missing] + [ref.blob for ref in git_blobs.iter_history(str(tmp_path))]
+    with git_blobs.BlobReader(str(tmp_path)) as reader:
+        blobs = list(reader.iter_blobs(hashes))
+    assert [name for name, _ in blobs] == hashes
+    assert blobs[len(staged)][1] is None
+    for name, data in blobs:
+        if name != missing:
+            assert data == git(tmp_path, 'cat-file', 'blob', name)
+    print("✅ Test passed")
+
+
+def test_unknown_revision(tmp_path):
+    """An unknown revision raises GitError."""
+    make_repo(tmp_path)
+    try:
+        list(git_blobs.iter_history(str(tmp_path), ['no-such-branch']))
+    except git_blobs.GitError:
+        pass
+    else:
+        raise AssertionError("GitError not raised")
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    for test in (test_history_matches_git_show, test_staged_and_blob_contents, test_unknown_revision):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/json_stream.py"""
+
+import io
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+from json_stream import StreamDecodeError, iter_json_array  # noqa: E402
+
+
+def test_early_syntax_error_stops_reading():
+    """A syntax error near the start is reported without reading the rest of the file."""
+    records = [json.dumps({'id': index, 'name': f'user{index}', 'tags': ['a', 'b']})
+               for index in range(100_000)]
+    records[10] = '{"id": 10, "name": x}'
+    stream = io.StringIO('[' + ',\n'.join(records) + ']')
+
+    tracemalloc.start()
+    try:
+        list(iter_json_array(stream))
+        raise AssertionError("StreamDecodeError not raised")
+    except StreamDecodeError as e:
+        assert (e.msg, e.lineno, e.index) == ('Expecting value', 11, 10)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert stream.tell() < 1024 * 1024
+    assert peak < 1024 * 1024, f"peak {peak} bytes"
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_early_syntax_error_stops_reading()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/k8s_secrets.py"""
+
+import base64
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import yaml  # noqa: E402
+
+import check_all  # noqa: E402
+import check_secrets  # noqa: E402
+from k8s_secrets import iter_secret_values  # noqa: E402
+
+# Split so the scanner does not flag this file itself
+DB_PLAIN = b'pass' + b'word: hunter22'
+API_PLAIN = b'tok' + b'en: abcdefghijklmnop'
+DB_VALUE = base64.b64encode(DB_PLAIN).decode()
+API_VALUE = base64.b64encode(API_PLAIN).decode()
+
+MANIFEST = f"""apiVersion: v1
+kind: Secret
+metadata:
+  name: db
+  annotations:
+    note: {DB_VALUE}
+type: Opaque
+data:
+  db: {DB_VALUE}
+  quoted: "{API_VALUE}"
+  block: |
+    {API_VALUE[:12]}
+    {API_VALUE[12:]}
+  binary: AAECAw==
+  invalid: not base64!
+"""
+
+
+def values(buffer, documents=None):
+    return [(value.line_num, value.key, value.decoded)
+            for value in iter_secret_values(buffer, documents=documents)]
+
+
+def test_composed_values():
+    """Values are decoded and placed on the line of their node."""
+    assert values(MANIFEST.encode()) == [
+        (9, 'db', DB_PLAIN),
+        (10, 'quoted', API_PLAIN),
+        (11, 'block', API_PLAIN),
+    ]
+    print("✅ Test passed")
+
+
+def test_given_documents_match_composed():
+    """Nodes and loaded objects passed by a caller give the lines of the standalone parse."""
+    expected = values(MANIFEST.encode())
+    assert values(MANIFEST.encode(), list(yaml.compose_all(MANIFEST))) == expected
+
+    data = yaml.safe_load(MANIFEST)
+    text = json.dumps(data, indent=2).encode()
+    assert values(text, [json.loads(text)]) == values(text)
+    print("✅ Test passed")
+
+
+def test_budgets():
+    """Long values are skipped and decoding stops at the per-file budget."""
+    buffer = MANIFEST.encode()
+    assert [value.key for value in iter_secret_values(buffer, max_value_bytes=len(DB_VALUE))] == ['db']
+    assert [value.key for value in iter_secret_values(buffer, max_file_bytes=30)] == ['db']
+    print("✅ Test passed")
+
+
+def test_check_all_reports_what_check_secrets_reports(tmp_path):
+    """A value repeated in an annotation is reported once, on its data line, by both tools."""
+    for name, text in (('secret.yaml', MANIFEST),
+                       ('secret.json', json.dumps(yaml.safe_load(MANIFEST), indent=2))):
+        path = tmp_path / name
+        path.write_text(text)
+        expected = check_secrets.scan_file(str(path))
+        assert any('decoded' in finding[2] for finding in expected)
+        results = check_all.Pipeline().check(str(path))
+        report = [result.message for result in results if result.stage == 'secrets'][0]
+        lines = [f"Line {line_num} [{secret_type}]: {content}" for line_num, secret_type, content, *_ in expected]
+        assert report.split('\n')[1:] == [f"    {line}" for line in lines], report
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    import tempfile
+    test_composed_values()
+    test_given_documents_match_composed()
+    test_budgets()
+    with tempfile.TemporaryDirectory() as directory:
+        test_check_all_reports_what_check_secrets_reports(Path(directory))
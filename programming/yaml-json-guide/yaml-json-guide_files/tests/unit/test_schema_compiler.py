@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/schema_compiler.py"""
+
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import jsonschema  # noqa: E402
+
+import schema_compiler  # noqa: E402
+
+SCHEMAS_DIR = Path(__file__).resolve().parents[2] / 'schemas'
+
+VALUES = [0, 1, 1.0, 2.5, -3, 10, None, True, False, '', 'a', 'abc', 'a1', [], [1], [1, 1], [1, '1'],
+          [True, 1], {}, {'a': 1}, {'b': 'x'}, {'a': 1, 'b': None}]
+
+
+def compiled(schema):
+    """Namespace of the generated module for a schema."""
+    namespace = {}
+    exec(schema_compiler.compile_schema_source(schema), namespace)
+    return namespace
+
+
+def assert_same_validity(schema, instances):
+    """The compiled validator accepts exactly what Draft7Validator accepts, and explains rejections."""
+    module = compiled(schema)
+    validator = jsonschema.Draft7Validator(schema)
+    for instance in instances:
+        expected = validator.is_valid(instance)
+        assert module['is_valid'](instance) == expected, (schema, instance)
+        assert (not list(module['iter_errors'](instance))) == expected, (schema, instance)
+
+
+def random_schema(rng, depth=0):
+    """A random draft-07 schema built from the keywords the compiler supports."""
+    if rng.random() < 0.1:
+        return rng.choice([True, False])
+    keywords = {
+        'type': lambda: rng.choice(['integer', 'number', 'string', 'null', 'boolean', 'array', 'object',
+                                    ['string', 'null'], ['integer', 'array']]),
+        'enum': lambda: rng.sample(VALUES, rng.randint(1, 4)),
+        'const': lambda: rng.choice(VALUES),
+        'minimum': lambda: rng.randint(-1, 3),
+        'exclusiveMaximum': lambda: rng.randint(0, 3),
+        'multipleOf': lambda: rng.choice([1, 2, 0.5]),
+        'minLength': lambda: rng.randint(0, 2),
+        'maxLength': lambda: rng.randint(0, 2),
+        'pattern': lambda: rng.choice(['^a', '[0-9]', 'b$']),
+        'minItems': lambda: rng.randint(0, 2),
+        'uniqueItems': lambda: rng.choice([True, False]),
+        'required': lambda: rng.sample(['a', 'b'], rng.randint(0, 2)),
+        'maxProperties': lambda: rng.randint(0, 2),
+    }
+    if depth < 2:
+        keywords.update({
+            'items': lambda: random_schema(rng, depth + 1),
+            'contains': lambda: random_schema(rng, depth + 1),
+            'properties': lambda: {'a': random_schema(rng, depth + 1)},
+            'additionalProperties': lambda: random_schema(rng, depth + 1),
+            'anyOf': lambda: [random_schema(rng, depth + 1) for _ in range(2)],
+            'oneOf': lambda: [random_schema(rng, depth + 1) for _ in range(2)],
+            'not': lambda: random_schema(rng, depth + 1),
+        })
+    return {keyword: keywords[keyword]() for keyword in rng.sample(sorted(keywords), rng.randint(1, 3))}
+
+
+def test_random_schemas_match_draft7():
+    """Randomly built schemas accept and reject the same values as Draft7Validator."""
+    rng = random.Random(26)
+    for _ in range(500):
+        assert_same_validity(random_schema(rng), VALUES)
+    print("✅ Test passed")
+
+
+def test_definitions_and_refs():
+    """Local $ref, recursive references and if/then/else match Draft7Validator."""
+    schema = {
+        'definitions': {'node': {'type': 'object', 'properties': {'children': {
+            'type': 'array', 'items': {'$ref': '#/definitions/node'}}}, 'required': ['name']}},
+        '$ref': '#/definitions/node',
+        'if': {'properties': {'name': {'const': 'leaf'}}},
+        'then': {'properties': {'children': {'maxItems': 0}}},
+        'else': {'required': ['children']},
+    }
+    instances = [
+        {'name': 'leaf'}, {'name': 'leaf', 'children': [{'name': 'x'}]}, {'name': 'root'},
+        {'name': 'root', 'children': [{'name': 'x'}, {}]}, {'name': 'root', 'children': []}, [],
+    ]
+    assert_same_validity(schema, instances)
+    print("✅ Test passed")
+
+
+def test_cached_module_for_repo_schemas():
+    """Repository schemas compile, load from the cache and reject what Draft7Validator rejects."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for schema_path in sorted(SCHEMAS_DIR.glob('*.schema.json')):
+            schema = json.loads(schema_path.read_text(encoding='utf-8'))
+            module = schema_compiler.load_compiled_validator(str(schema_path), cache_dir=cache_dir)
+            assert list(Path(cache_dir).glob('_schema_*.py'))
+            validator = jsonschema.Draft7Validator(schema)
+            for instance in VALUES:
+                assert module.is_valid(instance) == validator.is_valid(instance), (schema_path, instance)
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_random_schemas_match_draft7()
+    test_definitions_and_refs()
+    test_cached_module_for_repo_schemas()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/secret_baseline.py"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+VALIDATORS = Path(__file__).resolve().parents[2] / 'tools' / 'validators'
+sys.path.insert(0, str(VALIDATORS))
+
+import secret_baseline  # noqa: E402
+
+
+def fingerprints(count, seed):
+    """Distinct fingerprints of made-up findings."""
+    return [secret_baseline.fingerprint(f'dir/file{seed}-{index}.yaml', 'token', str(index))
+            for index in range(count)]
+
+
+def test_fingerprint_ignores_path_spelling():
+    """'./a/b.yaml' and 'a/b.yaml' are the same file; the type and value are part of the fingerprint."""
+    fingerprint = secret_baseline.fingerprint
+    assert fingerprint('./a/b.yaml', 'token', 'v') == fingerprint('a/b.yaml', 'token', 'v')
+    assert len(fingerprint('a/b.yaml', 'token', 'v')) == secret_baseline.FINGERPRINT_LENGTH
+    assert fingerprint('a/b.yaml', 'token', 'v') != fingerprint('a/b.yaml', 'secret', 'v')
+    assert fingerprint('a/b.yaml', 'token', 'v') != fingerprint('a/b.yaml', 'token', 'w')
+    print("✅ Test passed")
+
+
+def test_write_and_load(tmp_path):
+    """A written baseline loads back as the same set of fingerprints."""
+    entries = fingerprints(100, 0)
+    path = tmp_path / 'baseline'
+    assert secret_baseline.write(str(path), entries + entries[:10]) == 100
+    assert secret_baseline.load(str(path)) == set(entries)
+    print("✅ Test passed")
+
+
+def test_bloom_filter_agrees_with_set():
+    """The Bloom filter holds every fingerprint added and rarely claims others."""
+    known = fingerprints(5000, 1)
+    bloom = secret_baseline.BloomFilter(len(known))
+    for fingerprint in known:
+        bloom.add(fingerprint)
+    assert all(fingerprint in bloom for fingerprint in known)
+    assert sum(fingerprint in bloom for fingerprint in fingerprints(20000, 2)) <= 1
+    print("✅ Test passed")
+
+
+def test_baseline_suppresses_only_recorded_findings(tmp_path):
+    """check_secrets.py --baseline hides recorded findings and reports changed values."""
+    config = tmp_path / 'config.yaml'
+    config.write_text('api_' + 'key: hunter22\n', encoding='utf-8')
+    baseline = tmp_path / 'baseline'
+
+    def run(*args):
+        return subprocess.run([sys.executable, str(VALIDATORS / 'check_secrets.py'), 'config.yaml',
+                               '--baseline', str(baseline), *args],
+                              cwd=tmp_path, capture_output=True, text=True).returncode
+
+    assert run('--update-baseline') == 0
+    assert run() == 0
+    config.write_text('# moved down\napi_' + 'key: hunter22\n', encoding='utf-8')
+    assert run() == 0
+    config.write_text('api_' + 'key: hunter23\n', encoding='utf-8')
+    assert run() == 1
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_fingerprint_ignores_path_spelling()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_write_and_load(Path(tmp))
+    test_bloom_filter_agrees_with_set()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_baseline_suppresses_only_recorded_findings(Path(tmp))
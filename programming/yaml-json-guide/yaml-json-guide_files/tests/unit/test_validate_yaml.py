@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/validate_yaml.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import yaml  # noqa: E402
+
+from validate_yaml import validate_yaml_file  # noqa: E402
+
+
+def test_syntax_errors_keep_the_pure_python_message(tmp_path):
+    """Syntax errors read as yaml.SafeLoader words them, source line and caret included."""
+    for text in ('a: [1, 2\nb: 3\n', 'x:\n  - a\n  b: c\n', 'key: "unterminated\n'):
+        path = tmp_path / 'broken.yaml'
+        path.write_text(text)
+        try:
+            list(yaml.load_all(text, Loader=yaml.SafeLoader))
+            raise AssertionError("text should not parse")
+        except yaml.YAMLError as e:
+            expected = f"YAML syntax error: {e}"
+        for core_schema in (False, True):
+            assert validate_yaml_file(str(path), core_schema=core_schema) == (False, expected)
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        test_syntax_errors_keep_the_pure_python_message(Path(directory))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/yaml_lint.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import yaml_lint  # noqa: E402
+
+WORD = 'x' * 100
+
+
+def line_length_problems(lines, **options):
+    """Line numbers the line-length rule reports for the given lines."""
+    linter = yaml_lint.Linter({'line-length': options})
+    linter.feed_lines('\n'.join(lines))
+    return [problem.line for problem in linter.sorted_problems()]
+
+
+def test_non_breakable_words():
+    """A long word alone, after "- " or after "# " is allowed, as in yamllint."""
+    lines = [WORD, '  - ' + WORD, '# ' + WORD, '  ## ' + WORD, 'two words ' + WORD]
+    assert line_length_problems(lines) == [5]
+    assert line_length_problems(lines, **{'allow-non-breakable-words': False}) == [1, 2, 3, 4, 5]
+    print("✅ Test passed")
+
+
+def test_non_breakable_inline_mappings():
+    """"key: <long word>" is only allowed with allow-non-breakable-inline-mappings."""
+    lines = ['url: ' + WORD, '  - key: ' + WORD, 'key: two ' + WORD, 'key: "' + WORD + '"']
+    assert line_length_problems(lines) == [1, 2, 3, 4]
+    assert line_length_problems(lines, **{'allow-non-breakable-inline-mappings': True}) == [3]
+    print("✅ Test passed")
+
+
+def test_lint_while_loading():
+    """Problems from lines and tokens are collected while the documents load."""
+    content = 'a: 1 \nb:\n   - 1\n'
+    linter = yaml_lint.Linter({'trailing-spaces': {}, 'indentation': {'spaces': 2}})
+    documents = list(yaml_lint.iter_linted_documents(content, linter))
+
+    assert documents == [{'a': 1, 'b': [1]}]
+    assert [(problem.line, problem.rule) for problem in linter.sorted_problems()] == [
+        (1, 'trailing-spaces'), (3, 'indentation')]
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_non_breakable_words()
+    test_non_breakable_inline_mappings()
+    test_lint_while_loading()
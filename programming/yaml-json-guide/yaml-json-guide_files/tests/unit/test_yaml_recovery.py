@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/yaml_recovery.py"""
+
+import random
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / 'tools' / 'validators'))
+
+import yaml_recovery  # noqa: E402
+
+# Top-level sections with one syntax error each, and the error's line within the section
+BROKEN_SECTIONS = [
+    ('server{n}:\n  host: a\n   port: 1\n', 3),
+    ('list{n}:\n  - a\n  b: c\n', 3),
+    ('flow{n}: [a, b\nnext{n}: 1\n', 2),
+    ('alias{n}: *missing{n}\n', 1),
+    ('tab{n}:\n\tkey: 1\n', 2),
+]
+VALID_SECTIONS = ['ok{n}:\n  nested:\n    - 1\n    - {{a: b}}\n', 'plain{n}: value\n', '# comment {n}\n']
+
+
+def first_error(content):
+    """(line, column) of the error the pure-Python SafeLoader stops at, or None."""
+    try:
+        for _ in yaml.load_all(content, Loader=yaml.SafeLoader):
+            pass
+    except yaml.MarkedYAMLError as error:
+        mark = error.problem_mark or error.context_mark
+        return mark.line + 1, mark.column + 1
+    return None
+
+
+def test_repo_files_match_safe_loader():
+    """Valid repository files have no errors; broken ones start with the error SafeLoader reports."""
+    for path in sorted(ROOT.rglob('*.y*ml')):
+        content = path.read_text(encoding='utf-8')
+        expected = first_error(content)
+        problems = yaml_recovery.find_syntax_errors(content)
+        if expected is None:
+            assert problems == [], path
+        elif 'quoted scalar' not in problems[0].message:  # Blamed at the opening quote instead
+            assert (problems[0].line, problems[0].column) == expected, path
+    print("✅ Test passed")
+
+
+def test_every_broken_section_is_reported():
+    """Each independently broken section is reported once, at the line SafeLoader gives for it alone."""
+    rng = random.Random(37)
+    for _ in range(200):
+        content, expected = '', []
+        for n in range(rng.randint(1, 8)):
+            if rng.random() < 0.5:
+                section, error_line = rng.choice(BROKEN_SECTIONS)
+                section = section.format(n=n)
+                assert first_error(section)[0] == error_line
+                expected.append(content.count('\n') + error_line)
+            else:
+                section = rng.choice(VALID_SECTIONS).format(n=n)
+            content += section
+        assert [problem.line for problem in yaml_recovery.find_syntax_errors(content)] == expected, content
+    print("✅ Test passed")
+
+
+def test_max_errors():
+    """max_errors stops the scan early."""
+    content = ''.join(BROKEN_SECTIONS[0][0].format(n=n) for n in range(5))
+    assert len(yaml_recovery.find_syntax_errors(content)) == 5
+    assert len(yaml_recovery.find_syntax_errors(content, max_errors=2)) == 2
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_repo_files_match_safe_loader()
+    test_every_broken_section_is_reported()
+    test_max_errors()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for tools/validators/yaml_type_audit.py"""
+
+import datetime
+import random
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'tools' / 'validators'))
+
+import yaml_type_audit  # noqa: E402
+
+PIECES = ['0', '1', '7', '9', '10', '.', '_', ':', '-', '+', 'e', 'yes', 'No', 'on', 'OFF', 'y', 'true',
+          '2024', '-01', '-05', 'T10:00:00Z', 'x', '.inf', '.NaN', '0x1f', '0b101']
+
+
+def surprising(value):
+    """Whether yaml.safe_load turns a plain scalar into something its text does not spell (None: not a scalar)."""
+    try:
+        loaded = yaml.safe_load(value)
+    except yaml.YAMLError:
+        return None
+    if loaded is None or isinstance(loaded, str):
+        return False
+    if isinstance(loaded, bool):
+        return value.lower() not in ('true', 'false')
+    if isinstance(loaded, datetime.date):
+        return True
+    text = value.lstrip('+').replace('_', '')
+    if isinstance(loaded, int):
+        # Base 60 and leading-zero octal; 0x and 0b spell their base
+        return (':' in value or re.match(r'-?0[0-9]', text) is not None) and loaded != 0
+    if isinstance(loaded, float):
+        return loaded == loaded and abs(loaded) != float('inf') and repr(loaded) != text
+    return None
+
+
+def test_classify_matches_safe_load():
+    """classify flags exactly the scalars yaml.safe_load resolves to a surprising value."""
+    rng = random.Random(38)
+    flagged = 0
+    for _ in range(20000):
+        value = ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 4)))
+        expected = surprising(value)
+        if expected is None:
+            continue
+        assert (yaml_type_audit.classify(value) is not None) == expected, value
+        flagged += expected
+    assert flagged > 1000
+    print("✅ Test passed")
+
+
+def test_findings_point_at_plain_scalars():
+    """Findings cover keys and values, skip quoted scalars and give 1-based positions."""
+    content = 'country: NO\nmode: "0755"\nversions: [1.10, 2.0]\nNo: 2024-01-05\nports:\n  - 22:22\n'
+    findings = yaml_type_audit.audit_content(content)
+    lines = content.split('\n')
+    assert [finding.value for finding in findings] == ['NO', '1.10', 'No', '2024-01-05', '22:22']
+    for finding in findings:
+        assert lines[finding.line - 1][finding.column - 1:].startswith(finding.value)
+    print("✅ Test passed")
+
+
+if __name__ == '__main__':
+    test_classify_matches_safe_load()
+    test_findings_point_at_plain_scalars()
@@ -25,6 +25,10 @@ except ImportError:
     print("Error: PyYAML is not installed. Run: pip install PyYAML", file=sys.stderr)
     sys.exit(1)
 
+# Shared --stats instrumentation lives with the validators
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'validators'))
+import file_stats  # noqa: E402
+
 
 def load_json(file_path: str) -> Any:
     """
@@ -44,9 +48,13 @@ def load_json(file_path: str) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(path, 'r', encoding='utf-8') as f:
+    with file_stats.phase('read'):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+    with file_stats.phase('parse'):
         try:
-            return json.load(f)
+            return json.loads(content)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(
                 f"Invalid JSON syntax in {file_path}: {e.msg}",
@@ -85,6 +93,7 @@ Examples:
   %(prog)s config.json config.yaml
   %(prog)s config.json --stdout > output.yaml
   %(prog)s data.json output.yaml --flow-style
+  %(prog)s large.json large.yaml --stats
         """
     )
     parser.add_argument('input', help='Input JSON file')
@@ -92,7 +101,10 @@ Examples:
     parser.add_argument('--stdout', action='store_true', help='Print to stdout instead of file')
     parser.add_argument('--flow-style', action='store_true', help='Use flow style (inline collections)')
 
+    file_stats.add_arguments(parser)
+
     args = parser.parse_args()
+    stats = file_stats.enable_from_args(args, 'json_to_yaml.py')
 
     # Validate arguments
     if not args.stdout and not args.output:
@@ -101,21 +113,26 @@ Examples:
     try:
         # Load JSON
         print(f"Loading JSON from: {args.input}", file=sys.stderr)
-        data = load_json(args.input)
-
-        # Convert to YAML
-        yaml_str = convert_to_yaml(data, default_flow_style=args.flow_style)
-
-        # Output
-        if args.stdout:
-            print(yaml_str)
-        else:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(yaml_str)
+        with file_stats.track_file(args.input):
+            data = load_json(args.input)
+
+            # Convert to YAML
+            with file_stats.phase('convert'):
+                yaml_str = convert_to_yaml(data, default_flow_style=args.flow_style)
+
+            # Output
+            with file_stats.phase('write'):
+                if args.stdout:
+                    print(yaml_str)
+                else:
+                    output_path = Path(args.output)
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        f.write(yaml_str)
+        if not args.stdout:
             print(f"✓ Converted successfully: {args.output}", file=sys.stderr)
 
+        file_stats.finish(stats, args)
         return 0
 
     except FileNotFoundError as e:
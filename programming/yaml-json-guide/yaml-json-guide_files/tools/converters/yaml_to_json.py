@@ -7,6 +7,7 @@ Converts YAML files to JSON format with proper formatting and error handling.
 Usage:
     python yaml_to_json.py input.yaml [output.json]
     python yaml_to_json.py input.yaml --stdout
+    python yaml_to_json.py input.yaml output.json --core-schema
 
 Examples:
     python yaml_to_json.py config.yaml config.json
@@ -25,13 +26,20 @@ except ImportError:
     print("Error: PyYAML is not installed. Run: pip install PyYAML", file=sys.stderr)
     sys.exit(1)
 
+# Shared --stats instrumentation and loaders live with the validators
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'validators'))
+import file_stats  # noqa: E402
+from yaml_core_schema import CoreSchemaLoader  # noqa: E402
 
-def load_yaml(file_path: str) -> Any:
+
+def load_yaml(file_path: str, core_schema: bool = False) -> Any:
     """
     Load YAML file safely.
 
     Args:
         file_path: Path to YAML file
+        core_schema: Resolve plain scalars with the YAML 1.2 core schema, so
+            dates and yes/no stay strings and the result is JSON-serializable
 
     Returns:
         Parsed YAML data
@@ -44,9 +52,15 @@ def load_yaml(file_path: str) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(path, 'r', encoding='utf-8') as f:
+    with file_stats.phase('read'):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+    with file_stats.phase('parse'):
         try:
-            return yaml.safe_load(f)
+            if core_schema:
+                return yaml.load(content, Loader=CoreSchemaLoader)
+            return yaml.safe_load(content)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML syntax in {file_path}: {e}")
 
@@ -75,6 +89,8 @@ Examples:
   %(prog)s config.yaml config.json
   %(prog)s config.yaml --stdout > output.json
   %(prog)s input.yaml --indent 4
+  %(prog)s dates.yaml dates.json --core-schema
+  %(prog)s large.yaml large.json --stats
         """
     )
     parser.add_argument('input', help='Input YAML file')
@@ -82,8 +98,14 @@ Examples:
     parser.add_argument('--stdout', action='store_true', help='Print to stdout instead of file')
     parser.add_argument('--indent', type=int, default=2, help='Indentation spaces (default: 2)')
     parser.add_argument('--compact', action='store_true', help='Compact output (no indentation)')
+    parser.add_argument('--core-schema', action='store_true',
+                        help='Resolve unquoted values with the YAML 1.2 core schema '
+                             '(dates and yes/no/on/off stay strings)')
+
+    file_stats.add_arguments(parser)
 
     args = parser.parse_args()
+    stats = file_stats.enable_from_args(args, 'yaml_to_json.py')
 
     # Validate arguments
     if not args.stdout and not args.output:
@@ -92,22 +114,27 @@ Examples:
     try:
         # Load YAML
         print(f"Loading YAML from: {args.input}", file=sys.stderr)
-        data = load_yaml(args.input)
-
-        # Convert to JSON
-        indent = None if args.compact else args.indent
-        json_str = convert_to_json(data, indent=indent)
-
-        # Output
-        if args.stdout:
-            print(json_str)
-        else:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+        with file_stats.track_file(args.input):
+            data = load_yaml(args.input, core_schema=args.core_schema)
+
+            # Convert to JSON
+            indent = None if args.compact else args.indent
+            with file_stats.phase('convert'):
+                json_str = convert_to_json(data, indent=indent)
+
+            # Output
+            with file_stats.phase('write'):
+                if args.stdout:
+                    print(json_str)
+                else:
+                    output_path = Path(args.output)
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        f.write(json_str)
+        if not args.stdout:
             print(f"✓ Converted successfully: {args.output}", file=sys.stderr)
 
+        file_stats.finish(stats, args)
         return 0
 
     except FileNotFoundError as e:
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+JSON Schema Inference
+
+Generates a draft-07 JSON Schema from sample documents (YAML, JSON, JSON
+Lines). Documents are streamed one at a time into a per-path statistics
+tree: value types, candidate enum values, numeric ranges, and how often
+each property is present. Memory is bounded by the number of distinct
+paths, not by the corpus; objects with more than --max-properties distinct
+keys (labels, annotations, maps keyed by name) collapse into a single
+additionalProperties entry.
+
+Statistics trees merge exactly, so files can be split over --workers
+processes, or over machines with --shard K/N and --save-stats, and the
+partial results combined with --merge-stats.
+
+Usage:
+    python infer_schema.py samples/*.yaml
+    python infer_schema.py export.json --array-items --output users.schema.json
+    python infer_schema.py data/**/*.jsonl --workers 8 --title Events
+
+Examples:
+    python infer_schema.py ../../examples/kubernetes/*.yaml --title Deployment
+    python infer_schema.py part-*/*.json --shard 1/4 --save-stats part1.stats.json
+    python infer_schema.py --merge-stats part*.stats.json --output schema.json
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:
+    print("Error: PyYAML is not installed. Run: pip install PyYAML", file=sys.stderr)
+    sys.exit(1)
+
+# Streaming readers and sharding live with the validators
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'validators'))
+from json_stream import iter_json_array  # noqa: E402
+from sharding import add_argument as add_shard_argument, assign_shards, select_shard  # noqa: E402
+from yaml_core_schema import safe_loader  # noqa: E402
+
+DRAFT_07 = 'http://json-schema.org/draft-07/schema#'
+
+# Distinct scalar values remembered per path before it stops being an enum candidate
+ENUM_TRACK_LIMIT = 64
+
+# Order of types in emitted "type" lists
+TYPE_ORDER = ['null', 'boolean', 'integer', 'number', 'string', 'array', 'object']
+
+
+def json_type(value: Any) -> str:
+    """JSON Schema type name of a parsed value (dates and other YAML types count as strings)."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number'
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, list):
+        return 'array'
+    return 'string'
+
+
+class PathStats:
+    """Statistics of every value seen at one path (a node of the statistics tree)."""
+
+    __slots__ = ('count', 'types', 'values', 'minimum', 'maximum',
+                 'objects', 'properties', 'additional', 'items')
+
+    def __init__(self):
+        self.count = 0
+        self.types: Dict[str, int] = {}
+        # Distinct string/integer values and their counts; None once there are too many
+        self.values: Optional[Dict[Any, int]] = {}
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.objects = 0  # Object values, to tell which properties are always present
+        self.properties: Dict[str, 'PathStats'] = {}
+        self.additional: Optional['PathStats'] = None  # Collapsed properties of map-like objects
+        self.items: Optional['PathStats'] = None
+
+    def add(self, value: Any, max_properties: int) -> None:
+        """Record one value (recursively for objects and arrays)."""
+        kind = json_type(value)
+        self.count += 1
+        self.types[kind] = self.types.get(kind, 0) + 1
+
+        if kind == 'object':
+            self.objects += 1
+            for key, child_value in value.items():
+                self.child(str(key), max_properties).add(child_value, max_properties)
+        elif kind == 'array':
+            if self.items is None:
+                self.items = PathStats()
+            for element in value:
+                self.items.add(element, max_properties)
+        elif kind in ('integer', 'number'):
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+        if kind in ('integer', 'string') and self.values is not None:
+            key = value if isinstance(value, (int, str)) else str(value)
+            self.values[key] = self.values.get(key, 0) + 1
+            if len(self.values) > ENUM_TRACK_LIMIT:
+                self.values = None
+
+    def child(self, key: str, max_properties: int) -> 'PathStats':
+        """Return the statistics of a property, collapsing map-like objects."""
+        if self.additional is not None:
+            return self.additional
+        node = self.properties.get(key)
+        if node is None:
+            if len(self.properties) >= max_properties:
+                # Too many distinct keys to be a record: treat as a map of values
+                self.collapse(max_properties)
+                return self.additional
+            node = self.properties[key] = PathStats()
+        return node
+
+    def collapse(self, max_properties: int) -> None:
+        """Turn the properties into one statistics node for all values of a map."""
+        self.additional = PathStats()
+        for node in self.properties.values():
+            self.additional.merge(node, max_properties)
+        self.properties = {}
+
+    def merge(self, other: 'PathStats', max_properties: int) -> None:
+        """
+        Add the statistics of another tree (e.g. from another worker) to this one.
+
+        The result is the tree add() would have built from both trees' values,
+        so the schema does not depend on how files were split over workers.
+        Nodes of the other tree are copied, never shared.
+        """
+        self.count += other.count
+        for kind, count in other.types.items():
+            self.types[kind] = self.types.get(kind, 0) + count
+
+        if self.values is None or other.values is None:
+            self.values = None
+        else:
+            for value, count in other.values.items():
+                self.values[value] = self.values.get(value, 0) + count
+            if len(self.values) > ENUM_TRACK_LIMIT:
+                self.values = None
+
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+
+        self.objects += other.objects
+        if other.additional is not None and self.additional is None:
+            self.collapse(max_properties)
+        if self.additional is not None:
+            for node in list(other.properties.values()) + ([other.additional] if other.additional else []):
+                self.additional.merge(node, max_properties)
+        else:
+            for key, node in other.properties.items():
+                if key not in self.properties:
+                    self.properties[key] = PathStats()
+                self.properties[key].merge(node, max_properties)
+            if len(self.properties) > max_properties:
+                self.collapse(max_properties)
+
+        if other.items is not None:
+            if self.items is None:
+                self.items = PathStats()
+            self.items.merge(other.items, max_properties)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form, for --save-stats."""
+        return {
+            'count': self.count,
+            'types': self.types,
+            # Pairs keep 1 and "1" apart
+            'values': None if self.values is None else [[v, c] for v, c in self.values.items()],
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'objects': self.objects,
+            'properties': {key: node.to_dict() for key, node in self.properties.items()},
+            'additional': self.additional.to_dict() if self.additional is not None else None,
+            'items': self.items.to_dict() if self.items is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PathStats':
+        node = cls()
+        node.count = data['count']
+        node.types = dict(data['types'])
+        node.values = None if data['values'] is None else {v: c for v, c in data['values']}
+        node.minimum = data['minimum']
+        node.maximum = data['maximum']
+        node.objects = data['objects']
+        node.properties = {key: cls.from_dict(child) for key, child in data['properties'].items()}
+        node.additional = cls.from_dict(data['additional']) if data['additional'] else None
+        node.items = cls.from_dict(data['items']) if data['items'] else None
+        return node
+
+
+def to_schema(node: PathStats, enum_max: int = 10, ranges: bool = True) -> Dict[str, Any]:
+    """
+    Turn a statistics tree into a draft-07 schema fragment.
+
+    Args:
+        node: Statistics of one path
+        enum_max: Emit "enum" for strings/integers with at most this many
+            distinct values, when each value was seen at least twice on average
+        ranges: Emit the observed minimum/maximum of numbers
+
+    Returns:
+        Schema fragment
+    """
+    schema: Dict[str, Any] = {}
+    types = [kind for kind in TYPE_ORDER if kind in node.types]
+    if 'integer' in types and 'number' in types:
+        types.remove('integer')
+    if types:
+        schema['type'] = types[0] if len(types) == 1 else types
+
+    scalar_types = {'integer', 'string'}
+    if (node.values and set(node.types) <= scalar_types | {'null'}
+            and len(node.values) <= enum_max and node.count >= 2 * len(node.values)):
+        values = sorted(node.values, key=lambda v: (isinstance(v, str), v))
+        schema['enum'] = values + ([None] if 'null' in node.types else [])
+
+    if ranges and node.minimum is not None and 'enum' not in schema:
+        schema['minimum'] = node.minimum
+        schema['maximum'] = node.maximum
+
+    if node.objects:
+        if node.properties:
+            schema['properties'] = {key: to_schema(child, enum_max, ranges)
+                                    for key, child in sorted(node.properties.items())}
+            required = sorted(key for key, child in node.properties.items()
+                              if child.count == node.objects)
+            if required:
+                schema['required'] = required
+        if node.additional is not None:
+            schema['additionalProperties'] = to_schema(node.additional, enum_max, ranges)
+
+    if node.items is not None and node.items.count:
+        schema['items'] = to_schema(node.items, enum_max, ranges)
+
+    return schema
+
+
+def iter_documents(file_path: str, array_items: bool = False,
+                   core_schema: bool = False) -> Iterator[Any]:
+    """
+    Stream the documents of a YAML, JSON or JSON Lines file.
+
+    Args:
+        file_path: Input file (.yaml/.yml, .json, .jsonl/.ndjson)
+        array_items: Treat the elements of a top-level JSON array as the documents
+        core_schema: Load YAML with the YAML 1.2 core schema
+    """
+    suffix = Path(file_path).suffix.lower()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if suffix in ('.yaml', '.yml'):
+            for document in yaml.load_all(f, Loader=safe_loader(core_schema)):
+                if document is not None:
+                    yield document
+        elif suffix in ('.jsonl', '.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif array_items:
+            for _, element in iter_json_array(f):
+                yield element
+        else:
+            yield json.load(f)
+
+
+def infer_files(paths: List[str], array_items: bool = False, core_schema: bool = False,
+                max_properties: int = 200) -> Tuple[PathStats, int, List[str]]:
+    """
+    Collect statistics for a list of files (one worker's share).
+
+    Returns:
+        Tuple of (statistics tree, documents read, error messages)
+    """
+    root = PathStats()
+    documents = 0
+    errors = []
+    for file_path in paths:
+        try:
+            for document in iter_documents(file_path, array_items, core_schema):
+                root.add(document, max_properties)
+                documents += 1
+        except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError) as e:
+            errors.append(f"{file_path}: {e}")
+    return root, documents, errors
+
+
+def infer(paths: List[str], workers: int = 1, **options: Any) -> Tuple[PathStats, int, List[str]]:
+    """
+    Collect statistics for files, splitting them over worker processes.
+
+    Files are divided into size-balanced shards, one per worker, and the
+    workers' trees are merged.
+    """
+    shards = [shard for shard in assign_shards(paths, max(1, workers)) if shard]
+    if len(shards) <= 1:
+        return infer_files(paths, **options)
+
+    root, documents, errors = PathStats(), 0, []
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [pool.submit(infer_files, shard, **options) for shard in shards]
+        for future in futures:
+            partial, count, partial_errors = future.result()
+            root.merge(partial, options.get('max_properties', 200))
+            documents += count
+            errors.extend(partial_errors)
+    return root, documents, errors
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Infer a draft-07 JSON Schema from sample YAML/JSON documents',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s samples/*.yaml --title AppConfig
+  %(prog)s export.json --array-items --output users.schema.json
+  %(prog)s data/*.jsonl --workers 8
+  %(prog)s data/*.jsonl --shard 2/4 --save-stats part2.stats.json
+  %(prog)s --merge-stats part*.stats.json --output schema.json
+        """
+    )
+    parser.add_argument('files', nargs='*', help='YAML, JSON or JSON Lines files')
+    parser.add_argument('--output', help='Output schema file (default: stdout)')
+    parser.add_argument('--title', help='Schema title')
+    parser.add_argument('--array-items', action='store_true',
+                        help='Treat the elements of a top-level JSON array as documents (streamed)')
+    parser.add_argument('--core-schema', action='store_true',
+                        help='Load YAML with the YAML 1.2 core schema (dates and yes/no stay strings)')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Worker processes (default: 1)')
+    parser.add_argument('--enum-max', type=int, default=10, metavar='N',
+                        help='Emit enums of up to N distinct values (default: 10, 0 disables)')
+    parser.add_argument('--max-properties', type=int, default=200, metavar='N',
+                        help='Objects with more distinct keys become maps (default: 200)')
+    parser.add_argument('--no-ranges', action='store_true',
+                        help='Do not emit observed minimum/maximum of numbers')
+    parser.add_argument('--save-stats', metavar='FILE',
+                        help='Also write the merged statistics, for a later --merge-stats')
+    parser.add_argument('--merge-stats', nargs='+', metavar='FILE', default=[],
+                        help='Statistics files from other runs to merge in')
+    add_shard_argument(parser)
+
+    args = parser.parse_args()
+
+    if not args.files and not args.merge_stats:
+        parser.error("Give input files and/or --merge-stats")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    files = select_shard(args.files, args.shard) if args.shard else args.files
+    root, documents, errors = infer(files, workers=args.workers, array_items=args.array_items,
+                                    core_schema=args.core_schema,
+                                    max_properties=args.max_properties)
+
+    for stats_path in args.merge_stats:
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            root.merge(PathStats.from_dict(saved['stats']), args.max_properties)
+            documents += saved['documents']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            errors.append(f"{stats_path}: invalid statistics file: {e}")
+
+    for error in errors:
+        print(f"✗ {error}", file=sys.stderr)
+
+    if args.save_stats:
+        with open(args.save_stats, 'w', encoding='utf-8') as f:
+            json.dump({'documents': documents, 'stats': root.to_dict()}, f)
+
+    schema = {'$schema': DRAFT_07}
+    if args.title:
+        schema['title'] = args.title
+    schema['description'] = f"Inferred from {documents} document(s)"
+    schema.update(to_schema(root, enum_max=args.enum_max, ranges=not args.no_ranges))
+    output = json.dumps(schema, indent=2, ensure_ascii=False)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        print(f"✓ Schema inferred from {documents} document(s): {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Combined File Checker
+
+Runs the syntax, schema, lint and secret checks of validate_yaml.py,
+validate_json.py and check_secrets.py in one pass per file, and reports
+the results of every check together.
+
+Running the three tools separately reads each file three times and parses
+it twice. Here each file is read once, as bytes: the secret scanner works
+on those bytes, they are decoded once, and the text is parsed once (lint
+rules run in the same scanner pass as parsing). Schema validation then
+works on the parsed documents, and error positions are recovered from the
+text already in memory.
+
+Directories are walked like check_secrets.py does (honouring .gitignore
+and --include/--exclude). Every text file is scanned for secrets; .yaml,
+.yml and .json files also get the syntax, schema and lint checks.
+
+Usage:
+    python check_all.py .
+    python check_all.py k8s/ --dispatch schemas/ --lint
+    python check_all.py config.yaml --schema schemas/app-config.schema.json
+
+Examples:
+    python check_all.py examples/kubernetes --dispatch schemas/ --compiled --quiet
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+import file_stats
+import repo_files
+from check_secrets import scan_buffer
+from schema_dispatch import describe
+from sharding import add_argument as add_shard_argument, select_shard
+from validate_json import HAS_JSONSCHEMA, get_dispatcher, validate_against_schema, validate_dispatched
+from validate_yaml import format_syntax_error, lint_summary, linting_loader
+from yaml_core_schema import safe_loader
+from yaml_lint import Linter, load_config
+from yaml_locator import NodeLocator
+
+YAML_SUFFIXES = ('.yaml', '.yml')
+JSON_SUFFIXES = ('.json',)
+
+# Stages in reporting order
+STAGES = ['read', 'syntax', 'schema', 'lint', 'secrets']
+
+
+class StageResult(NamedTuple):
+    """Outcome of one check on one file."""
+
+    stage: str
+    ok: bool
+    message: str
+
+
+def load_nodes(loader: Any) -> Tuple[List[Any], List[Any]]:
+    """
+    Compose and construct every document of a YAML stream in one pass.
+
+    Returns:
+        Tuple of (composed nodes, Python documents), one of each per document
+    """
+    nodes, documents = [], []
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            nodes.append(node)
+            documents.append(loader.construct_document(node))
+    finally:
+        loader.dispose()
+    return nodes, documents
+
+
+class Pipeline:
+    """
+    The checks to run on each file.
+
+    Args:
+        schema: JSON Schema applied to every YAML/JSON document
+        dispatch: Instead, pick each document's schema from this directory
+            by apiVersion and kind
+        compiled: Use the cached compiled validators instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        schema_dir: Directory of local schemas used to resolve $ref
+        max_errors: Per-document schema error limit
+        lint_config: Lint rules for YAML files (None: no linting)
+        core_schema: Resolve plain scalars with the YAML 1.2 core schema
+        secrets: Scan for secrets
+        entropy: Also report high-entropy tokens (see check_secrets.py --entropy)
+    """
+
+    def __init__(self, schema: Optional[str] = None, dispatch: Optional[str] = None,
+                 compiled: bool = False, cache_dir: Optional[str] = None,
+                 schema_dir: Optional[str] = None, max_errors: Optional[int] = None,
+                 lint_config: Optional[Dict[str, Any]] = None, core_schema: bool = False,
+                 secrets: bool = True, entropy: bool = False):
+        self.schema = schema
+        self.dispatch = dispatch
+        self.compiled = compiled
+        self.cache_dir = cache_dir
+        self.schema_dir = schema_dir or dispatch
+        self.max_errors = max_errors
+        self.lint_config = lint_config
+        self.core_schema = core_schema
+        self.secrets = secrets
+        self.entropy = entropy
+
+    def check(self, file_path: str) -> Optional[List[StageResult]]:
+        """
+        Run every check on one file.
+
+        Returns:
+            One result per stage that ran, or None for a binary file
+        """
+        try:
+            with file_stats.phase('read'):
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+        except OSError as e:
+            return [StageResult('read', False, f"Cannot read file: {e}")]
+        if repo_files.looks_binary(data):
+            return None
+
+        results = []
+        documents = None
+        suffix = Path(file_path).suffix.lower()
+        if suffix in YAML_SUFFIXES or suffix in JSON_SUFFIXES:
+            try:
+                content = data.decode('utf-8')
+            except UnicodeDecodeError as e:
+                results.append(StageResult('syntax', False, f"Encoding error: {e}"))
+            else:
+                check = self.check_yaml if suffix in YAML_SUFFIXES else self.check_json
+                stage_results, documents = check(file_path, content)
+                results.extend(stage_results)
+
+        if self.secrets:
+            with file_stats.phase('scan'):
+                # The parsed documents spare the scanner parsing Kubernetes Secrets again
+                findings = scan_buffer(data, self.entropy, documents)
+            if findings:
+                lines = [f"    Line {line_num} [{secret_type}]: {line_content}"
+                         for line_num, secret_type, line_content in findings]
+                results.append(StageResult('secrets', False,
+                                           f"{len(findings)} potential secret(s):\n" + "\n".join(lines)))
+            else:
+                results.append(StageResult('secrets', True, "no secrets"))
+        return results
+
+    def check_yaml(self, file_path: str, content: str) -> Tuple[List[StageResult], Optional[List[Any]]]:
+        """
+        Syntax, lint and schema checks of YAML text (every document of a stream).
+
+        Returns:
+            Tuple of (results, composed documents); the nodes keep their
+            positions for the secret scan. They are [] after a syntax error
+            and None if the text was not parsed
+        """
+        if '\t' in content:
+            lines_with_tabs = [i + 1 for i, line in enumerate(content.split('\n')) if '\t' in line]
+            return [StageResult('syntax', False,
+                                f"Tabs found in lines: {lines_with_tabs} (YAML requires spaces only)")], None
+
+        linter = Linter(self.lint_config) if self.lint_config is not None else None
+        results = []
+        nodes: List[Any] = []
+        try:
+            with file_stats.phase('parse'):
+                if linter is None:
+                    loader = safe_loader(self.core_schema)(content)
+                else:
+                    linter.feed_lines(content)
+                    loader = linting_loader(self.core_schema)(content, linter)
+                nodes, documents = load_nodes(loader)
+        except yaml.YAMLError as e:
+            message = format_syntax_error(e, content, core_schema=self.core_schema)
+            results.append(StageResult('syntax', False, message))
+            documents = None
+        else:
+            results.append(StageResult('syntax', True, f"valid YAML ({len(documents)} document(s))"))
+
+        if documents is not None and (self.schema or self.dispatch):
+            with file_stats.phase('validate'):
+                results.append(self.check_documents(file_path, content, documents))
+
+        if linter is not None:
+            # After a syntax error, the problems found up to it
+            results.append(StageResult('lint', *lint_summary("no problems", linter.sorted_problems())))
+        return results, nodes
+
+    def check_json(self, file_path: str, content: str) -> Tuple[List[StageResult], List[Any]]:
+        """
+        Syntax and schema checks of JSON text.
+
+        Returns:
+            Tuple of (results, parsed documents); the documents are [] after
+            a syntax error
+        """
+        try:
+            with file_stats.phase('parse'):
+                data = json.loads(content)
+        except json.JSONDecodeError as e:
+            return [StageResult('syntax', False,
+                                f"JSON syntax error at line {e.lineno}, column {e.colno}: {e.msg}")], []
+
+        results = [StageResult('syntax', True, "valid JSON")]
+        if self.dispatch:
+            with file_stats.phase('validate'):
+                ok, message = validate_dispatched(
+                    data, self.dispatch, compiled=self.compiled, cache_dir=self.cache_dir,
+                    max_errors=self.max_errors, schema_dir=self.schema_dir,
+                    locate=NodeLocator(file_path, content).locator()
+                )
+            results.append(StageResult('schema', ok, message))
+        elif self.schema:
+            with file_stats.phase('validate'):
+                ok, message = validate_against_schema(
+                    data, self.schema, compiled=self.compiled, cache_dir=self.cache_dir,
+                    max_errors=self.max_errors, schema_dir=self.schema_dir,
+                    locate=NodeLocator(file_path, content).locator()
+                )
+            results.append(StageResult('schema', ok, message))
+        return results, [data]
+
+    def check_documents(self, file_path: str, content: str, documents: List[Any]) -> StageResult:
+        """Validate each document of a YAML stream against its schema."""
+        locator = NodeLocator(file_path, content)  # Composes the text on first use only
+        dispatcher = get_dispatcher(self.dispatch) if self.dispatch else None
+        failures = []
+        checked = 0
+        for index, document in enumerate(documents):
+            if document is None:
+                continue  # Empty document, e.g. a trailing '---'
+            schema_path = self.schema if dispatcher is None else dispatcher.schema_for(document)
+            if schema_path is None:
+                continue
+            checked += 1
+            ok, message = validate_against_schema(
+                document, schema_path, compiled=self.compiled, cache_dir=self.cache_dir,
+                max_errors=self.max_errors, schema_dir=self.schema_dir,
+                locate=locator.locator(index)
+            )
+            if not ok:
+                label = f" ({describe(document)})" if dispatcher is not None else ""
+                failures.append(f"document[{index}]{label}: {message}")
+
+        if failures:
+            return StageResult('schema', False, "\n  ".join(failures))
+        return StageResult('schema', True, f"{checked} document(s) valid against schema")
+
+
+def format_result(result: StageResult) -> str:
+    """Format a stage result as '[stage] message', indenting continuation lines."""
+    return f"[{result.stage}] " + result.message.replace("\n", "\n  ")
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Check YAML/JSON syntax, schemas, lint rules and secrets in one pass per file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s .
+  %(prog)s k8s/ --dispatch schemas/ --compiled
+  %(prog)s config.yaml --schema schemas/app-config.schema.json --lint
+  %(prog)s . --include '*.yaml' --include '*.yml' --include '*.json' --quiet
+  %(prog)s . --no-secrets --lint --lint-config .yamllint.yml
+  %(prog)s . --entropy --shard 1/4
+  %(prog)s . --stats --stats-json check-stats.json
+        """
+    )
+    parser.add_argument('paths', nargs='+', help='Files or directories to check')
+    schema_group = parser.add_mutually_exclusive_group()
+    schema_group.add_argument('--schema', help='JSON Schema file applied to every YAML/JSON document')
+    schema_group.add_argument('--dispatch', metavar='SCHEMA_DIR',
+                              help='Validate each document against the schema in SCHEMA_DIR '
+                                   'declared for its apiVersion and kind')
+    parser.add_argument('--compiled', action='store_true',
+                        help='Validate with a compiled schema module (cached on disk)')
+    parser.add_argument('--schema-cache', help='Directory for compiled schema modules')
+    parser.add_argument('--schema-dir',
+                        help='Resolve $ref against the schemas in this directory (offline)')
+    parser.add_argument('--max-errors', type=int, metavar='N',
+                        help='Report up to N schema errors per document')
+    parser.add_argument('--lint', action='store_true', help='Apply lint rules to YAML files')
+    parser.add_argument('--lint-config', metavar='FILE',
+                        help='yamllint-style config for --lint (default: ./.yamllint*)')
+    parser.add_argument('--core-schema', action='store_true',
+                        help='Resolve unquoted YAML values with the YAML 1.2 core schema')
+    parser.add_argument('--no-secrets', action='store_true', help='Skip the secret scan')
+    parser.add_argument('--entropy', action='store_true',
+                        help='Also report random-looking base64/hex tokens as secrets')
+    parser.add_argument('--quiet', action='store_true', help='Only show files that fail a check')
+    repo_files.add_arguments(parser)
+    add_shard_argument(parser)
+    file_stats.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    if args.no_secrets and args.entropy:
+        parser.error("--entropy cannot be combined with --no-secrets")
+    if (args.schema or args.dispatch) and not args.compiled and not HAS_JSONSCHEMA:
+        print("Error: jsonschema not installed. Run: pip install jsonschema", file=sys.stderr)
+        return 1
+
+    pipeline = Pipeline(
+        schema=args.schema, dispatch=args.dispatch, compiled=args.compiled,
+        cache_dir=args.schema_cache, schema_dir=args.schema_dir, max_errors=args.max_errors,
+        lint_config=load_config(args.lint_config) if args.lint or args.lint_config else None,
+        core_schema=args.core_schema, secrets=not args.no_secrets, entropy=args.entropy
+    )
+    stats = file_stats.enable_from_args(args, 'check_all.py')
+
+    files = repo_files.iter_files_from_args(args, args.paths)
+    if args.shard:
+        files = select_shard(files, args.shard)
+
+    checked = 0
+    passed = 0
+    binary = 0
+    failed_stages: Dict[str, int] = {}
+
+    for file_path in files:
+        with file_stats.track_file(file_path):
+            results = pipeline.check(file_path)
+        if results is None:
+            binary += 1
+            continue
+        checked += 1
+
+        failures = [result for result in results if not result.ok]
+        if failures:
+            print(f"✗ {file_path}:", file=sys.stderr)
+            for result in failures:
+                failed_stages[result.stage] = failed_stages.get(result.stage, 0) + 1
+                print(f"  {format_result(result)}", file=sys.stderr)
+        else:
+            passed += 1
+            if not args.quiet:
+                print(f"✓ {file_path}: {'; '.join(result.message for result in results)}")
+
+    file_stats.finish(stats, args)
+
+    # Summary
+    if binary:
+        print(f"Skipped {binary} binary file(s)", file=sys.stderr)
+    if failed_stages:
+        breakdown = ', '.join(f"{stage}: {failed_stages[stage]}" for stage in STAGES if stage in failed_stages)
+        print(f"\n{passed}/{checked} files passed every check ({breakdown} failed)", file=sys.stderr)
+        return 1
+    print(f"\n{passed}/{checked} files passed every check")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
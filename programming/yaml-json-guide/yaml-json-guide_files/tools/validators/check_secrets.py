@@ -4,20 +4,68 @@ Secret Scanner
 
 Scans YAML and JSON files for potential secrets and sensitive data.
 
+Files are memory-mapped and scanned as bytes in one pass: a keyword
+prefilter (password, token, AKIA, xox, -----BEGIN, ...) runs over the whole
+buffer and only where it hits are the secret patterns, compiled into one
+regex, tried. Line numbers are worked out for findings only, and long
+(minified) lines are shown as an excerpt around each finding.
+
+Directories are scanned recursively, honouring .gitignore and the
+--include/--exclude patterns (see repo_files.py). Binary files, detected
+from their first few KB, and files over --max-size are skipped. With
+--workers N the files are spread over N processes and findings are
+reported as each file completes.
+
+--staged scans what is about to be committed and --history RANGE every
+file version a range of commits introduced, including secrets that were
+committed and later removed. Blobs are read from the local repository
+through one `git cat-file --batch` process (see git_blobs.py), and each
+distinct blob is scanned once however many commits contain it.
+
+--entropy also reports random-looking base64/hex tokens under any key
+name (see entropy.py), except on lines a pattern already matched.
+
+The base64 `data` values of Kubernetes Secret manifests are decoded and
+scanned too, within per-value and per-file budgets (see k8s_secrets.py);
+findings in them are reported at the line of the encoded value.
+
+--baseline FILE suppresses findings recorded as accepted (see
+secret_baseline.py); --update-baseline records the current findings.
+
 Usage:
     python check_secrets.py file.yaml
     python check_secrets.py config.yaml data.json
+    python check_secrets.py . --workers 8
+    python check_secrets.py --staged
+    python check_secrets.py --history main..HEAD
+    python check_secrets.py . --entropy
+    python check_secrets.py . --baseline .secrets-baseline
+    python check_secrets.py **/*.yaml --stats
 
 Examples:
     python check_secrets.py config.yaml
     python check_secrets.py **/*.yaml **/*.json
+    python check_secrets.py . --include '*.yaml' --include '*.json' --exclude 'examples/'
 """
 
 import argparse
+import mmap
+import multiprocessing
+import os
 import re
 import sys
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple
+
+import entropy
+import file_stats
+import git_blobs
+import k8s_secrets
+import repo_files
+import secret_baseline
+from sharding import add_argument as add_shard_argument, select_shard
 
 # Patterns for detecting secrets
 SECRET_PATTERNS = {
@@ -31,6 +79,19 @@ SECRET_PATTERNS = {
     'generic_secret': re.compile(r'-----BEGIN .* PRIVATE KEY-----'),
 }
 
+# Literal text every match of a pattern starts with (compared case-insensitively).
+# Only positions where one of these occurs are tried against the patterns.
+PATTERN_PREFIXES = {
+    'password': ['password'],
+    'api_key': ['api_key', 'api-key', 'apikey'],
+    'secret': ['secret'],
+    'token': ['token'],
+    'private_key': ['private_key', 'private-key', 'privatekey'],
+    'aws_access_key': ['AKIA'],
+    'slack_token': ['xox'],
+    'generic_secret': ['-----BEGIN'],
+}
+
 # Safe values that are placeholders or examples
 SAFE_VALUES = [
     'your-password',
@@ -49,22 +110,277 @@ SAFE_VALUES = [
     '$(',  # Shell substitution
 ]
 
+# Default for --max-size
+DEFAULT_MAX_SIZE_MB = 10
+
+# Why a file is not scanned
+SKIP_BINARY = 'binary'
+SKIP_TOO_LARGE = 'too large'
+SKIP_MISSING = 'missing'  # Blob not in the object database
+
+# Longer lines (minified JSON) are shown as an excerpt around each finding
+MAX_LINE_DISPLAY = 240
+
+SAFE_VALUE_PATTERN = re.compile('|'.join(map(re.escape, SAFE_VALUES)), re.IGNORECASE)
+
+COMMENT_LINE = re.compile(rb'\s*(?:#|//)')
+
+# Inline flag letters for embedding a compiled pattern in a larger regex
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+
+class Finding(NamedTuple):
+    """One potential secret."""
+
+    line_num: int
+    secret_type: str
+    line_content: str
+    value: str  # Matched value, fingerprinted by --baseline
+
+
+class LineIndex:
+    """
+    Line numbers of byte offsets in a buffer, computed only for findings.
+
+    The first lookup counts the newlines of every 4 KB block (one C-level
+    count per block, no per-line Python work); a lookup is then the total
+    before the offset's block plus a count within that block.
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.lines_before: Optional[List[int]] = None
+
+    def line_number(self, offset: int) -> int:
+        """1-based number of the line holding a byte offset."""
+        size = self.BLOCK_SIZE
+        if self.lines_before is None:
+            counts = (self.buffer[start:start + size].count(b'\n')
+                      for start in range(0, len(self.buffer), size))
+            self.lines_before = [0, *accumulate(counts)]
+        block = offset // size
+        return self.lines_before[block] + self.buffer[block * size:offset].count(b'\n') + 1
+
+
+def _line_bounds(buffer, position: int) -> Tuple[int, int]:
+    """Start and end offsets of the line holding a byte offset."""
+    line_end = buffer.find(b'\n', position)
+    return buffer.rfind(b'\n', 0, position) + 1, len(buffer) if line_end < 0 else line_end
+
+
+def _line_findings(buffer, lines: LineIndex, line_start: int, line_end: int,
+                   line_matches: List[Tuple[int, str, int, int, int]]
+                   ) -> Iterator[Finding]:
+    """Turn one line's (order, secret_type, value_start, value_end, match_start) into findings."""
+    if not line_matches:
+        return
+    line_num = lines.line_number(line_start)
+    content = None
+    for _, secret_type, value_start, value_end, match_start in sorted(line_matches, key=lambda m: m[0]):
+        value = buffer[value_start:value_end].decode('utf-8', errors='replace')
+        if line_end - line_start <= MAX_LINE_DISPLAY:
+            if content is None:
+                content = buffer[line_start:line_end].decode('utf-8', errors='replace').strip()
+            yield Finding(line_num, secret_type, content, value)
+        else:
+            start = max(line_start, match_start - MAX_LINE_DISPLAY // 3)
+            end = min(line_end, start + MAX_LINE_DISPLAY)
+            excerpt = buffer[start:end].decode('utf-8', errors='replace').strip()
+            yield Finding(line_num, secret_type,
+                          ('...' if start > line_start else '') + excerpt + ('...' if end < line_end else ''),
+                          value)
+
+
+class SecretMatcher:
+    """
+    All secret patterns compiled into one regex, behind a keyword prefilter.
+
+    Scanning works on bytes, so a memory-mapped file is searched in place.
+    The prefilter is a single alternation of the pattern prefixes, run over
+    lower-cased 1 MB chunks of the buffer; the bytes between hits (nearly
+    all of them) are never looked at again. At each hit the combined regex,
+    one named group per pattern, is tried at that position only, bounded
+    by the end of the line. Patterns must start with distinct prefixes so
+    that at most one of them can match at a given position.
+
+    Results are the same as running re.findall with every pattern on every
+    line: matches of one pattern do not overlap, matches of different
+    patterns may.
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, patterns: Dict[str, Pattern], prefixes: Dict[str, List[str]]):
+        missing = sorted(set(patterns) - set(prefixes))
+        if missing:
+            raise ValueError(f"No prefix declared for pattern(s): {', '.join(missing)}")
+
+        keywords = {k.lower().encode() for name in patterns for k in prefixes[name]}
+        self.prefilter = re.compile(b'|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+        self.overlap = max(map(len, keywords)) - 1  # A keyword may straddle two chunks
+
+        branches = []
+        self.value_groups: Dict[str, int] = {}
+        self.order: Dict[str, int] = {}
+        group = 0
+        for index, (name, pattern) in enumerate(patterns.items()):
+            flags = ''.join(letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag)
+            source = f'(?{flags}:{pattern.pattern})' if flags else pattern.pattern
+            branches.append(f'(?P<{name}>{source})')
+            group += 1
+            # findall reports the first group of a pattern, or the whole match if it has none
+            self.value_groups[name] = group + 1 if pattern.groups else group
+            self.order[name] = index
+            group += pattern.groups
+        self.combined = re.compile('|'.join(branches).encode())
+
+    def iter_hits(self, buffer) -> Iterator[int]:
+        """Yield the offsets where a keyword starts, in order (overlapping ones included)."""
+        for start in range(0, len(buffer), self.CHUNK_SIZE):
+            chunk = buffer[start:start + self.CHUNK_SIZE + self.overlap].lower()
+            hit = self.prefilter.search(chunk)
+            while hit is not None and hit.start() < self.CHUNK_SIZE:
+                yield start + hit.start()
+                # Prefixes can overlap ("secretoken"), so resume one byte on
+                hit = self.prefilter.search(chunk, hit.start() + 1)
+
+    def scan(self, buffer, lines: Optional[LineIndex] = None) -> List[Finding]:
+        """
+        Find pattern matches in a buffer.
+
+        Args:
+            buffer: bytes, or any buffer such as an mmap
+            lines: Line index of the buffer, if one was already built
+
+        Returns:
+            List of findings, by line and then in pattern order (safe
+            placeholder values included); comment lines are skipped
+        """
+        findings: List[Finding] = []
+        lines = lines or LineIndex(buffer)
+        line_start = line_end = -1
+        line_matches: List[Tuple[int, str, int, int, int]] = []
+        ends: Dict[str, int] = {}  # End of the last match of each pattern on the line
+        comment = False
+
+        for position in self.iter_hits(buffer):
+            if position > line_end:
+                findings.extend(_line_findings(buffer, lines, line_start, line_end, line_matches))
+                line_start, line_end = _line_bounds(buffer, position)
+                line_matches, ends = [], {}
+                comment = COMMENT_LINE.match(buffer, line_start, line_end) is not None
+            if comment:
+                continue
+
+            match = self.combined.match(buffer, position, line_end)
+            if match is not None and match.start() >= ends.get(match.lastgroup, line_start):
+                ends[match.lastgroup] = match.end()
+                group = self.value_groups[match.lastgroup]
+                line_matches.append((self.order[match.lastgroup], match.lastgroup,
+                                     match.start(group), match.end(group), match.start()))
+
+        findings.extend(_line_findings(buffer, lines, line_start, line_end, line_matches))
+        return findings
+
+
+MATCHER = SecretMatcher(SECRET_PATTERNS, PATTERN_PREFIXES)
+
 
 def is_safe_value(value: str) -> bool:
     """Check if a value is a safe placeholder."""
-    value_lower = value.lower()
-    return any(safe in value_lower for safe in SAFE_VALUES)
+    return SAFE_VALUE_PATTERN.search(value) is not None
+
+
+def entropy_findings(buffer, lines: LineIndex) -> List[Finding]:
+    """
+    Find high-entropy tokens in a buffer (see entropy.py).
+
+    Returns:
+        List of findings of type 'high_entropy_base64' or 'high_entropy_hex',
+        whose value is the token; comment lines are skipped
+    """
+    findings: List[Finding] = []
+    line_start = line_end = -1
+    line_matches: List[Tuple[int, str, int, int, int]] = []
+    comment = False
+    for start, end, kind, _ in entropy.iter_high_entropy(buffer):
+        if start > line_end:
+            findings.extend(_line_findings(buffer, lines, line_start, line_end, line_matches))
+            line_start, line_end = _line_bounds(buffer, start)
+            line_matches = []
+            comment = COMMENT_LINE.match(buffer, line_start, line_end) is not None
+        if not comment:
+            line_matches.append((0, f'high_entropy_{kind}', start, end, start))
+    findings.extend(_line_findings(buffer, lines, line_start, line_end, line_matches))
+    return findings
+
+
+def decoded_findings(buffer, documents: Optional[List[Any]] = None) -> List[Finding]:
+    """
+    Find secrets in the decoded data values of Kubernetes Secrets (see k8s_secrets.py).
+
+    Each value is scanned as "key: <decoded value>", so the key name gives
+    the patterns their context; findings are placed on the value's line.
+    The buffer is only parsed when its documents are not given.
+    """
+    findings: List[Finding] = []
+    for secret in k8s_secrets.iter_secret_values(buffer, documents=documents):
+        label = f"(decoded data.{secret.key})"
+        for finding in MATCHER.scan(secret.key.encode('utf-8') + b': ' + secret.decoded):
+            findings.append(finding._replace(line_num=secret.line_num,
+                                             line_content=f"{label} {finding.line_content}"))
+    return findings
 
 
-def scan_file(file_path: str) -> List[Tuple[int, str, str]]:
+def scan_buffer(buffer, entropy: bool = False, documents: Optional[List[Any]] = None,
+                with_values: bool = False) -> List[Tuple]:
+    """
+    Scan file contents for potential secrets.
+
+    Args:
+        buffer: bytes, or any buffer such as an mmap
+        entropy: Also report high-entropy tokens, on lines no pattern matched
+        documents: The parsed YAML/JSON documents of the buffer, if the caller
+            already has them (used to decode Kubernetes Secrets without
+            parsing the buffer again)
+        with_values: Return Finding tuples, which add the matched value
+
+    Returns:
+        List of (line_num, secret_type, line_content) tuples, in line order
+    """
+    lines = LineIndex(buffer)
+    found = MATCHER.scan(buffer, lines)
+    # Decoded values are only reported when their line has no finding of that type already
+    flagged = {finding[:2] for finding in found}
+    extra = [finding for finding in decoded_findings(buffer, documents) if finding[:2] not in flagged]
+    if entropy:
+        flagged_lines = {finding.line_num for finding in found}
+        extra += [finding for finding in entropy_findings(buffer, lines) if finding.line_num not in flagged_lines]
+    if extra:
+        found = sorted(found + extra, key=lambda finding: finding.line_num)
+    return [finding if with_values else finding[:3] for finding in found if not is_safe_value(finding.value)]
+
+
+def scan_text(content: str, entropy: bool = False, with_values: bool = False) -> List[Tuple]:
+    """Scan text for potential secrets (see scan_buffer)."""
+    return scan_buffer(content.encode('utf-8'), entropy, with_values=with_values)
+
+
+def scan_file(file_path: str, entropy: bool = False, with_values: bool = False) -> List[Tuple]:
     """
     Scan a file for potential secrets.
 
+    The file is memory-mapped and scanned in place, without decoding it.
+
     Args:
         file_path: Path to file
+        entropy: Also report high-entropy tokens
+        with_values: Return Finding tuples, which add the matched value
 
     Returns:
-        List of (line_number, secret_type, line_content) tuples
+        List of (line_num, secret_type, line_content) tuples
     """
     path = Path(file_path)
 
@@ -74,31 +390,139 @@ def scan_file(file_path: str) -> List[Tuple[int, str, str]]:
     findings = []
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, start=1):
-                # Skip comments
-                if line.strip().startswith('#') or line.strip().startswith('//'):
-                    continue
-
-                # Check each pattern
-                for secret_type, pattern in SECRET_PATTERNS.items():
-                    matches = pattern.findall(line)
-                    for match in matches:
-                        # Extract value from match
-                        value = match if isinstance(match, str) else match[0]
+        with open(path, 'rb') as f:
+            with file_stats.phase('read'):
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-                        # Skip if it's a safe placeholder
-                        if not is_safe_value(value):
-                            findings.append((line_num, secret_type, line.strip()))
+            with buffer, file_stats.phase('scan'):
+                findings = scan_buffer(buffer, entropy, with_values=with_values)
 
-    except UnicodeDecodeError:
-        pass  # Skip binary files
     except Exception:
         pass  # Skip files we can't read
 
     return findings
 
 
+def skip_reason(file_path: str, max_size: Optional[int] = None) -> Optional[str]:
+    """
+    Decide whether a file is worth scanning, from its size and first few KB.
+
+    Args:
+        file_path: Path to file
+        max_size: Size limit in bytes (None: no limit)
+
+    Returns:
+        Why the file is skipped (SKIP_BINARY, SKIP_TOO_LARGE), or None
+    """
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        return None  # scan_file handles missing and unreadable files
+    if max_size is not None and size > max_size:
+        return SKIP_TOO_LARGE
+    if repo_files.is_binary(file_path):
+        return SKIP_BINARY
+    return None
+
+
+def check_file(file_path: str, max_size: Optional[int] = None, entropy: bool = False,
+               with_values: bool = False) -> Tuple[str, List[Tuple], Optional[str]]:
+    """Scan one file unless it is skipped; returns (file_path, findings, skip_reason)."""
+    reason = skip_reason(file_path, max_size)
+    return file_path, [] if reason else scan_file(file_path, entropy, with_values), reason
+
+
+_worker_stats: Optional[file_stats.StatsRecorder] = None
+
+
+def _init_worker(record_stats: bool) -> None:
+    global _worker_stats
+    if record_stats:
+        _worker_stats = file_stats.enable('check_secrets.py')
+
+
+def _check_file_in_worker(file_path: str, max_size: Optional[int], entropy: bool, with_values: bool):
+    with file_stats.track_file(file_path):
+        result = check_file(file_path, max_size, entropy, with_values)
+    # Hand the --stats record back to the parent with the findings
+    record = _worker_stats.records.pop() if _worker_stats is not None else None
+    return result, record
+
+
+def iter_checked_files(files: Iterable[str], workers: int = 1, max_size: Optional[int] = None,
+                       stats: Optional[file_stats.StatsRecorder] = None, entropy: bool = False,
+                       with_values: bool = False) -> Iterator[Tuple[str, List[Tuple], Optional[str]]]:
+    """
+    Scan files, yielding check_file() results as soon as each file is done.
+
+    Args:
+        files: File paths (consumed lazily, so a directory walk overlaps scanning)
+        workers: Number of processes; with more than one, results arrive in completion order
+        max_size: Skip files larger than this many bytes
+        stats: Recorder that receives the workers' --stats records
+        entropy: Also report high-entropy tokens
+        with_values: Report Finding tuples, which add the matched value
+    """
+    if workers <= 1:
+        for file_path in files:
+            with file_stats.track_file(file_path):
+                result = check_file(file_path, max_size, entropy, with_values)
+            yield result
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(stats is not None,)) as pool:
+        scan = partial(_check_file_in_worker, max_size=max_size, entropy=entropy, with_values=with_values)
+        for result, record in pool.imap_unordered(scan, files, chunksize=4):
+            if record is not None:
+                stats.records.append(record)
+            yield result
+
+
+def iter_checked_blobs(refs: Iterable[git_blobs.BlobRef], repo: str = '.',
+                       max_size: Optional[int] = None, entropy: bool = False,
+                       with_values: bool = False) -> Iterator[Tuple[str, List[Tuple], Optional[str]]]:
+    """
+    Scan file versions from a git repository, each distinct blob once.
+
+    Args:
+        refs: Blobs to scan, e.g. from git_blobs.iter_history (consumed lazily)
+        repo: Repository directory
+        max_size: Skip blobs larger than this many bytes
+        entropy: Also report high-entropy tokens
+        with_values: Report Finding tuples, which add the matched value
+
+    Yields:
+        (label, findings, skip_reason) per distinct blob, labelled with the
+        first commit and path it was seen at ("1a2b3c4d5e:config.yaml")
+    """
+    first_seen: Dict[str, git_blobs.BlobRef] = {}
+
+    def distinct_blobs() -> Iterator[str]:
+        for ref in refs:
+            if ref.blob not in first_seen:
+                first_seen[ref.blob] = ref
+                yield ref.blob
+
+    with git_blobs.BlobReader(repo) as reader:
+        for blob, data in reader.iter_blobs(distinct_blobs()):
+            label = first_seen[blob].label
+            if data is None:
+                yield label, [], SKIP_MISSING
+            elif max_size is not None and len(data) > max_size:
+                yield label, [], SKIP_TOO_LARGE
+            elif repo_files.looks_binary(data):
+                yield label, [], SKIP_BINARY
+            else:
+                with file_stats.track_file(label) as record:
+                    if record is not None:
+                        record.size = len(data)
+                    with file_stats.phase('scan'):
+                        findings = scan_buffer(data, entropy, with_values=with_values)
+                yield label, findings, None
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -108,44 +532,150 @@ def main() -> int:
 Examples:
   %(prog)s config.yaml
   %(prog)s file1.yaml file2.json
+  %(prog)s . --workers 8
+  %(prog)s . --include '*.yaml' --include '*.yml' --exclude 'vendor/' --max-size 2
+  %(prog)s --staged
+  %(prog)s --history origin/main..HEAD
+  %(prog)s --history=--all --include '*.yaml' --include '*.json'
+  %(prog)s . --entropy
+  %(prog)s . --baseline .secrets-baseline --update-baseline
+  %(prog)s . --baseline .secrets-baseline
   %(prog)s **/*.yaml **/*.json --strict
+  %(prog)s **/*.yaml **/*.json --shard 1/4
+  %(prog)s **/*.yaml --stats --stats-json secrets-stats.json
 
 Detected patterns:
   - password, api_key, secret, token
   - private_key, aws_access_key, slack_token
   - PEM-encoded private keys
+  - with --entropy: random-looking base64/hex tokens under any key
         """
     )
-    parser.add_argument('files', nargs='+', help='Files to scan')
+    parser.add_argument('paths', nargs='*',
+                        help='Files or directories to scan (with --staged/--history: paths to limit to)')
     parser.add_argument('--strict', action='store_true', help='Include placeholder values')
+    git_mode = parser.add_mutually_exclusive_group()
+    git_mode.add_argument('--staged', action='store_true',
+                          help='Scan the files added or modified in the git index instead')
+    git_mode.add_argument('--history', nargs='?', const='HEAD', metavar='RANGE',
+                          help='Scan every file version introduced by a commit range instead '
+                               '(git log syntax, e.g. main..HEAD; default: all of HEAD; '
+                               '--history=--all for every ref)')
+    parser.add_argument('--repo', default='.', help='Repository for --staged/--history (default: .)')
+    parser.add_argument('--entropy', action='store_true',
+                        help='Also report random-looking base64/hex tokens, whatever their key name')
+    parser.add_argument('--baseline', metavar='FILE',
+                        help='Do not report findings recorded in this baseline file')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write the current findings to the --baseline file instead of reporting them')
+    repo_files.add_arguments(parser)
+    parser.add_argument('--max-size', type=float, default=DEFAULT_MAX_SIZE_MB, metavar='MB',
+                        help=f'Skip files larger than this (default: {DEFAULT_MAX_SIZE_MB}, 0 = no limit)')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Scan files in N processes, reporting findings as files complete (default: 1)')
+    add_shard_argument(parser)
+    file_stats.add_arguments(parser)
 
     args = parser.parse_args()
+    scan_git = args.staged or args.history is not None
+    if not scan_git and not args.paths:
+        parser.error("the following arguments are required: paths (or --staged/--history)")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if scan_git and (args.workers > 1 or args.shard):
+        parser.error("--workers and --shard apply to files, not to --staged/--history")
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline")
+    baseline = None
+    if args.baseline and not args.update_baseline:
+        try:
+            baseline = secret_baseline.load(args.baseline)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: cannot read baseline: {e}", file=sys.stderr)
+            return 1
+    stats = file_stats.enable_from_args(args, 'check_secrets.py')
+    max_size = int(args.max_size * 1024 * 1024) if args.max_size > 0 else None
+
+    if scan_git:
+        refs = (git_blobs.iter_staged(args.repo, args.paths) if args.staged
+                else git_blobs.iter_history(args.repo, [args.history], args.paths))
+        accept = repo_files.path_filter(args.include, args.exclude)
+        results = iter_checked_blobs((ref for ref in refs if accept(ref.path)), args.repo, max_size,
+                                     args.entropy, with_values=True)
+    else:
+        files = repo_files.iter_files_from_args(args, args.paths)
+        if args.shard:
+            files = select_shard(files, args.shard)
+        results = iter_checked_files(files, args.workers, max_size, stats, args.entropy, with_values=True)
 
     has_findings = False
     total_findings = 0
+    scanned = 0
+    suppressed = 0
+    fingerprints: List[str] = []
+    skipped: Dict[str, int] = {}
 
-    for file_path in args.files:
-        findings = scan_file(file_path)
+    try:
+        for file_path, findings, reason in results:
+            if reason:
+                skipped[reason] = skipped.get(reason, 0) + 1
+                if reason != SKIP_BINARY:
+                    print(f"Skipped {file_path}: {reason}", file=sys.stderr)
+                continue
+            scanned += 1
+
+            if findings and (baseline is not None or args.update_baseline):
+                # Blob labels are "commit:path"; fingerprints use the path alone
+                path = file_path.split(':', 1)[1] if scan_git else file_path
+                keyed = [(secret_baseline.fingerprint(path, finding.secret_type, finding.value), finding)
+                         for finding in findings]
+                if args.update_baseline:
+                    fingerprints.extend(key for key, _ in keyed)
+                    continue
+                findings = [finding for key, finding in keyed if key not in baseline]
+                suppressed += len(keyed) - len(findings)
 
-        if findings:
-            has_findings = True
-            total_findings += len(findings)
+            if findings:
+                has_findings = True
+                total_findings += len(findings)
 
-            print(f"\n⚠️  {file_path}:", file=sys.stderr)
-            for line_num, secret_type, line_content in findings:
-                print(f"  Line {line_num} [{secret_type}]: {line_content}", file=sys.stderr)
+                print(f"\n⚠️  {file_path}:", file=sys.stderr)
+                for line_num, secret_type, line_content, _ in findings:
+                    print(f"  Line {line_num} [{secret_type}]: {line_content}", file=sys.stderr)
+    except git_blobs.GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    file_stats.finish(stats, args)
+
+    if args.update_baseline:
+        try:
+            count = secret_baseline.write(args.baseline, fingerprints)
+        except OSError as e:
+            print(f"Error: cannot write baseline: {e}", file=sys.stderr)
+            return 1
+        print(f"✓ Baseline {args.baseline}: {count} finding(s) from {scanned} file(s)")
+        return 0
 
     # Summary
+    if skipped:
+        print(f"Skipped {', '.join(f'{count} {kind}' for kind, count in sorted(skipped.items()))} "
+              f"file(s)", file=sys.stderr)
+    if suppressed:
+        print(f"Suppressed {suppressed} finding(s) listed in {args.baseline}", file=sys.stderr)
     if has_findings:
-        print(f"\n❌ Found {total_findings} potential secret(s) in {len(args.files)} file(s)", file=sys.stderr)
+        print(f"\n❌ Found {total_findings} potential secret(s) in {scanned} file(s)", file=sys.stderr)
         print("\nRecommendations:", file=sys.stderr)
         print("  1. Move secrets to environment variables", file=sys.stderr)
         print("  2. Use secret management tools (Vault, AWS Secrets Manager)", file=sys.stderr)
         print("  3. Add .env files to .gitignore", file=sys.stderr)
         print("  4. Use encrypted secrets (SOPS, Sealed Secrets)", file=sys.stderr)
+        if scan_git:
+            print("  5. Rotate secrets found in history; removing them in a later commit "
+                  "does not revoke them", file=sys.stderr)
         return 1
     else:
-        print(f"✓ No secrets detected in {len(args.files)} file(s)")
+        print(f"✓ No secrets detected in {scanned} file(s)")
         return 0
 
 
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Columnar Record Validation
+
+Large arrays of same-shaped records (exports, user lists) are normally
+validated record by record, running the generic keyword code for every
+field of every row. When an array's "items" schema describes flat records,
+this module instead extracts each property into a column and checks the
+column's type, enum/const, range, length and required constraints in a
+few whole-column operations (set(map(type, ...)), min/max, set inclusion;
+NumPy masks when installed). Only rows that a column check flags are then
+validated record by record, so error messages are exactly those of the
+normal validator.
+
+Properties whose sub-schema uses other keywords (nested objects, patterns,
+$ref...) are checked value by value for that property only. Item schemas
+with object-level keywords beyond properties, required and a boolean
+additionalProperties are validated the normal way.
+
+Used by validate_json.py --columnar.
+
+Usage:
+    python columnar.py export.json schema.json
+
+Examples:
+    python columnar.py users.json users.schema.json
+"""
+
+import argparse
+import json
+import operator
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MISSING = object()
+
+# Shorter arrays are not worth extracting into columns
+MIN_ROWS = 64
+
+# Keywords that never affect validation
+ANNOTATIONS = {
+    'title', 'description', 'default', 'examples', 'format', '$comment',
+    'readOnly', 'writeOnly', 'deprecated',
+}
+
+# Keywords a column can be checked for as a whole
+COLUMN_KEYWORDS = {
+    'type', 'enum', 'const', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+    'minLength', 'maxLength',
+}
+
+RECORD_KEYWORDS = {'type', 'properties', 'required', 'additionalProperties'}
+
+# Python types that certainly satisfy a JSON type (others go through the validator's type checker)
+PYTHON_TYPES = {
+    'string': (str,),
+    'integer': (int,),
+    'number': (int, float),
+    'boolean': (bool,),
+    'null': (type(None),),
+    'object': (dict,),
+    'array': (list,),
+}
+
+NUMBER_TYPES = {int, float}
+
+# float64 represents every integer up to this exactly
+EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+class ColumnPlan:
+    """
+    How to check one property.
+
+    Scalar rules are checked on the whole column; a nested record schema is
+    checked column by column in turn, and an array of scalars by flattening
+    all its elements into one column. Anything else is opaque and checked
+    value by value.
+    """
+
+    __slots__ = ('name', 'schema', 'opaque', 'types', 'exact_types', 'choices',
+                 'record', 'elements')
+
+    def __init__(self, name: str, schema: Any):
+        self.name = name
+        self.schema = schema
+        self.types: Optional[List[str]] = None
+        self.exact_types: Set[type] = set()
+        self.choices: Optional[frozenset] = None
+        self.record: Optional['RecordPlan'] = None
+        self.elements: Optional['ColumnPlan'] = None
+        self.opaque = False
+
+        if not _is_columnar(schema):
+            self.record = record_plan(schema)
+            if self.record is None and _is_scalar_array(schema):
+                self.elements = ColumnPlan('', schema.get('items', True))
+            self.opaque = self.record is None and self.elements is None
+            return
+        if not isinstance(schema, dict):
+            return  # true (a property that is only required): anything is valid
+
+        if 'type' in schema:
+            self.types = [schema['type']] if isinstance(schema['type'], str) else list(schema['type'])
+            for name in self.types:
+                self.exact_types.update(PYTHON_TYPES.get(name, ()))
+            self.exact_types.add(object)  # MISSING
+
+        # A value must satisfy both enum and const when both are given
+        allowed = [schema['enum']] if 'enum' in schema else []
+        if 'const' in schema:
+            allowed.append([schema['const']])
+        if allowed:
+            # Python set membership equals JSON equality only for these (True == 1 in Python)
+            if not all(type(choice) in (str, int, float, type(None))
+                       for choices in allowed for choice in choices):
+                self.opaque = True
+                return
+            self.choices = frozenset.intersection(*map(frozenset, allowed))
+
+
+def _is_columnar(schema: Any) -> bool:
+    if schema is True or schema == {}:
+        return True
+    if not isinstance(schema, dict):
+        return False
+    for keyword, value in schema.items():
+        if keyword in ANNOTATIONS:
+            continue
+        if keyword not in COLUMN_KEYWORDS:
+            return False
+        if keyword.startswith('exclusive') and isinstance(value, bool):
+            return False  # Draft 4 modifier form
+    return True
+
+
+def _is_scalar_array(schema: Any) -> bool:
+    return (isinstance(schema, dict) and schema.get('type') == 'array'
+            and set(schema) - ANNOTATIONS <= {'type', 'items', 'minItems', 'maxItems'}
+            and _is_columnar(schema.get('items', True)))
+
+
+class RecordPlan:
+    """Column plans for an items schema describing flat records."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.columns = [ColumnPlan(name, sub) for name, sub in schema.get('properties', {}).items()]
+        self.required = set(schema.get('required', []))
+        # Only declared properties are allowed under additionalProperties: false
+        self.names = set(schema.get('properties', {}))
+        self.closed = schema.get('additionalProperties') is False
+        # Required names without a property schema are columns only for the required check
+        self.columns.extend(ColumnPlan(name, True) for name in sorted(self.required - self.names))
+
+
+_plans: Dict[int, Tuple[Any, Optional[RecordPlan]]] = {}
+
+
+def record_plan(schema: Any) -> Optional[RecordPlan]:
+    """
+    Return the column plan for an items schema, or None if it is not a flat record schema.
+
+    Plans are cached per schema object.
+    """
+    cached = _plans.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    plan = None
+    if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+        keywords = set(schema) - ANNOTATIONS
+        if (keywords <= RECORD_KEYWORDS
+                and schema.get('type', 'object') == 'object'
+                and isinstance(schema.get('additionalProperties', True), bool)):
+            plan = RecordPlan(schema)
+    _plans[id(schema)] = (schema, plan)  # Keeps the schema alive while its id is a key
+    return plan
+
+
+def _indexes(values: List[Any], predicate: Any) -> List[int]:
+    return [index for index, value in enumerate(values) if predicate(value)]
+
+
+def _bad_numbers(values: List[Any], kinds: Set[type], schema: Dict[str, Any]) -> List[int]:
+    """Indexes of numbers outside the minimum/maximum bounds."""
+    only_numbers = kinds <= NUMBER_TYPES
+    numbers = values if only_numbers else [value for value in values if type(value) in NUMBER_TYPES]
+    if not numbers:
+        return []
+
+    # One min() and one max() decide whether any row is out of range
+    low, high = min(numbers), max(numbers)
+    violated = []
+    if 'minimum' in schema and low < schema['minimum']:
+        violated.append((operator.lt, schema['minimum']))
+    if 'exclusiveMinimum' in schema and low <= schema['exclusiveMinimum']:
+        violated.append((operator.le, schema['exclusiveMinimum']))
+    if 'maximum' in schema and high > schema['maximum']:
+        violated.append((operator.gt, schema['maximum']))
+    if 'exclusiveMaximum' in schema and high >= schema['exclusiveMaximum']:
+        violated.append((operator.ge, schema['exclusiveMaximum']))
+    if not violated:
+        return []
+
+    if (HAS_NUMPY and only_numbers
+            and max(abs(low), abs(high)) < EXACT_FLOAT_LIMIT
+            and all(abs(bound) < EXACT_FLOAT_LIMIT for _, bound in violated)):
+        array = numpy.asarray(values, dtype=numpy.float64)
+        mask = numpy.zeros(len(values), dtype=bool)
+        for compare, bound in violated:
+            mask |= compare(array, bound)
+        return numpy.flatnonzero(mask).tolist()
+
+    return _indexes(values, lambda value: type(value) in NUMBER_TYPES
+                    and any(compare(value, bound) for compare, bound in violated))
+
+
+def _bad_lengths(values: List[Any], kinds: Set[type], schema: Dict[str, Any]) -> List[int]:
+    """Indexes of strings outside minLength/maxLength."""
+    low, high = schema.get('minLength'), schema.get('maxLength')
+    only_strings = kinds == {str}
+    strings = values if only_strings else [value for value in values if type(value) is str]
+    if not strings:
+        return []
+    lengths = list(map(len, strings))
+    if (low is None or min(lengths) >= low) and (high is None or max(lengths) <= high):
+        return []
+
+    if HAS_NUMPY and only_strings:
+        array = numpy.fromiter(lengths, dtype=numpy.int64, count=len(lengths))
+        mask = numpy.zeros(len(lengths), dtype=bool)
+        if low is not None:
+            mask |= array < low
+        if high is not None:
+            mask |= array > high
+        return numpy.flatnonzero(mask).tolist()
+
+    return _indexes(values, lambda value: type(value) is str and (
+        (low is not None and len(value) < low) or (high is not None and len(value) > high)))
+
+
+def column_failures(values: List[Any], column: ColumnPlan, validator: Any) -> Iterable[int]:
+    """
+    Indexes of rows whose value breaks a column's constraints.
+
+    Args:
+        values: The column, with MISSING for rows lacking the property
+        column: Plan of the property
+        validator: jsonschema validator (type checker and fallback)
+    """
+    if column.opaque:
+        return _indexes(values, lambda value: value is not MISSING
+                        and next(validator.descend(value, column.schema), None) is not None)
+    if column.record is not None:
+        return _nested_record_failures(values, column.record, validator)
+    if column.elements is not None:
+        return _array_failures(values, column, validator)
+
+    schema = column.schema
+    if schema is True or not schema:
+        return []
+
+    kinds = set(map(type, values))
+    failures: Set[int] = set()
+
+    if column.types is not None and not kinds <= column.exact_types:
+        # e.g. 1.0 for "integer": ask the validator's type checker
+        unusual = kinds - column.exact_types
+        failures.update(_indexes(values, lambda value: type(value) in unusual and not any(
+            validator.is_type(value, name) for name in column.types)))
+
+    if column.choices is not None:
+        # Choices hold no booleans, so a boolean row always fails (Python has True == 1)
+        choices = column.choices
+        if kinds & {bool, dict, list} or not (set(values) - {MISSING}) <= choices:
+            failures.update(_indexes(values, lambda value: value is not MISSING and (
+                type(value) in (bool, dict, list) or value not in choices)))
+
+    if kinds & NUMBER_TYPES and any(key in schema for key in
+                                    ('minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum')):
+        failures.update(_bad_numbers(values, kinds, schema))
+
+    if str in kinds and ('minLength' in schema or 'maxLength' in schema):
+        failures.update(_bad_lengths(values, kinds, schema))
+
+    return failures
+
+
+def _nested_record_failures(values: List[Any], plan: 'RecordPlan', validator: Any) -> Iterable[int]:
+    """Check a column of nested objects by their own columns."""
+    positions = _indexes(values, lambda value: type(value) is dict)
+    # Anything else present (null, a string...) is left to the per-record check
+    failures = set(_indexes(values, lambda value: value is not MISSING and type(value) is not dict))
+    nested = failing_rows([values[index] for index in positions], plan, validator)
+    failures.update(positions[index] for index in nested)
+    return failures
+
+
+def _array_failures(values: List[Any], column: ColumnPlan, validator: Any) -> Iterable[int]:
+    """Check a column of scalar arrays as one flattened column of elements."""
+    schema = column.schema
+    positions = _indexes(values, lambda value: type(value) is list)
+    failures = set(_indexes(values, lambda value: value is not MISSING and type(value) is not list))
+
+    low, high = schema.get('minItems'), schema.get('maxItems')
+    if low is not None or high is not None:
+        failures.update(index for index in positions
+                        if (low is not None and len(values[index]) < low)
+                        or (high is not None and len(values[index]) > high))
+
+    elements = [element for index in positions for element in values[index]]
+    owners = [index for index in positions for _ in values[index]]
+    failures.update(owners[index] for index in column_failures(elements, column.elements, validator))
+    return failures
+
+
+def failing_rows(rows: List[Any], plan: RecordPlan, validator: Any) -> Set[int]:
+    """
+    Return the indexes of rows that may be invalid; every other row is valid.
+
+    Args:
+        rows: Array elements
+        plan: Plan of the array's items schema
+        validator: jsonschema validator used for type checks and opaque columns
+    """
+    flagged: Set[int] = set()
+    if set(map(type, rows)) != {dict}:
+        flagged.update(_indexes(rows, lambda row: type(row) is not dict))
+        records = [row if type(row) is dict else {} for row in rows]
+    else:
+        records = rows
+
+    for column in plan.columns:
+        values = list(map(operator.methodcaller('get', column.name, MISSING), records))
+        if column.name in plan.required and MISSING in values:
+            flagged.update(_indexes(values, lambda value: value is MISSING))
+        flagged.update(column_failures(values, column, validator))
+
+    if plan.closed:
+        names = plan.names
+        flagged.update(_indexes(records, lambda row: not names.issuperset(row)))
+
+    return flagged
+
+
+def extend_validator(validator_class: Any) -> Any:
+    """
+    Return a validator class whose "items" keyword checks record arrays by column.
+
+    Args:
+        validator_class: jsonschema validator class (e.g. Draft7Validator)
+    """
+    import jsonschema
+
+    original = validator_class.VALIDATORS.get('items')
+    if original is None:
+        return validator_class
+
+    def items(validator: Any, items_schema: Any, instance: Any, schema: Any) -> Any:
+        plan = None
+        if (isinstance(instance, list) and len(instance) >= MIN_ROWS
+                and 'prefixItems' not in schema):
+            plan = record_plan(items_schema)
+        if plan is None:
+            yield from original(validator, items_schema, instance, schema)
+            return
+        for index in sorted(failing_rows(instance, plan, validator)):
+            yield from validator.descend(instance[index], items_schema, path=index)
+
+    return jsonschema.validators.extend(validator_class, {'items': items})
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Validate a JSON file column by column and compare with per-record validation',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s users.json users.schema.json
+        """
+    )
+    parser.add_argument('file', help='JSON file')
+    parser.add_argument('schema', help='JSON Schema file')
+
+    args = parser.parse_args()
+
+    try:
+        import jsonschema
+    except ImportError:
+        print("Error: jsonschema not installed. Run: pip install jsonschema", file=sys.stderr)
+        return 1
+
+    with open(args.schema, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    with open(args.file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    results = []
+    for label, cls in (('per-record', validator_class), ('columnar', extend_validator(validator_class))):
+        start = time.perf_counter()
+        errors = sorted((list(error.absolute_path), error.message) for error in cls(schema).iter_errors(data))
+        results.append(errors)
+        print(f"{label:>10}: {len(errors)} error(s) in {(time.perf_counter() - start) * 1000:.1f} ms"
+              f"{' (NumPy)' if HAS_NUMPY and label == 'columnar' else ''}")
+
+    if results[0] != results[1]:
+        print("✗ Columnar and per-record results differ", file=sys.stderr)
+        return 1
+    for path, message in results[1][:20]:
+        print(f"    {path}: {message}")
+    return 1 if results[1] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
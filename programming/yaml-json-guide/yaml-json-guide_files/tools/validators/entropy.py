@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+High-Entropy Token Detector
+
+Finds random-looking tokens (generated passwords, API keys, signing
+secrets) that the keyword patterns of check_secrets.py miss because they
+are stored under an innocuous key name.
+
+Candidate tokens are runs of 23 to 200 base64 or hex characters (a token
+of n characters carries at most log2(n) bits per character, so shorter
+ones could never reach the base64 threshold). They are located without a
+regex: each 1 MB window of the buffer is translated into a token/non-token
+mask with bytes.translate, and bytes.find looks for a run of 23 token
+bytes, so the text is only touched by C loops. Runs that mix '/' with '-'
+or '_' are paths or URLs rather than base64 (standard and URL-safe base64
+never share those characters), so they are split at each '/'. The
+Shannon entropy of all candidates of a buffer is then computed in one
+batch: with NumPy, a single bincount over the concatenated tokens yields a
+(tokens x 256) byte-count matrix; without it, one Counter per token.
+
+Tokens made only of hex digits are held to a lower threshold, as their
+alphabet has 16 symbols instead of 64.
+
+Used by check_secrets.py --entropy.
+
+Usage:
+    python entropy.py config.yaml
+    python entropy.py config.yaml --all
+
+Examples:
+    python entropy.py examples/config-management/secret-management/kubernetes-secrets.yaml
+"""
+
+import argparse
+import math
+import re
+import sys
+from collections import Counter
+from typing import Iterator, List, Sequence, Tuple
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Bits per character (truffleHog / detect-secrets defaults)
+BASE64_THRESHOLD = 4.5
+HEX_THRESHOLD = 3.0
+
+# Shortest token whose entropy can reach BASE64_THRESHOLD (at most log2(length))
+MIN_TOKEN_LENGTH = math.ceil(2 ** BASE64_THRESHOLD)
+# Longer runs are encoded data (certificates, images), not credentials
+MAX_TOKEN_LENGTH = 200
+
+# Base64 (standard and URL-safe) without the '=' padding, which would glue "key=" to a value
+TOKEN_CHARS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/_-'
+HEX_TOKEN = re.compile(rb'[0-9a-fA-F]+')
+HAS_DIGIT = re.compile(rb'[0-9]')
+HAS_HEX_LETTER = re.compile(rb'[a-fA-F]')
+# Characters of URL-safe base64 only: with '/' they make a path, not a token
+PATH_MARKERS = re.compile(rb'[-_]')
+
+# Maps token characters to 1 and everything else to 0
+TOKEN_MASK = bytes(1 if byte in TOKEN_CHARS else 0 for byte in range(256))
+TOKEN_RUN = b'\x01' * MIN_TOKEN_LENGTH
+
+CHUNK_SIZE = 1 << 20
+
+# Tokens per NumPy batch (the count matrix takes 2 KB per token)
+BATCH_SIZE = 4096
+
+
+def iter_token_spans(buffer) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of the candidate tokens in a buffer, in order.
+
+    Args:
+        buffer: bytes, or any buffer such as an mmap
+    """
+    size = len(buffer)
+    for start in range(0, size, CHUNK_SIZE):
+        # Runs starting in this chunk are seen whole: the window extends past
+        # the chunk by more than the longest token
+        window = buffer[start:start + CHUNK_SIZE + MAX_TOKEN_LENGTH + 1].translate(TOKEN_MASK)
+        position = 0
+        if start and TOKEN_MASK[buffer[start - 1]]:
+            position = window.find(b'\x00')  # Run started in the previous chunk
+        position = window.find(TOKEN_RUN, position) if position >= 0 else -1
+        while 0 <= position < CHUNK_SIZE:
+            end = window.find(b'\x00', position)
+            if end < 0:
+                end = len(window)
+            if end - position <= MAX_TOKEN_LENGTH:
+                yield from _split_path(buffer, start + position, start + end)
+            position = window.find(TOKEN_RUN, end)
+
+
+def _split_path(buffer, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """Yield the span of a run, or its long enough '/'-separated parts if it mixes base64 alphabets."""
+    run = bytes(buffer[start:end])
+    if b'/' not in run or not PATH_MARKERS.search(run):
+        yield start, end
+        return
+    offset = 0
+    for part in run.split(b'/'):
+        if len(part) >= MIN_TOKEN_LENGTH:
+            yield start + offset, start + offset + len(part)
+        offset += len(part) + 1
+
+
+def _entropy_python(tokens: Sequence[bytes]) -> List[float]:
+    entropies = []
+    for token in tokens:
+        length = len(token)
+        total = sum(count * math.log2(count) for count in Counter(token).values())
+        entropies.append(math.log2(length) - total / length)
+    return entropies
+
+
+def _entropy_numpy(tokens: Sequence[bytes]) -> List[float]:
+    entropies: List[float] = []
+    for first in range(0, len(tokens), BATCH_SIZE):
+        batch = tokens[first:first + BATCH_SIZE]
+        lengths = numpy.fromiter(map(len, batch), dtype=numpy.int64, count=len(batch))
+        data = numpy.frombuffer(b''.join(batch), dtype=numpy.uint8)
+        ids = numpy.repeat(numpy.arange(len(batch), dtype=numpy.int64), lengths)
+        counts = numpy.bincount(ids * 256 + data, minlength=len(batch) * 256).reshape(len(batch), 256)
+        # H = log2(n) - sum(c * log2(c)) / n; log2(max(c, 1)) makes empty bins contribute 0
+        weighted = (counts * numpy.log2(numpy.maximum(counts, 1))).sum(axis=1)
+        entropies.extend((numpy.log2(lengths) - weighted / lengths).tolist())
+    return entropies
+
+
+def shannon_entropy(tokens: Sequence[bytes]) -> List[float]:
+    """
+    Shannon entropy in bits per character of each token, computed as one batch.
+
+    Args:
+        tokens: Non-empty byte strings
+
+    Returns:
+        Entropies, in the order of tokens
+    """
+    if HAS_NUMPY and tokens:
+        return _entropy_numpy(tokens)
+    return _entropy_python(tokens)
+
+
+def classify(token: bytes) -> str:
+    """Return 'hex' for tokens of hex digits (with at least one letter and one digit), else 'base64'."""
+    if HEX_TOKEN.fullmatch(token) and HAS_DIGIT.search(token) and HAS_HEX_LETTER.search(token):
+        return 'hex'
+    return 'base64'
+
+
+def iter_high_entropy(buffer, base64_threshold: float = BASE64_THRESHOLD,
+                      hex_threshold: float = HEX_THRESHOLD,
+                      report_all: bool = False) -> Iterator[Tuple[int, int, str, float]]:
+    """
+    Find random-looking tokens in a buffer.
+
+    Args:
+        buffer: bytes, or any buffer such as an mmap
+        base64_threshold: Minimum entropy of base64 tokens
+        hex_threshold: Minimum entropy of hex tokens
+        report_all: Yield every candidate, whatever its entropy
+
+    Yields:
+        (start, end, kind, entropy) per token, kind being 'base64' or 'hex'
+    """
+    spans = list(iter_token_spans(buffer))
+    tokens = [bytes(buffer[start:end]) for start, end in spans]
+    for (start, end), token, entropy in zip(spans, tokens, shannon_entropy(tokens)):
+        kind = classify(token)
+        if report_all or entropy >= (hex_threshold if kind == 'hex' else base64_threshold):
+            yield start, end, kind, entropy
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show random-looking (high-entropy) tokens in a file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  %(prog)s config.yaml
+  %(prog)s config.yaml --all
+  %(prog)s config.yaml --base64-threshold 4.0
+
+Thresholds are in bits per character (defaults: base64 {BASE64_THRESHOLD}, hex {HEX_THRESHOLD}).
+        """
+    )
+    parser.add_argument('file', help='File to inspect')
+    parser.add_argument('--all', action='store_true', help='Show every candidate token with its entropy')
+    parser.add_argument('--base64-threshold', type=float, default=BASE64_THRESHOLD, metavar='BITS')
+    parser.add_argument('--hex-threshold', type=float, default=HEX_THRESHOLD, metavar='BITS')
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.file, 'rb') as f:
+            buffer = f.read()
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for start, end, kind, entropy in iter_high_entropy(buffer, args.base64_threshold,
+                                                       args.hex_threshold, args.all):
+        line = buffer.count(b'\n', 0, start) + 1
+        print(f"Line {line} [{kind} {entropy:.2f}]: {buffer[start:end].decode('ascii')}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
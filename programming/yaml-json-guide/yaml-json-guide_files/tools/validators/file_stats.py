@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Per-file Timing and Memory Statistics
+
+Shared instrumentation behind the --stats option of the validators, the
+secret scanner and the converters. For each file it records the size, the
+time spent in each phase (read, parse, validate, scan, ...) and the peak
+memory allocated while processing it, measured with tracemalloc.
+
+Instrumented code calls track_file() and phase(); both are no-ops until
+enable() is called, so tools pay nothing when --stats is not given.
+
+Phase times are exclusive: time spent in a nested phase is not counted
+again in the enclosing one.
+
+Usage (from a tool):
+    stats = file_stats.enable('validate_json.py')
+    with file_stats.track_file(path):
+        with file_stats.phase('read'):
+            ...
+    stats.print_report(top=10)
+    stats.write_json('stats.json')
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# Column order for the report; phases not listed here are appended
+PHASE_ORDER = ['read', 'parse', 'validate', 'scan', 'convert', 'write']
+
+_active: Optional['StatsRecorder'] = None
+
+
+class FileRecord:
+    """Measurements for a single file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            self.size = os.path.getsize(path)
+        except OSError:
+            self.size = 0
+        self.phases: Dict[str, float] = {}
+        self.total = 0.0
+        self.peak_memory = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'size_bytes': self.size,
+            'total_ms': round(self.total * 1000, 3),
+            'phases_ms': {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+            'peak_memory_bytes': self.peak_memory,
+        }
+
+
+class StatsRecorder:
+    """Collects FileRecords for one tool run."""
+
+    def __init__(self, tool: str, trace_memory: bool = True):
+        self.tool = tool
+        self.trace_memory = trace_memory
+        self.records: List[FileRecord] = []
+        self._current: Optional[FileRecord] = None
+        self._stack: List[List[Any]] = []  # [phase_name, started_at]
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def track_file(self, path: str) -> Iterator[FileRecord]:
+        record = FileRecord(path)
+        previous, self._current = self._current, record
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.total += time.perf_counter() - start
+            if self.trace_memory:
+                record.peak_memory = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            self.records.append(record)
+            self._current = previous
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        record = self._current
+        if record is None:
+            yield
+            return
+
+        now = time.perf_counter()
+        if self._stack:
+            # Pause the enclosing phase
+            parent = self._stack[-1]
+            record.phases[parent[0]] = record.phases.get(parent[0], 0.0) + now - parent[1]
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, started = self._stack.pop()
+            record.phases[name] = record.phases.get(name, 0.0) + now - started
+            if self._stack:
+                self._stack[-1][1] = now  # Resume the enclosing phase
+
+    def phase_names(self) -> List[str]:
+        seen = {name for record in self.records for name in record.phases}
+        return [p for p in PHASE_ORDER if p in seen] + sorted(seen - set(PHASE_ORDER))
+
+    def print_report(self, top: int = 10, stream: TextIO = sys.stderr) -> None:
+        """Print the slowest files as a table, followed by totals."""
+        if not self.records:
+            return
+
+        phases = self.phase_names()
+        slowest = sorted(self.records, key=lambda r: r.total, reverse=True)[:top]
+        width = min(max(len(r.path) for r in slowest), 60)
+
+        header = f"{'File':<{width}}  {'Size':>9}" + ''.join(f"  {p.title():>9}" for p in phases)
+        header += f"  {'Total':>9}"
+        if self.trace_memory:
+            header += f"  {'Peak mem':>9}"
+
+        print(f"\n📊 {self.tool}: slowest {len(slowest)} of {len(self.records)} file(s)", file=stream)
+        print(header, file=stream)
+        print('-' * len(header), file=stream)
+        for record in slowest:
+            path = record.path if len(record.path) <= width else '...' + record.path[-(width - 3):]
+            line = f"{path:<{width}}  {format_bytes(record.size):>9}"
+            line += ''.join(f"  {format_ms(record.phases.get(p)):>9}" for p in phases)
+            line += f"  {format_ms(record.total):>9}"
+            if self.trace_memory:
+                line += f"  {format_bytes(record.peak_memory):>9}"
+            print(line, file=stream)
+
+        total_time = sum(r.total for r in self.records)
+        total_size = sum(r.size for r in self.records)
+        print('-' * len(header), file=stream)
+        print(f"Total: {len(self.records)} file(s), {format_bytes(total_size)}, "
+              f"{format_ms(total_time)}", file=stream)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tool': self.tool,
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': sys.version.split()[0],
+            'memory_traced': self.trace_memory,
+            'files': [record.to_dict() for record in self.records],
+            'totals': {
+                'files': len(self.records),
+                'size_bytes': sum(r.size for r in self.records),
+                'total_ms': round(sum(r.total for r in self.records) * 1000, 3),
+            },
+        }
+
+    def write_json(self, path: str) -> None:
+        """Write a machine-readable report for tracking over time."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+
+
+def format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def format_ms(seconds: Optional[float]) -> str:
+    return '-' if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
+def enable(tool: str, trace_memory: bool = True) -> StatsRecorder:
+    """Start recording statistics for this process and return the recorder."""
+    global _active
+    _active = StatsRecorder(tool, trace_memory=trace_memory)
+    return _active
+
+
+def track_file(path: str):
+    """Context manager measuring everything done for one file (no-op when disabled)."""
+    return _active.track_file(path) if _active is not None else nullcontext()
+
+
+def phase(name: str):
+    """Context manager timing one phase of the current file (no-op when disabled)."""
+    return _active.phase(name) if _active is not None else nullcontext()
+
+
+def add_arguments(parser: Any) -> None:
+    """Add the shared --stats options to an argparse parser."""
+    parser.add_argument('--stats', action='store_true',
+                        help='Print per-file timing and peak memory (tracemalloc; slows the run)')
+    parser.add_argument('--stats-top', type=int, default=10, metavar='N',
+                        help='Number of slowest files shown by --stats (default: 10)')
+    parser.add_argument('--stats-json', metavar='FILE',
+                        help='Write the --stats report as JSON (implies --stats)')
+
+
+def enable_from_args(args: Any, tool: str) -> Optional[StatsRecorder]:
+    """Enable recording if --stats or --stats-json was given."""
+    if args.stats or args.stats_json:
+        return enable(tool)
+    return None
+
+
+def finish(recorder: Optional[StatsRecorder], args: Any) -> None:
+    """Print and/or write the report at the end of a run."""
+    if recorder is None:
+        return
+    recorder.print_report(top=args.stats_top)
+    if args.stats_json:
+        recorder.write_json(args.stats_json)
+        print(f"Stats written to {args.stats_json}", file=sys.stderr)
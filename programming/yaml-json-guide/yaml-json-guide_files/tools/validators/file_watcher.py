@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+File Watcher
+
+Watches files and directories and reports which files changed, for the
+--watch mode of the validators. Uses inotify on Linux (no extra packages,
+via ctypes) and falls back to polling stat() results elsewhere.
+
+Changes are batched: after the first event the watcher waits for a short
+quiet period so an editor's write-rename-chmod sequence yields one batch.
+
+Usage:
+    python file_watcher.py config/
+    python file_watcher.py config.yaml data.json --poll
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+# inotify event masks (from <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+EVENT_HEADER = struct.Struct('iIII')
+
+# Time to wait for more events before reporting a batch
+SETTLE_SECONDS = 0.02
+
+
+def iter_watched_files(paths: Iterable[str], suffixes: Tuple[str, ...]) -> List[str]:
+    """
+    Expand files and directories into the list of files to validate.
+
+    Args:
+        paths: Files and/or directories
+        suffixes: File extensions to pick up inside directories
+
+    Returns:
+        Sorted list of file paths
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                files.update(os.path.join(root, name) for name in names if name.endswith(suffixes))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+def is_within(path: str, roots: Iterable[str]) -> bool:
+    """Whether a path is one of roots or lies inside one of them."""
+    path = os.path.abspath(path)
+    for root in roots:
+        root = os.path.abspath(root)
+        if path == root or path.startswith(root.rstrip(os.sep) + os.sep):
+            return True
+    return False
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime_ns, size) snapshots."""
+
+    def __init__(self, paths: List[str], suffixes: Tuple[str, ...], interval: float = 0.2):
+        self.paths = paths
+        self.suffixes = suffixes
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for path in iter_watched_files(self.paths, self.suffixes):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def changes(self) -> Iterator[Set[str]]:
+        """Yield sets of changed (modified, created or deleted) files."""
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            changed = {p for p in current.keys() | self.snapshot.keys()
+                       if current.get(p) != self.snapshot.get(p)}
+            self.snapshot = current
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Detects changes with Linux inotify watches on the containing directories."""
+
+    def __init__(self, paths: List[str], suffixes: Tuple[str, ...]):
+        self.suffixes = suffixes
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.dirs: Dict[int, str] = {}
+        self.recursive: Set[str] = set()
+        # For individually watched files: directory -> names of interest
+        self.files: Dict[str, Set[str]] = {}
+
+        for path in paths:
+            if os.path.isdir(path):
+                self._add_tree(path)
+            else:
+                directory, name = os.path.split(os.path.abspath(path))
+                self.files.setdefault(directory, set()).add(name)
+                self._add_dir(directory)
+        self.originals = {os.path.abspath(p): p for p in paths if not os.path.isdir(p)}
+
+    def _add_dir(self, directory: str) -> None:
+        if directory in self.dirs.values():
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.dirs[wd] = directory
+
+    def _add_tree(self, top: str) -> None:
+        for root, dirs, _ in os.walk(top):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            self.recursive.add(os.path.abspath(root))
+            self._add_dir(os.path.abspath(root))
+
+    def _read_events(self, changed: Set[str]) -> None:
+        try:
+            buffer = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            directory = self.dirs.get(wd)
+            if directory is None or mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            full_path = os.path.join(directory, name)
+
+            if mask & IN_ISDIR:
+                # Pick up new subdirectories of recursively watched trees
+                if mask & (IN_CREATE | IN_MOVED_TO) and directory in self.recursive:
+                    self._add_tree(full_path)
+                continue
+
+            if directory in self.recursive and name.endswith(self.suffixes):
+                relative = os.path.relpath(full_path)
+                changed.add(full_path if relative.startswith('..') else relative)
+            elif name in self.files.get(directory, ()):
+                changed.add(self.originals.get(full_path, full_path))
+
+    def changes(self) -> Iterator[Set[str]]:
+        """Yield sets of changed (modified, created or deleted) files."""
+        while True:
+            changed: Set[str] = set()
+            select.select([self.fd], [], [])
+            self._read_events(changed)
+            # Let the editor finish its save sequence before reporting
+            while select.select([self.fd], [], [], SETTLE_SECONDS)[0]:
+                self._read_events(changed)
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def create_watcher(paths: List[str], suffixes: Tuple[str, ...], interval: float = 0.2,
+                   force_polling: bool = False):
+    """Return an inotify watcher where supported, otherwise a polling watcher."""
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths, suffixes)
+        except (OSError, AttributeError):
+            pass  # No inotify (e.g. old kernel or restricted container)
+    return PollingWatcher(paths, suffixes, interval=interval)
+
+
+def watch(paths: List[str], on_change: Callable[[List[str]], None], suffixes: Tuple[str, ...],
+          interval: float = 0.2, force_polling: bool = False) -> int:
+    """
+    Call on_change with each batch of changed files until interrupted.
+
+    Args:
+        paths: Files and/or directories to watch
+        on_change: Callback receiving the sorted list of changed files
+        suffixes: File extensions to watch inside directories
+        interval: Polling interval in seconds (polling fallback only)
+        force_polling: Do not use inotify
+
+    Returns:
+        Exit code (0 on Ctrl+C)
+    """
+    watcher = create_watcher(paths, suffixes, interval=interval, force_polling=force_polling)
+    kind = 'polling' if isinstance(watcher, PollingWatcher) else 'inotify'
+    print(f"\n👀 Watching {len(paths)} path(s) with {kind}. Press Ctrl+C to stop.", file=sys.stderr)
+
+    try:
+        for changed in watcher.changes():
+            on_change(sorted(changed))
+    except KeyboardInterrupt:
+        print("\nStopped watching.", file=sys.stderr)
+    finally:
+        watcher.close()
+    return 0
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Print files as they change (debugging aid for --watch)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s config/
+  %(prog)s config.yaml data.json --poll
+        """
+    )
+    parser.add_argument('paths', nargs='+', help='Files or directories to watch')
+    parser.add_argument('--poll', action='store_true', help='Force polling instead of inotify')
+    parser.add_argument('--suffix', action='append', default=None,
+                        help='File extension to watch in directories (repeatable)')
+
+    args = parser.parse_args()
+    suffixes = tuple(args.suffix or ['.yaml', '.yml', '.json'])
+
+    def report(changed: List[str]) -> None:
+        for path in changed:
+            print(f"{time.strftime('%H:%M:%S')} changed: {path}")
+
+    return watch(args.paths, report, suffixes, force_polling=args.poll)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
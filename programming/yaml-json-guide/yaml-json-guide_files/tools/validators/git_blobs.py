@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Git Blob Access
+
+Lists the file versions (blobs) in the staged index or in a range of
+commits, and reads them in bulk from a local repository, so checks can run
+on content that is not (or no longer) in the working tree.
+
+All blobs are read through a single `git cat-file --batch` process that
+lives for the whole scan; object names are written to it from a background
+thread while the contents are read back, so there is no round trip per
+blob. History listings come from one `git log --raw` process, oldest
+commit first, so the first occurrence of a blob is the commit that
+introduced it.
+
+Used by check_secrets.py --staged / --history.
+
+Usage:
+    python git_blobs.py --staged
+    python git_blobs.py --history main..HEAD
+
+Examples:
+    python git_blobs.py --history HEAD~100..HEAD --repo /path/to/repo
+    python git_blobs.py --history=--all --unique
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+from typing import IO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Hash of the empty tree, to diff against in a repository without commits
+EMPTY_TREE = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
+
+# Gitlink (submodule) entries point at commits, not blobs
+SUBMODULE_MODE = '160000'
+
+
+class GitError(Exception):
+    """A git command failed."""
+
+
+class BlobRef(NamedTuple):
+    """One version of a file: where it was seen and its blob hash."""
+
+    path: str
+    blob: str
+    commit: Optional[str] = None  # None: staged in the index
+
+    @property
+    def label(self) -> str:
+        """Revision syntax git understands, e.g. "1a2b3c4d5e:config.yaml" or ":config.yaml"."""
+        return f"{self.commit[:10] if self.commit else ''}:{self.path}"
+
+
+def _git(repo: str, *args: str) -> List[str]:
+    return ['git', '-C', repo, *args]
+
+
+def _run(command: List[str]) -> bytes:
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise GitError(result.stderr.decode('utf-8', errors='replace').strip()
+                       or f"{' '.join(command)} failed")
+    return result.stdout
+
+
+def _iter_fields(stream: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Split the NUL-separated output of a `-z` git command as it arrives."""
+    pending = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b'\0')
+        pending = fields.pop()
+        yield from fields
+    if pending:
+        yield pending
+
+
+def _parse_raw(fields: Iterator[bytes], commit: Optional[str] = None) -> Iterator[BlobRef]:
+    """Parse `--raw -z` entries (":old_mode new_mode old_hash new_hash status", path)."""
+    for field in fields:
+        field = field.lstrip(b'\n')
+        if field.startswith(b'commit '):
+            commit = field[7:].decode('ascii').strip()
+            continue
+        if not field.startswith(b':'):
+            continue
+        path = os.fsdecode(next(fields, b''))
+        _, new_mode, _, new_hash, status = field[1:].decode('ascii').split()[:5]
+        if status != 'D' and new_mode != SUBMODULE_MODE:
+            yield BlobRef(path, new_hash, commit)
+
+
+def iter_staged(repo: str = '.', paths: Sequence[str] = ()) -> Iterator[BlobRef]:
+    """
+    List the files added or modified in the index (what the next commit would add).
+
+    Args:
+        repo: Repository directory
+        paths: Optional pathspecs limiting the listing
+
+    Raises:
+        GitError: If repo is not a git repository
+    """
+    has_head = subprocess.run(_git(repo, 'rev-parse', '--verify', '--quiet', 'HEAD'),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    output = _run(_git(repo, 'diff-index', '--cached', '--no-renames', '-z', '--diff-filter=d',
+                       'HEAD' if has_head else EMPTY_TREE, '--', *paths))
+    yield from _parse_raw(iter(output.split(b'\0')))
+
+
+def iter_history(repo: str = '.', revisions: Sequence[str] = ('HEAD',),
+                 paths: Sequence[str] = ()) -> Iterator[BlobRef]:
+    """
+    List the file versions introduced by a range of commits, oldest commit first.
+
+    Merge commits are diffed against each parent, so content resolved in a
+    merge is included. A blob appears once per commit that introduces it.
+
+    Args:
+        repo: Repository directory
+        revisions: Arguments for git log, e.g. ['main..HEAD'] or ['--all']
+        paths: Optional pathspecs limiting the listing
+
+    Raises:
+        GitError: If git log fails (e.g. an unknown revision)
+    """
+    command = _git(repo, 'log', '--raw', '--no-abbrev', '--no-renames', '-m', '--root',
+                   '--reverse', '-z', '--diff-filter=d', '--format=commit %H', *revisions, '--', *paths)
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        yield from _parse_raw(_iter_fields(process.stdout))
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        if process.wait() != 0 and stderr:
+            raise GitError(stderr.decode('utf-8', errors='replace').strip())
+
+
+class BlobReader:
+    """Reads blobs through one long-lived `git cat-file --batch` process."""
+
+    def __init__(self, repo: str = '.'):
+        self.process = subprocess.Popen(_git(repo, 'cat-file', '--batch'),
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def iter_blobs(self, hashes: Iterable[str]) -> Iterator[Tuple[str, Optional[bytes]]]:
+        """
+        Yield (hash, content) for each hash, in order (content None for a missing object).
+
+        Hashes are written to git from a background thread, so git keeps
+        streaming while the caller processes earlier blobs; the iterable is
+        consumed by that thread. git exits once all hashes are answered, so
+        a reader serves one call.
+
+        Raises:
+            Whatever iterating over hashes raised (e.g. GitError)
+        """
+        errors: List[BaseException] = []
+
+        def feed() -> None:
+            try:
+                for blob in hashes:
+                    self.process.stdin.write(blob.encode('ascii') + b'\n')
+            except BrokenPipeError:
+                pass
+            except BaseException as e:  # Re-raised in the caller's thread
+                errors.append(e)
+            finally:
+                try:
+                    self.process.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        stdout = self.process.stdout
+        while True:
+            header = stdout.readline().split()
+            if not header:
+                break
+            name = header[0].decode('ascii', errors='replace')
+            if len(header) != 3:
+                yield name, None  # "<name> missing" or "<name> ambiguous"
+                continue
+            data = stdout.read(int(header[2]))
+            stdout.read(1)  # Trailing newline
+            yield name, data
+        feeder.join()
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        if not self.process.stdin.closed:
+            self.process.stdin.close()
+        self.process.stdout.close()
+        self.process.wait()
+
+    def __enter__(self) -> 'BlobReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='List the file versions in the staged index or in a commit range',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --staged
+  %(prog)s --history main..HEAD
+  %(prog)s --history=--all --unique
+        """
+    )
+    parser.add_argument('paths', nargs='*', help='Limit the listing to these paths')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--staged', action='store_true', help='Files added or modified in the index')
+    mode.add_argument('--history', nargs='?', const='HEAD', metavar='RANGE',
+                      help='Files introduced by a commit range (git log syntax, e.g. main..HEAD; '
+                           'default: all of HEAD; --history=--all for every ref)')
+    parser.add_argument('--repo', default='.', help='Repository directory (default: .)')
+    parser.add_argument('--unique', action='store_true', help='List each blob once')
+
+    args = parser.parse_args()
+
+    try:
+        refs = (iter_staged(args.repo, args.paths) if args.staged
+                else iter_history(args.repo, [args.history], args.paths))
+        seen = set()
+        for ref in refs:
+            if args.unique:
+                if ref.blob in seen:
+                    continue
+                seen.add(ref.blob)
+            print(f"{ref.blob} {ref.label}")
+    except GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
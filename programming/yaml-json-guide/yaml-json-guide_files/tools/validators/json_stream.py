@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Array Reader
+
+Incrementally parses a top-level JSON array, yielding one element at a time,
+so arbitrarily large exports can be processed with memory bounded by the
+largest element. Uses the standard library's C-accelerated raw_decode on a
+sliding buffer; no third-party streaming parser is required.
+
+Usage:
+    python json_stream.py export.json
+    python json_stream.py export.json --show 3
+
+Examples:
+    python json_stream.py users.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Iterator, TextIO, Tuple
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = ' \t\n\r'
+# A decode error this close to the end of the window may come from an element
+# cut off by the window ("tru", "\u12", "[1, 2"); anything earlier is final
+TRUNCATION_MARGIN = 12
+
+
+class StreamDecodeError(ValueError):
+    """Raised when the stream is not a well-formed JSON array."""
+
+    def __init__(self, msg: str, lineno: int, colno: int, index: int):
+        super().__init__(f"{msg} at line {lineno}, column {colno} (item {index})")
+        self.msg = msg
+        self.lineno = lineno
+        self.colno = colno
+        self.index = index
+
+
+class _Buffer:
+    """Sliding text window over a file that tracks absolute line numbers."""
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+        self.line = 1          # Line number at text[0]
+        self.line_start = 0    # Offset in text where the current line started (may be negative)
+
+    def fill(self, minimum: int = 0) -> bool:
+        """Read at least one more chunk (or minimum characters); return False at EOF."""
+        if self.eof:
+            return False
+        # Drop consumed text before growing the window
+        if self.pos:
+            self.line += self.text.count('\n', 0, self.pos)
+            last_newline = self.text.rfind('\n', 0, self.pos)
+            self.line_start = (self.line_start if last_newline < 0 else last_newline + 1) - self.pos
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        chunk = self.fp.read(max(self.chunk_size, minimum))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text += chunk
+        return True
+
+    def skip_whitespace(self) -> str:
+        """Advance past whitespace and return the next character ('' at EOF)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def location(self, offset: int) -> Tuple[int, int]:
+        """Return (line, column) of an offset in the current window."""
+        newlines = self.text.count('\n', 0, offset)
+        line = self.line + newlines
+        if newlines:
+            column = offset - self.text.rfind('\n', 0, offset)
+        else:
+            column = offset - self.line_start + 1
+        return line, column
+
+
+def _may_be_truncated(error: json.JSONDecodeError, length: int) -> bool:
+    """Whether a decode error could go away once more text is read."""
+    # An unterminated string is reported at its opening quote
+    return error.pos >= length - TRUNCATION_MARGIN or error.msg.startswith('Unterminated string')
+
+
+def iter_json_array(fp: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (index, element) for each element of a top-level JSON array.
+
+    Args:
+        fp: Text file object positioned at the start of the document
+        chunk_size: Number of characters read per refill
+
+    Yields:
+        Tuples of (index, parsed_element)
+
+    Raises:
+        StreamDecodeError: If the document is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    buf = _Buffer(fp, chunk_size)
+    index = 0
+
+    def fail(msg: str, offset: int) -> StreamDecodeError:
+        line, column = buf.location(offset)
+        return StreamDecodeError(msg, line, column, index)
+
+    if buf.skip_whitespace() != '[':
+        raise fail("Expecting '[' (top-level value is not an array)", buf.pos)
+    buf.pos += 1
+
+    if buf.skip_whitespace() == ']':
+        buf.pos += 1
+    else:
+        while True:
+            if not buf.skip_whitespace():
+                raise fail("Unterminated array", buf.pos)
+
+            # Decode one element. A value ending near the end of the window may be
+            # truncated (e.g. "1." or "1e+" of a longer number), so grow the
+            # window geometrically and retry.
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buf.text, buf.pos)
+                    if end < len(buf.text) - 2 or buf.eof:
+                        break
+                except json.JSONDecodeError as e:
+                    if buf.eof or not _may_be_truncated(e, len(buf.text)):
+                        raise fail(e.msg, e.pos)
+                if not buf.fill(minimum=len(buf.text)):
+                    continue  # EOF reached: the next decode is authoritative
+
+            yield index, element
+            index += 1
+            buf.pos = end
+
+            separator = buf.skip_whitespace()
+            if separator == ',':
+                buf.pos += 1
+            elif separator == ']':
+                buf.pos += 1
+                break
+            elif not separator:
+                raise fail("Unterminated array", buf.pos)
+            else:
+                raise fail("Expecting ',' delimiter", buf.pos)
+
+    if buf.skip_whitespace():
+        raise fail("Extra data after array", buf.pos)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Stream the elements of a top-level JSON array',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s export.json
+  %(prog)s export.json --show 3
+        """
+    )
+    parser.add_argument('file', help='JSON file containing a top-level array')
+    parser.add_argument('--show', type=int, default=0, metavar='N', help='Print the first N elements')
+
+    args = parser.parse_args()
+
+    count = 0
+    try:
+        with open(args.file, 'r', encoding='utf-8') as f:
+            for index, element in iter_json_array(f):
+                if index < args.show:
+                    print(json.dumps(element, ensure_ascii=False))
+                count += 1
+    except StreamDecodeError as e:
+        print(f"✗ {args.file}: JSON syntax error: {e}", file=sys.stderr)
+        return 1
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"✓ {args.file}: {count} array element(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
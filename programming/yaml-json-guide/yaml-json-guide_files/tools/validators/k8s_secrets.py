@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Kubernetes Secret Data Decoder
+
+Kubernetes Secret manifests store their values base64-encoded under
+`data:`, where the secret patterns of check_secrets.py cannot see them.
+This module finds Secret documents in a YAML or JSON file and decodes
+their data values so the scanner can check the plaintext.
+
+Decoding is bounded, so a crafted or merely huge manifest cannot blow up
+scan time:
+
+- Only files containing `kind: Secret` (a byte regex, no parsing) and no
+  larger than MAX_MANIFEST_BYTES are parsed, and only composed (no Python
+  objects are built; aliases are not expanded). A caller that has already
+  parsed the file (check_all.py) passes its documents instead, and the
+  file is not parsed again.
+- Values longer than MAX_VALUE_BYTES once encoded are skipped; they are
+  certificates, keystores or other bulk data.
+- At most MAX_FILE_DECODED_BYTES are decoded per file; later values are
+  skipped.
+- Values that are not valid base64 (e.g. "LS0tLS1CRUdJTi...") and binary
+  values are skipped.
+
+Without PyYAML nothing is decoded.
+
+Used by check_secrets.py.
+
+Usage:
+    python k8s_secrets.py secret.yaml
+
+Examples:
+    python k8s_secrets.py examples/kubernetes/basic-deployment/secret.yaml
+"""
+
+import argparse
+import base64
+import binascii
+import re
+import sys
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import yaml
+    # Composing keeps marks with either loader; libyaml is just faster
+    ComposeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+# Larger files are not parsed (composing 1 MB takes ~0.25 s even with libyaml)
+MAX_MANIFEST_BYTES = 1024 * 1024
+# Per-value limit, on the encoded length
+MAX_VALUE_BYTES = 64 * 1024
+# Per-file limit, on the total decoded length
+MAX_FILE_DECODED_BYTES = 1024 * 1024
+
+# `kind: Secret` in YAML or `"kind": "Secret"` in JSON
+SECRET_KIND = re.compile(rb'''["']?\bkind["']?[ \t]*:[ \t]*["']?Secret\b(?!-)''')
+
+WHITESPACE = re.compile(r'\s+')
+# A `data:` key (not stringData or metadata), in YAML or JSON
+DATA_KEY = re.compile(rb'''(?<![\w-])["']?data["']?[ \t]*:''')
+# End of a line opening a block scalar ("key: |", "key: >-")
+BLOCK_INDICATOR = re.compile(rb'[|>][-+0-9]*[ \t]*(#[^\n]*)?\r?\n[ \t]*$')
+
+
+class SecretValue(NamedTuple):
+    """One decoded data value of a Secret."""
+
+    line_num: int  # Line of the encoded value in the manifest
+    key: str
+    decoded: bytes
+
+
+def _child(node, name: str):
+    """Value node of a mapping key, or None."""
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == name:
+                return value_node
+    return None
+
+
+def _node_data(documents: List[Any]) -> Iterator[Tuple[int, str, str]]:
+    """(line, key, encoded value) of each data entry of the Secrets in composed documents."""
+    for document in documents:
+        kind = _child(document, 'kind')
+        data = _child(document, 'data')
+        if not (isinstance(kind, yaml.ScalarNode) and kind.value == 'Secret'
+                and isinstance(data, yaml.MappingNode)):
+            continue
+        for key_node, value_node in data.value:
+            if isinstance(key_node, yaml.ScalarNode) and isinstance(value_node, yaml.ScalarNode):
+                yield value_node.start_mark.line + 1, key_node.value, value_node.value
+
+
+def _object_data(documents: List[Any], buffer) -> Iterator[Tuple[int, str, str]]:
+    """
+    (line, key, encoded value) of each data entry of the Secrets in loaded documents.
+
+    Loaded documents carry no positions, so each value is placed on the line
+    where its first characters next occur after the document's `data:` key,
+    or on the line before for a block scalar (whose node starts at the "|"
+    or ">"). Pass composed documents where possible: a copy of a value under
+    another `data:` key earlier in the document can still take its line.
+    """
+    position = 0
+    for document in documents:
+        if not (isinstance(document, dict) and document.get('kind') == 'Secret'
+                and isinstance(document.get('data'), dict)):
+            continue
+        data_key = DATA_KEY.search(buffer, position)
+        if data_key is not None:
+            position = data_key.end()
+        for key, value in document['data'].items():
+            if not isinstance(value, str) or not value.strip():
+                continue
+            start = value.split(None, 1)[0].encode('utf-8')
+            found = buffer.find(start, position)
+            line_num = buffer[:found if found >= 0 else position].count(b'\n') + 1
+            if found >= 0:
+                if BLOCK_INDICATOR.search(buffer[max(0, found - 256):found]):
+                    line_num -= 1
+                position = found + len(start)
+            yield line_num, str(key), value
+
+
+def iter_secret_values(buffer, max_value_bytes: int = MAX_VALUE_BYTES,
+                       max_file_bytes: int = MAX_FILE_DECODED_BYTES,
+                       documents: Optional[List[Any]] = None) -> Iterator[SecretValue]:
+    """
+    Decode the data values of the Secret documents in a buffer.
+
+    Args:
+        buffer: bytes, or any buffer such as an mmap
+        max_value_bytes: Skip values longer than this (encoded)
+        max_file_bytes: Stop once this many bytes have been decoded
+        documents: The buffer's documents, if the caller already parsed it:
+            composed nodes (exact lines), or Python objects from json.loads
+
+    Yields:
+        Decoded values, in document order; skipped values are left out
+    """
+    if not HAS_YAML or len(buffer) > MAX_MANIFEST_BYTES or SECRET_KIND.search(buffer) is None:
+        return
+    if documents is None:
+        try:
+            text = bytes(buffer).decode('utf-8')
+            documents = list(yaml.compose_all(text, Loader=ComposeLoader))
+        except (UnicodeDecodeError, yaml.YAMLError):
+            return
+    if all(document is None or isinstance(document, yaml.Node) for document in documents):
+        entries = _node_data(documents)
+    else:
+        entries = _object_data(documents, buffer)
+
+    budget = max_file_bytes
+    for line_num, key, value in entries:
+        encoded = WHITESPACE.sub('', value)
+        if not encoded or len(encoded) > max_value_bytes:
+            continue
+        if len(encoded) // 4 * 3 > budget:
+            return
+        try:
+            decoded = base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError):
+            continue
+        budget -= len(decoded)
+        if b'\0' not in decoded:
+            yield SecretValue(line_num, key, decoded)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show the decoded data values of the Kubernetes Secrets in a file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s secret.yaml
+  %(prog)s manifests.yaml --max-value-bytes 4096
+        """
+    )
+    parser.add_argument('file', help='YAML or JSON manifest')
+    parser.add_argument('--max-value-bytes', type=int, default=MAX_VALUE_BYTES, metavar='N',
+                        help=f'Skip values longer than N encoded bytes (default: {MAX_VALUE_BYTES})')
+    parser.add_argument('--max-file-bytes', type=int, default=MAX_FILE_DECODED_BYTES, metavar='N',
+                        help=f'Decode at most N bytes per file (default: {MAX_FILE_DECODED_BYTES})')
+
+    args = parser.parse_args()
+
+    if not HAS_YAML:
+        print("Error: PyYAML is not installed. Run: pip install PyYAML", file=sys.stderr)
+        return 1
+    try:
+        with open(args.file, 'rb') as f:
+            buffer = f.read()
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for value in iter_secret_values(buffer, args.max_value_bytes, args.max_file_bytes):
+        print(f"Line {value.line_num} [{value.key}]: {value.decoded.decode('utf-8', errors='replace')!r}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Repository File Discovery
+
+Expands directories into the files to check, so tools do not depend on
+shell globs (and the shell's argument length limit) for large trees.
+
+Directories are walked recursively. .gitignore files are honoured the way
+git does: those of the walked directories, of their parents up to the
+repository root, and .git/info/exclude; ignored directories are never
+entered. --include/--exclude patterns use the same syntax, relative to the
+directory being walked. Files named explicitly are always returned.
+
+Usage:
+    python repo_files.py .
+    python repo_files.py src/ --include '*.yaml' --exclude 'vendor/'
+
+Examples:
+    python check_secrets.py . --exclude 'tests/fixtures/'
+"""
+
+import argparse
+import os
+import re
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+# Bytes inspected to tell binary from text files (same heuristic as git)
+BINARY_CHECK_BYTES = 8000
+
+
+class IgnoreRule:
+    """One .gitignore-style pattern."""
+
+    __slots__ = ('base', 'regex', 'negate', 'dir_only', 'anchored')
+
+    def __init__(self, pattern: str, base: str = '', negate: bool = False):
+        self.base = base  # Directory the pattern is relative to ('' = top)
+        self.negate = negate
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        # A slash anywhere but at the end anchors the pattern to its directory
+        self.anchored = '/' in pattern
+        self.regex = re.compile(_translate(pattern.lstrip('/')), re.DOTALL)
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        """Check a '/'-separated path relative to the top directory."""
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not path.startswith(self.base + '/'):
+                return False
+            path = path[len(self.base) + 1:]
+        target = path if self.anchored else path.rsplit('/', 1)[-1]
+        return self.regex.fullmatch(target) is not None
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob to a regex ('*' and '?' stop at '/', '**' does not)."""
+    parts = pattern.split('/')
+    regex = []
+    for index, part in enumerate(parts):
+        last = index == len(parts) - 1
+        if part == '**':
+            regex.append('.*' if last else '(?:.*/)?')
+            continue
+        regex.append(_translate_segment(part))
+        if not last:
+            regex.append('/')
+    return ''.join(regex)
+
+
+def _translate_segment(segment: str) -> str:
+    regex = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == '*':
+            regex.append('[^/]*')
+        elif char == '?':
+            regex.append('[^/]')
+        elif char == '\\' and i < len(segment):
+            regex.append(re.escape(segment[i]))
+            i += 1
+        elif char == '[':
+            end = segment.find(']', i + 1 if segment[i:i + 1] in ('!', '^') else i)
+            if end < 0:
+                regex.append(re.escape(char))
+                continue
+            body = segment[i:end]
+            if body[:1] in ('!', '^'):
+                body = '^' + body[1:]
+            regex.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        else:
+            regex.append(re.escape(char))
+    return ''.join(regex)
+
+
+def parse_patterns(lines: Iterable[str], base: str = '') -> List[IgnoreRule]:
+    """Parse .gitignore lines (blank lines and comments are skipped)."""
+    rules = []
+    for line in lines:
+        line = line.rstrip('\n').rstrip('\r')
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            continue
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith(('\\#', '\\!')):
+            line = line[1:]  # Escaped leading character is literal
+        rules.append(IgnoreRule(line, base, negate))
+    return rules
+
+
+def load_ignore_file(path: str, base: str) -> List[IgnoreRule]:
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return parse_patterns(f, base)
+    except OSError:
+        return []
+
+
+def is_ignored(rules: List[IgnoreRule], path: str, is_dir: bool) -> bool:
+    """Apply rules in order; the last matching one decides (a "!" rule re-includes)."""
+    for rule in reversed(rules):
+        if rule.matches(path, is_dir):
+            return not rule.negate
+    return False
+
+
+def find_repo_root(path: str) -> Optional[str]:
+    """Return the enclosing git working tree root, or None."""
+    current = os.path.abspath(path)
+    while True:
+        if os.path.exists(os.path.join(current, '.git')):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _join(*parts: str) -> str:
+    return '/'.join(part for part in parts if part)
+
+
+def _walk(top: str, include: List[IgnoreRule], exclude: List[IgnoreRule],
+          use_gitignore: bool) -> Iterator[str]:
+    # .gitignore rules are matched against repository-relative paths,
+    # include/exclude patterns against paths relative to `top`
+    prefix = ''
+    rules: List[IgnoreRule] = []
+    if use_gitignore:
+        root = find_repo_root(top)
+        if root is not None:
+            relative = os.path.relpath(os.path.abspath(top), root)
+            prefix = '' if relative == '.' else relative.replace(os.sep, '/')
+            rules = load_ignore_file(os.path.join(root, '.git', 'info', 'exclude'), '')
+            # .gitignore files of the directories between the root and top
+            parts = prefix.split('/') if prefix else []
+            for depth in range(len(parts)):
+                base = '/'.join(parts[:depth])
+                rules += load_ignore_file(os.path.join(root, *parts[:depth], '.gitignore'), base)
+
+    dir_rules: Dict[str, List[IgnoreRule]] = {top: rules}
+    for root, dirs, names in os.walk(top):
+        rules = dir_rules.pop(root, rules)
+        relative = os.path.relpath(root, top)
+        relative = '' if relative == '.' else relative.replace(os.sep, '/')
+        if use_gitignore and '.gitignore' in names:
+            rules = rules + load_ignore_file(os.path.join(root, '.gitignore'), _join(prefix, relative))
+
+        kept = []
+        for name in sorted(dirs):
+            path = _join(relative, name)
+            if name == '.git' or is_ignored(rules, _join(prefix, path), True) \
+                    or is_ignored(exclude, path, True):
+                continue
+            kept.append(name)
+            dir_rules[os.path.join(root, name)] = rules
+        dirs[:] = kept
+
+        for name in sorted(names):
+            path = _join(relative, name)
+            if is_ignored(rules, _join(prefix, path), False) or is_ignored(exclude, path, False):
+                continue
+            if include and not any(rule.matches(path, False) for rule in include):
+                continue
+            yield os.path.join(root, name)
+
+
+def iter_files(paths: Iterable[str], include: Optional[List[str]] = None,
+               exclude: Optional[List[str]] = None, use_gitignore: bool = True) -> Iterator[str]:
+    """
+    Expand files and directories into the files to check, lazily.
+
+    Args:
+        paths: Files and/or directories
+        include: Patterns a file inside a directory must match (default: all files)
+        exclude: Patterns of files and directories to skip inside directories
+        use_gitignore: Skip what .gitignore files ignore
+
+    Yields:
+        File paths, each once (directory contents in sorted order)
+    """
+    include_rules = parse_patterns(include or [])
+    exclude_rules = parse_patterns(exclude or [])
+    seen = set()
+    for path in paths:
+        candidates = (_walk(path, include_rules, exclude_rules, use_gitignore)
+                      if os.path.isdir(path) else [path])
+        for candidate in candidates:
+            key = os.path.normpath(candidate)
+            if key not in seen:
+                seen.add(key)
+                yield candidate
+
+
+def path_filter(include: Optional[List[str]] = None,
+                exclude: Optional[List[str]] = None) -> Callable[[str], bool]:
+    """
+    Build a predicate applying --include/--exclude patterns to a '/'-separated file path.
+
+    For paths that do not come from a directory walk, such as files in git
+    history; a pattern excluding a directory excludes everything below it.
+    """
+    include_rules = parse_patterns(include or [])
+    exclude_rules = parse_patterns(exclude or [])
+
+    def accept(path: str) -> bool:
+        parts = path.split('/')
+        for depth in range(1, len(parts)):
+            if is_ignored(exclude_rules, '/'.join(parts[:depth]), True):
+                return False
+        if is_ignored(exclude_rules, path, False):
+            return False
+        return not include_rules or any(rule.matches(path, False) for rule in include_rules)
+
+    return accept
+
+
+def looks_binary(header: bytes) -> bool:
+    """Tell binary content from text by looking for a NUL byte in its first few KB."""
+    return b'\0' in header[:BINARY_CHECK_BYTES]
+
+
+def is_binary(path: str) -> bool:
+    """Tell binary files from text by looking for a NUL byte in the first few KB."""
+    try:
+        with open(path, 'rb') as f:
+            return looks_binary(f.read(BINARY_CHECK_BYTES))
+    except OSError:
+        return False  # Let the caller's own read report the error
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --include/--exclude/--no-gitignore options to an argparse parser."""
+    parser.add_argument('--include', action='append', metavar='PATTERN',
+                        help='Only pick up matching files inside directories '
+                             '(.gitignore syntax; repeatable)')
+    parser.add_argument('--exclude', action='append', metavar='PATTERN',
+                        help='Skip matching files and directories inside directories '
+                             '(.gitignore syntax; repeatable)')
+    parser.add_argument('--no-gitignore', action='store_true',
+                        help='Also pick up files ignored by .gitignore')
+
+
+def iter_files_from_args(args: argparse.Namespace, paths: Iterable[str]) -> Iterator[str]:
+    """iter_files with the options added by add_arguments()."""
+    return iter_files(paths, args.include, args.exclude, not args.no_gitignore)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='List the files a directory scan picks up',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s .
+  %(prog)s . --include '*.yaml' --include '*.yml' --exclude 'examples/'
+  %(prog)s . --no-gitignore
+        """
+    )
+    parser.add_argument('paths', nargs='+', help='Files and directories')
+    add_arguments(parser)
+
+    args = parser.parse_args()
+
+    for path in iter_files_from_args(args, args.paths):
+        print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
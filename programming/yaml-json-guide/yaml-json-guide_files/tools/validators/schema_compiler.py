@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+"""
+JSON Schema Compiler
+
+Compiles a draft-07 JSON Schema into a specialized Python module with one
+validation function per subschema. Type checks, required-key sets, enums,
+patterns and ranges are emitted inline, so validating a document no longer
+goes through jsonschema's generic keyword interpreter.
+
+Compiled modules are cached on disk, keyed by a hash of the schema content,
+and reused by validate_json.py --compiled. References to other local schemas
+are resolved at compile time through a SchemaRegistry (--schema-dir).
+
+Each generated module exposes:
+    is_valid(data) -> bool
+    iter_errors(data) -> iterator of (path, message) tuples
+
+Usage:
+    python schema_compiler.py schema.json
+    python schema_compiler.py schema.json --output schema_validator.py
+    python schema_compiler.py schema.json --schema-dir schemas/
+
+Examples:
+    python schema_compiler.py ../../schemas/app-config.schema.json
+    python schema_compiler.py ../../schemas/kubernetes.schema.json --stdout
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin
+
+from schema_registry import SchemaRegistry, SchemaResolutionError, resolve_pointer
+
+# Bump whenever the generated code changes so stale cache entries are ignored
+COMPILER_VERSION = 1
+
+# Keywords that never affect validation
+ANNOTATION_KEYWORDS = {
+    '$schema', '$id', '$comment', 'title', 'description', 'default',
+    'examples', 'format', 'readOnly', 'writeOnly', 'definitions',
+    'contentMediaType', 'contentEncoding',
+}
+
+# Keywords the compiler knows how to emit code for
+SUPPORTED_KEYWORDS = {
+    'type', 'enum', 'const', 'required', 'properties', 'patternProperties',
+    'additionalProperties', 'minProperties', 'maxProperties', 'propertyNames',
+    'items', 'additionalItems', 'minItems', 'maxItems', 'uniqueItems', 'contains',
+    'minLength', 'maxLength', 'pattern',
+    'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf',
+    'allOf', 'anyOf', 'oneOf', 'not', 'if', 'then', 'else', '$ref',
+}
+
+# isinstance() checks for each JSON type; bool is excluded from numbers
+TYPE_CHECKS = {
+    'object': "isinstance({v}, dict)",
+    'array': "isinstance({v}, list)",
+    'string': "isinstance({v}, str)",
+    'boolean': "isinstance({v}, bool)",
+    'null': "{v} is None",
+    'number': "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    'integer': "((isinstance({v}, int) and not isinstance({v}, bool)) "
+               "or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+NUMBER_GUARD = "isinstance({v}, (int, float)) and not isinstance({v}, bool)"
+
+RUNTIME_HELPERS = '''
+_MISSING = object()
+
+
+def _equal(a, b):
+    """JSON equality: unlike Python, True != 1 and 1 == 1.0."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (dict, list)) or isinstance(b, (dict, list)):
+        return False
+    return a == b
+
+
+def _in_enum(value, choices):
+    return any(_equal(value, choice) for choice in choices)
+
+
+def _unique(items):
+    return all(not _equal(items[i], items[j])
+               for i in range(len(items)) for j in range(i + 1, len(items)))
+
+
+def _multiple_of(value, divisor):
+    if isinstance(value, float) or isinstance(divisor, float):
+        quotient = value / divisor
+        try:
+            return quotient == int(quotient)
+        except (OverflowError, ValueError):
+            return False
+    return value % divisor == 0
+'''
+
+
+class SchemaCompileError(Exception):
+    """Raised when a schema uses features the compiler does not support."""
+    pass
+
+
+class _Compiler:
+    """Turns a schema into the source of a validation module."""
+
+    def __init__(self, root: Any, registry: Optional[SchemaRegistry] = None,
+                 base_uri: str = ''):
+        self.root = root
+        self.registry = registry
+        self.root_uri = urldefrag(base_uri)[0]
+        self.base = self.root_uri
+        self.constants: List[str] = []
+        self.functions: List[str] = []
+        self.by_id: Dict[int, int] = {}
+        self.by_pointer: Dict[str, int] = {}
+        self.names: Dict[str, str] = {}
+        self.count = 0
+
+    # Constants ---------------------------------------------------------
+
+    def const(self, prefix: str, expr: str) -> str:
+        """Hoist an expression to a module-level constant, reusing duplicates."""
+        if expr not in self.names:
+            name = f"_{prefix}{len(self.constants)}"
+            self.constants.append(f"{name} = {expr}")
+            self.names[expr] = name
+        return self.names[expr]
+
+    # Subschema functions -----------------------------------------------
+
+    def function_for(self, schema: Any) -> int:
+        """Return the index of the _ok/_err pair for a subschema, compiling it once."""
+        if isinstance(schema, dict) and '$ref' in schema:
+            return self.function_for_ref(schema['$ref'])
+
+        key = id(schema)
+        if key in self.by_id:
+            return self.by_id[key]
+
+        index = self.count
+        self.count += 1
+        self.by_id[key] = index
+        self.emit(index, schema)
+        return index
+
+    def function_for_ref(self, ref: str) -> int:
+        absolute = urljoin(self.base, ref)
+        if absolute in self.by_pointer:
+            return self.by_pointer[absolute]
+
+        document_uri, fragment = urldefrag(absolute)
+        try:
+            if document_uri == self.root_uri:
+                target = resolve_pointer(self.root, fragment)
+            elif self.registry is not None:
+                _, target = self.registry.resolve(absolute)
+            else:
+                raise SchemaCompileError(f"Remote $ref needs a schema registry: {absolute}")
+        except SchemaResolutionError as e:
+            raise SchemaCompileError(str(e))
+
+        if isinstance(target, dict) and '$ref' in target:
+            # A reference to a reference: follow it from the target's document
+            previous, self.base = self.base, document_uri
+            self.by_pointer[absolute] = self.function_for_ref(target['$ref'])
+            self.base = previous
+            return self.by_pointer[absolute]
+
+        if id(target) in self.by_id:
+            self.by_pointer[absolute] = self.by_id[id(target)]
+            return self.by_pointer[absolute]
+
+        # Register before compiling so recursive references terminate
+        index = self.count
+        self.count += 1
+        self.by_pointer[absolute] = index
+        self.by_id[id(target)] = index
+
+        # Refs inside the target are relative to the document it came from
+        previous, self.base = self.base, document_uri
+        self.emit(index, target)
+        self.base = previous
+        return index
+
+    def emit(self, index: int, schema: Any) -> None:
+        if schema is True or schema == {}:
+            self.functions.append(
+                f"def _ok{index}(d):\n    return True\n\n\n"
+                f"def _err{index}(d, path):\n    return iter(())\n"
+            )
+            return
+        if schema is False:
+            self.functions.append(
+                f"def _ok{index}(d):\n    return False\n\n\n"
+                f"def _err{index}(d, path):\n    yield path, 'False schema does not allow ' + repr(d)\n"
+            )
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"Invalid subschema: {schema!r}")
+
+        unknown = set(schema) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if unknown:
+            raise SchemaCompileError(f"Unsupported keywords: {', '.join(sorted(unknown))}")
+
+        ok_body: List[str] = []
+        err_body: List[str] = []
+        previous = self.base
+        if isinstance(schema.get('$id'), str):
+            self.base = urldefrag(urljoin(self.base, schema['$id']))[0]
+        self.emit_checks(schema, ok_body, err_body)
+        self.base = previous
+
+        ok_src = "\n".join("    " + line for line in ok_body + ["return True"])
+        err_src = "\n".join("    " + line for line in err_body + ["return", "yield"])
+        self.functions.append(
+            f"def _ok{index}(d):\n{ok_src}\n\n\n"
+            f"def _err{index}(d, path):\n{err_src}\n"
+        )
+
+    # Keyword emitters --------------------------------------------------
+
+    def fail(self, ok: List[str], err: List[str], cond: str, message: str,
+             indent: str = "") -> None:
+        """Emit a leaf check: return False in _ok, yield a message in _err."""
+        ok.append(f"{indent}if {cond}:")
+        ok.append(f"{indent}    return False")
+        err.append(f"{indent}if {cond}:")
+        err.append(f"{indent}    yield path, {message}")
+
+    def emit_checks(self, schema: Dict, ok: List[str], err: List[str]) -> None:
+        types = schema.get('type')
+        if isinstance(types, str):
+            types = [types]
+
+        if types is not None:
+            unknown = set(types) - set(TYPE_CHECKS)
+            if unknown:
+                raise SchemaCompileError(f"Unknown type: {', '.join(sorted(unknown))}")
+            cond = " or ".join(TYPE_CHECKS[t].format(v='d') for t in types)
+            expected = repr(types[0]) if len(types) == 1 else repr(types)
+            ok.append(f"if not ({cond}):")
+            ok.append("    return False")
+            err.append(f"if not ({cond}):")
+            err.append(f"    yield path, repr(d) + ' is not of type ' + {expected!r}")
+            err.append("    return")
+
+        single = types[0] if types is not None and len(types) == 1 else None
+
+        self.emit_enum(schema, single, ok, err)
+        self.emit_combinators(schema, ok, err)
+
+        object_checks = self.object_checks(schema)
+        if object_checks:
+            self.emit_guarded("isinstance(d, dict)", single == 'object', object_checks, ok, err)
+
+        array_checks = self.array_checks(schema)
+        if array_checks:
+            self.emit_guarded("isinstance(d, list)", single == 'array', array_checks, ok, err)
+
+        string_checks = self.string_checks(schema)
+        if string_checks:
+            self.emit_guarded("isinstance(d, str)", single == 'string', string_checks, ok, err)
+
+        number_checks = self.number_checks(schema)
+        if number_checks:
+            self.emit_guarded(NUMBER_GUARD.format(v='d'), single in ('number', 'integer'),
+                              number_checks, ok, err)
+
+    def emit_guarded(self, guard: str, known: bool, checks: Tuple[List[str], List[str]],
+                     ok: List[str], err: List[str]) -> None:
+        """Emit type-specific checks, skipping the guard when the type is already known."""
+        ok_checks, err_checks = checks
+        if known:
+            ok.extend(ok_checks)
+            err.extend(err_checks)
+            return
+        ok.append(f"if {guard}:")
+        ok.extend("    " + line for line in ok_checks)
+        err.append(f"if {guard}:")
+        err.extend("    " + line for line in err_checks)
+
+    def emit_enum(self, schema: Dict, single: Optional[str],
+                  ok: List[str], err: List[str]) -> None:
+        if 'enum' in schema:
+            values = schema['enum']
+            if values and all(isinstance(v, str) for v in values):
+                name = self.const('E', f"frozenset({sorted(values)!r})")
+                if single == 'string':
+                    cond = f"d not in {name}"
+                else:
+                    cond = f"not (isinstance(d, str) and d in {name})"
+            else:
+                name = self.const('E', repr(values))
+                cond = f"not _in_enum(d, {name})"
+            self.fail(ok, err, cond, f"repr(d) + ' is not one of ' + {repr(values)!r}")
+
+        if 'const' in schema:
+            name = self.const('C', repr(schema['const']))
+            self.fail(ok, err, f"not _equal(d, {name})",
+                      f"repr({name}) + ' was expected'")
+
+    def emit_combinators(self, schema: Dict, ok: List[str], err: List[str]) -> None:
+        for sub in schema.get('allOf', []):
+            n = self.function_for(sub)
+            ok.append(f"if not _ok{n}(d):")
+            ok.append("    return False")
+            err.append(f"yield from _err{n}(d, path)")
+
+        if 'anyOf' in schema:
+            calls = [f"_ok{self.function_for(sub)}(d)" for sub in schema['anyOf']]
+            self.fail(ok, err, f"not ({' or '.join(calls)})",
+                      "repr(d) + ' is not valid under any of the given schemas'")
+
+        if 'oneOf' in schema:
+            calls = [f"_ok{self.function_for(sub)}(d)" for sub in schema['oneOf']]
+            ok.append(f"if [{', '.join(calls)}].count(True) != 1:")
+            ok.append("    return False")
+            err.append(f"_matches = [{', '.join(calls)}].count(True)")
+            err.append("if _matches == 0:")
+            err.append("    yield path, repr(d) + ' is not valid under any of the given schemas'")
+            err.append("elif _matches > 1:")
+            err.append("    yield path, repr(d) + ' is valid under each of the given schemas'")
+
+        if 'not' in schema:
+            n = self.function_for(schema['not'])
+            self.fail(ok, err, f"_ok{n}(d)",
+                      f"repr(d) + ' should not be valid under ' + {repr(schema['not'])!r}")
+
+        if 'if' in schema and ('then' in schema or 'else' in schema):
+            cond = self.function_for(schema['if'])
+            ok.append(f"if _ok{cond}(d):")
+            err.append(f"if _ok{cond}(d):")
+            if 'then' in schema:
+                n = self.function_for(schema['then'])
+                ok.append(f"    if not _ok{n}(d):")
+                ok.append("        return False")
+                err.append(f"    yield from _err{n}(d, path)")
+            else:
+                ok.append("    pass")
+                err.append("    pass")
+            if 'else' in schema:
+                n = self.function_for(schema['else'])
+                ok.append("else:")
+                ok.append(f"    if not _ok{n}(d):")
+                ok.append("        return False")
+                err.append("else:")
+                err.append(f"    yield from _err{n}(d, path)")
+
+    def object_checks(self, schema: Dict) -> Optional[Tuple[List[str], List[str]]]:
+        ok: List[str] = []
+        err: List[str] = []
+
+        if schema.get('required'):
+            required = schema['required']
+            name = self.const('R', f"frozenset({sorted(required)!r})")
+            ok.append(f"if not d.keys() >= {name}:")
+            ok.append("    return False")
+            err.append(f"for _key in {required!r}:")
+            err.append("    if _key not in d:")
+            err.append("        yield path, repr(_key) + ' is a required property'")
+
+        if 'minProperties' in schema:
+            self.fail(ok, err, f"len(d) < {schema['minProperties']!r}",
+                      "repr(d) + ' does not have enough properties'")
+        if 'maxProperties' in schema:
+            self.fail(ok, err, f"len(d) > {schema['maxProperties']!r}",
+                      "repr(d) + ' has too many properties'")
+
+        for key, sub in schema.get('properties', {}).items():
+            n = self.function_for(sub)
+            ok.append(f"_v = d.get({key!r}, _MISSING)")
+            ok.append(f"if _v is not _MISSING and not _ok{n}(_v):")
+            ok.append("    return False")
+            err.append(f"if {key!r} in d:")
+            err.append(f"    yield from _err{n}(d[{key!r}], path + ({key!r},))")
+
+        patterns = [(self.const('P', f"re.compile({p!r})"), self.function_for(sub))
+                    for p, sub in schema.get('patternProperties', {}).items()]
+        for regex, n in patterns:
+            ok.append("for _k, _v in d.items():")
+            ok.append(f"    if {regex}.search(_k) and not _ok{n}(_v):")
+            ok.append("        return False")
+            err.append("for _k, _v in d.items():")
+            err.append(f"    if {regex}.search(_k):")
+            err.append(f"        yield from _err{n}(_v, path + (_k,))")
+
+        if 'additionalProperties' in schema and schema['additionalProperties'] is not True:
+            conditions = []
+            if schema.get('properties'):
+                known = self.const('K', f"frozenset({sorted(schema['properties'])!r})")
+                conditions.append(f"_k not in {known}")
+            conditions.extend(f"not {regex}.search(_k)" for regex, _ in patterns)
+            extra = " and ".join(conditions)
+            additional = schema['additionalProperties']
+            if additional is False:
+                if extra:
+                    ok.append("for _k in d:")
+                    ok.append(f"    if {extra}:")
+                    ok.append("        return False")
+                else:
+                    ok.append("if d:")
+                    ok.append("    return False")
+                err.append("for _k in d:")
+                err.append(f"    if {extra or 'True'}:")
+                err.append("        yield path, 'Additional properties are not allowed (' + repr(_k) + ' was unexpected)'")
+            else:
+                n = self.function_for(additional)
+                ok.append("for _k, _v in d.items():")
+                ok.append(f"    if {extra + ' and ' if extra else ''}not _ok{n}(_v):")
+                ok.append("        return False")
+                err.append("for _k, _v in d.items():")
+                if extra:
+                    err.append(f"    if {extra}:")
+                    err.append(f"        yield from _err{n}(_v, path + (_k,))")
+                else:
+                    err.append(f"    yield from _err{n}(_v, path + (_k,))")
+
+        if 'propertyNames' in schema:
+            n = self.function_for(schema['propertyNames'])
+            ok.append("for _k in d:")
+            ok.append(f"    if not _ok{n}(_k):")
+            ok.append("        return False")
+            err.append("for _k in d:")
+            err.append(f"    yield from _err{n}(_k, path + (_k,))")
+
+        return (ok, err) if ok else None
+
+    def array_checks(self, schema: Dict) -> Optional[Tuple[List[str], List[str]]]:
+        ok: List[str] = []
+        err: List[str] = []
+
+        if 'minItems' in schema:
+            self.fail(ok, err, f"len(d) < {schema['minItems']!r}", "repr(d) + ' is too short'")
+        if 'maxItems' in schema:
+            self.fail(ok, err, f"len(d) > {schema['maxItems']!r}", "repr(d) + ' is too long'")
+        if schema.get('uniqueItems'):
+            self.fail(ok, err, "not _unique(d)", "repr(d) + ' has non-unique elements'")
+
+        items = schema.get('items')
+        if isinstance(items, list):
+            for position, sub in enumerate(items):
+                n = self.function_for(sub)
+                ok.append(f"if len(d) > {position} and not _ok{n}(d[{position}]):")
+                ok.append("    return False")
+                err.append(f"if len(d) > {position}:")
+                err.append(f"    yield from _err{n}(d[{position}], path + ({position},))")
+            additional = schema.get('additionalItems', True)
+            if additional is not True:
+                n = self.function_for(additional)
+                ok.append(f"for _v in d[{len(items)}:]:")
+                ok.append(f"    if not _ok{n}(_v):")
+                ok.append("        return False")
+                err.append(f"for _i in range({len(items)}, len(d)):")
+                err.append(f"    yield from _err{n}(d[_i], path + (_i,))")
+        elif items is not None and items is not True and items != {}:
+            n = self.function_for(items)
+            ok.append("for _v in d:")
+            ok.append(f"    if not _ok{n}(_v):")
+            ok.append("        return False")
+            err.append("for _i, _v in enumerate(d):")
+            err.append(f"    yield from _err{n}(_v, path + (_i,))")
+
+        if 'contains' in schema:
+            n = self.function_for(schema['contains'])
+            self.fail(ok, err, f"not any(_ok{n}(_v) for _v in d)",
+                      "'None of ' + repr(d) + ' are valid under the given schema'")
+
+        return (ok, err) if ok else None
+
+    def string_checks(self, schema: Dict) -> Optional[Tuple[List[str], List[str]]]:
+        ok: List[str] = []
+        err: List[str] = []
+
+        if 'minLength' in schema:
+            self.fail(ok, err, f"len(d) < {schema['minLength']!r}", "repr(d) + ' is too short'")
+        if 'maxLength' in schema:
+            self.fail(ok, err, f"len(d) > {schema['maxLength']!r}", "repr(d) + ' is too long'")
+        if 'pattern' in schema:
+            regex = self.const('P', f"re.compile({schema['pattern']!r})")
+            self.fail(ok, err, f"{regex}.search(d) is None",
+                      f"repr(d) + ' does not match ' + {repr(schema['pattern'])!r}")
+
+        return (ok, err) if ok else None
+
+    def number_checks(self, schema: Dict) -> Optional[Tuple[List[str], List[str]]]:
+        ok: List[str] = []
+        err: List[str] = []
+
+        if 'minimum' in schema:
+            limit = schema['minimum']
+            self.fail(ok, err, f"d < {limit!r}",
+                      f"repr(d) + ' is less than the minimum of {limit!r}'")
+        if 'maximum' in schema:
+            limit = schema['maximum']
+            self.fail(ok, err, f"d > {limit!r}",
+                      f"repr(d) + ' is greater than the maximum of {limit!r}'")
+        if 'exclusiveMinimum' in schema:
+            limit = schema['exclusiveMinimum']
+            self.fail(ok, err, f"d <= {limit!r}",
+                      f"repr(d) + ' is less than or equal to the minimum of {limit!r}'")
+        if 'exclusiveMaximum' in schema:
+            limit = schema['exclusiveMaximum']
+            self.fail(ok, err, f"d >= {limit!r}",
+                      f"repr(d) + ' is greater than or equal to the maximum of {limit!r}'")
+        if 'multipleOf' in schema:
+            divisor = schema['multipleOf']
+            self.fail(ok, err, f"not _multiple_of(d, {divisor!r})",
+                      f"repr(d) + ' is not a multiple of {divisor!r}'")
+
+        return (ok, err) if ok else None
+
+
+def compile_schema_source(schema: Any, source_name: str = "<schema>",
+                          registry: Optional[SchemaRegistry] = None,
+                          base_uri: Optional[str] = None, entry: str = '') -> str:
+    """
+    Generate the source code of a validation module for a schema.
+
+    Args:
+        schema: Parsed draft-07 JSON Schema
+        source_name: Name recorded in the generated module header
+        registry: Local schemas used to resolve references to other documents
+        base_uri: URI of the schema (default: its $id)
+        entry: JSON pointer of the sub-schema to validate against, e.g. "/items"
+
+    Returns:
+        Python source code
+
+    Raises:
+        SchemaCompileError: If the schema uses unsupported features
+    """
+    if base_uri is None:
+        base_uri = schema.get('$id', '') if isinstance(schema, dict) else ''
+    compiler = _Compiler(schema, registry=registry, base_uri=base_uri)
+    if entry:
+        root = compiler.function_for_ref('#' + entry)
+    else:
+        root = compiler.function_for(schema)
+
+    parts = [
+        f"# Generated by schema_compiler.py (version {COMPILER_VERSION}) from {source_name}#{entry}",
+        "# Do not edit: regenerate from the schema instead.",
+        "",
+        "import re",
+        RUNTIME_HELPERS,
+        "\n".join(compiler.constants),
+        "",
+        "",
+        "\n\n".join(compiler.functions),
+        "",
+        f"is_valid = _ok{root}",
+        "",
+        "",
+        "def iter_errors(data):",
+        '    """Yield (path, message) for every schema violation in data."""',
+        f"    if _ok{root}(data):",
+        "        return",
+        f"    yield from _err{root}(data, ())",
+        "",
+    ]
+    return "\n".join(parts)
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used to cache compiled schema modules."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'yaml-json-guide' / 'compiled-schemas'
+
+
+def load_compiled_validator(schema_path: str, cache_dir: Optional[str] = None,
+                            registry: Optional[SchemaRegistry] = None,
+                            entry: str = '') -> ModuleType:
+    """
+    Load the compiled validator for a schema file, compiling it on a cache miss.
+
+    Args:
+        schema_path: Path to JSON Schema file
+        cache_dir: Directory for compiled modules (default: user cache directory)
+        registry: Local schemas used to resolve references to other documents
+        entry: JSON pointer of the sub-schema to validate against, e.g. "/items"
+
+    Returns:
+        Imported module exposing is_valid() and iter_errors()
+
+    Raises:
+        SchemaCompileError: If the schema uses unsupported features
+        json.JSONDecodeError: If the schema is not valid JSON
+    """
+    path = Path(schema_path)
+    raw = path.read_bytes()
+    key = raw + f"v{COMPILER_VERSION}#{entry}".encode()
+    if registry is not None:
+        # Referenced schemas are inlined, so any change to them invalidates the module
+        key += registry.fingerprint.encode()
+    digest = hashlib.sha256(key).hexdigest()[:16]
+
+    cache = Path(cache_dir) if cache_dir else default_cache_dir()
+    module_name = f"_schema_{digest}"
+    module_path = cache / f"{module_name}.py"
+
+    if not module_path.exists():
+        base_uri = registry.base_uri(schema_path) if registry is not None else None
+        source = compile_schema_source(json.loads(raw), source_name=path.name,
+                                       registry=registry, base_uri=base_uri, entry=entry)
+        cache.mkdir(parents=True, exist_ok=True)
+        tmp_path = module_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(source, encoding='utf-8')
+        os.replace(tmp_path, module_path)
+
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Compile a JSON Schema into a Python validation module',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s schema.json
+  %(prog)s schema.json --output schema_validator.py
+  %(prog)s schema.json --stdout
+  %(prog)s schema.json --schema-dir schemas/
+        """
+    )
+    parser.add_argument('schema', help='JSON Schema file to compile')
+    parser.add_argument('--output', help='Write the generated module to this file')
+    parser.add_argument('--stdout', action='store_true', help='Print the generated module')
+    parser.add_argument('--cache-dir', help='Compiled schema cache directory')
+    parser.add_argument('--schema-dir', help='Directory of schemas used to resolve $ref')
+
+    args = parser.parse_args()
+
+    try:
+        registry = SchemaRegistry(args.schema_dir) if args.schema_dir else None
+        if args.output or args.stdout:
+            with open(args.schema, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+            base_uri = registry.base_uri(args.schema) if registry is not None else None
+            source = compile_schema_source(schema, source_name=Path(args.schema).name,
+                                           registry=registry, base_uri=base_uri)
+            if args.stdout:
+                print(source)
+            else:
+                Path(args.output).write_text(source, encoding='utf-8')
+                print(f"✓ Compiled {args.schema} -> {args.output}", file=sys.stderr)
+        else:
+            module = load_compiled_validator(args.schema, cache_dir=args.cache_dir,
+                                             registry=registry)
+            print(f"✓ Compiled {args.schema} -> {module.__file__}", file=sys.stderr)
+        return 0
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"Invalid schema JSON: {e}", file=sys.stderr)
+        return 1
+    except SchemaCompileError as e:
+        print(f"Cannot compile schema: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Schema Defaults
+
+Fills in the "default" values a JSON Schema declares, e.g. metadata.namespace
+defaulting to "default" in kubernetes.schema.json.
+
+The schema is walked once to build a defaults tree that keeps only the
+branches leading to a default ("properties", "additionalProperties",
+"items", "allOf" and "$ref" are followed, recursive references included;
+"anyOf"/"oneOf" branches are ambiguous and skipped). Applying
+it is then a single traversal of each document that only visits those
+branches. As usual for JSON Schema defaults, a missing property is filled
+in only when its parent object exists.
+
+Used by validate_json.py --apply-defaults.
+
+Usage:
+    python schema_defaults.py schema.json
+    python schema_defaults.py schema.json --apply config.json
+
+Examples:
+    python schema_defaults.py ../../schemas/kubernetes.schema.json
+"""
+
+import argparse
+import copy
+import json
+import sys
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import urldefrag
+
+from schema_registry import SchemaRegistry, SchemaResolutionError, resolve_pointer
+
+MISSING = object()
+
+
+class DefaultsNode:
+    """Defaults for one schema location and the branches below it that have defaults."""
+
+    __slots__ = ('default', 'properties', 'additional', 'items')
+
+    def __init__(self):
+        self.default: Any = MISSING
+        self.properties: Dict[str, 'DefaultsNode'] = {}
+        self.additional: Optional['DefaultsNode'] = None  # Values of other keys
+        self.items: Optional['DefaultsNode'] = None
+
+    def is_empty(self) -> bool:
+        return (self.default is MISSING and not self.properties
+                and self.additional is None and self.items is None)
+
+    def has_children(self) -> bool:
+        return bool(self.properties) or self.additional is not None or self.items is not None
+
+    def merged(self, other: 'DefaultsNode') -> 'DefaultsNode':
+        """
+        Return a new node combining this one with another (defaults set here win).
+
+        Neither node is modified, since nodes reached through a $ref are shared.
+        """
+        node = DefaultsNode()
+        node.default = other.default if self.default is MISSING else self.default
+        node.properties = dict(self.properties)
+        for name, child in other.properties.items():
+            node.properties[name] = node.properties[name].merged(child) if name in node.properties else child
+        node.additional = _merged(self.additional, other.additional)
+        node.items = _merged(self.items, other.items)
+        return node
+
+
+def _merged(first: Optional[DefaultsNode], second: Optional[DefaultsNode]) -> Optional[DefaultsNode]:
+    if first is None or second is None:
+        return first or second
+    return first.merged(second)
+
+
+class _TreeBuilder:
+    def __init__(self, root: Any, registry: Optional[SchemaRegistry], base_uri: str):
+        self.root = root
+        self.registry = registry
+        self.refs: Dict[str, DefaultsNode] = {}
+        self.pending: Set[str] = set()
+
+    def resolve(self, ref: str, base_uri: str) -> Tuple[Optional[str], Any]:
+        if self.registry is not None:
+            return self.registry.resolve(ref, base_uri)
+        if ref.startswith('#'):
+            return base_uri + ref, resolve_pointer(self.root, ref[1:])
+        return None, None  # Remote reference without a registry
+
+    def build(self, schema: Any, base_uri: str) -> Optional[DefaultsNode]:
+        if not isinstance(schema, dict):
+            return None
+
+        if isinstance(schema.get('$ref'), str):
+            # Draft-07: keywords next to $ref are ignored
+            absolute, target = self.resolve(schema['$ref'], base_uri)
+            if absolute is None:
+                return None
+            if absolute in self.refs:
+                node = self.refs[absolute]
+                return node if absolute in self.pending or not node.is_empty() else None
+            # Register before building so recursive references (a tree of nodes) share the node
+            node = self.refs[absolute] = DefaultsNode()
+            self.pending.add(absolute)
+            built = self.build(target, urldefrag(absolute)[0])
+            self.pending.discard(absolute)
+            if built is not None:
+                for slot in DefaultsNode.__slots__:
+                    setattr(node, slot, getattr(built, slot))
+            return None if node.is_empty() else node
+
+        node = DefaultsNode()
+        if 'default' in schema:
+            node.default = schema['default']
+
+        properties = schema.get('properties')
+        if isinstance(properties, dict):
+            for name, subschema in properties.items():
+                child = self.build(subschema, base_uri)
+                if child is not None:
+                    node.properties[name] = child
+
+        if isinstance(schema.get('additionalProperties'), dict):
+            node.additional = self.build(schema['additionalProperties'], base_uri)
+
+        if isinstance(schema.get('items'), dict):
+            node.items = self.build(schema['items'], base_uri)
+
+        for subschema in schema.get('allOf') or []:
+            child = self.build(subschema, base_uri)
+            if child is not None:
+                node = node.merged(child)
+
+        return None if node.is_empty() else node
+
+
+def build_defaults_tree(schema: Any, registry: Optional[SchemaRegistry] = None,
+                        base_uri: str = '') -> Optional[DefaultsNode]:
+    """
+    Precompute the defaults tree of a schema.
+
+    Args:
+        schema: JSON Schema document
+        registry: Local schemas used to resolve references to other documents
+        base_uri: URI of the schema document (see SchemaRegistry.base_uri)
+
+    Returns:
+        Root DefaultsNode, or None if the schema declares no reachable defaults
+
+    Raises:
+        SchemaResolutionError: If a $ref points to a missing document or pointer
+    """
+    return _TreeBuilder(schema, registry, base_uri).build(schema, base_uri)
+
+
+def _copy(value: Any) -> Any:
+    # Documents must not share (and later mutate) the schema's containers
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def apply_defaults(data: Any, tree: Optional[DefaultsNode]) -> int:
+    """
+    Fill in missing properties from a defaults tree, in place.
+
+    Args:
+        data: Parsed document
+        tree: Tree from build_defaults_tree (None: nothing to apply)
+
+    Returns:
+        Number of values filled in
+    """
+    if tree is None:
+        return 0
+    applied = 0
+    if isinstance(data, dict):
+        for name, child in tree.properties.items():
+            if name not in data:
+                if child.default is MISSING:
+                    continue
+                data[name] = _copy(child.default)
+                applied += 1
+            if child.has_children():
+                applied += apply_defaults(data[name], child)
+        if tree.additional is not None and tree.additional.has_children():
+            for name, value in data.items():
+                if name not in tree.properties:
+                    applied += apply_defaults(value, tree.additional)
+    elif isinstance(data, list) and tree.items is not None:
+        for element in data:
+            applied += apply_defaults(element, tree.items)
+    return applied
+
+
+def iter_defaults(tree: Optional[DefaultsNode], path: str = '$',
+                  seen: Tuple[int, ...] = ()) -> Iterator[Tuple[str, Any]]:
+    """Yield (path, default) for every default in a tree, e.g. ('$.metadata.namespace', 'default')."""
+    if tree is None or id(tree) in seen:
+        return  # Recursive schemas: list each default once
+    seen += (id(tree),)
+    if tree.default is not MISSING:
+        yield path, tree.default
+    for name, child in tree.properties.items():
+        yield from iter_defaults(child, f"{path}.{name}", seen)
+    yield from iter_defaults(tree.additional, f"{path}.*", seen)
+    yield from iter_defaults(tree.items, f"{path}[*]", seen)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show the defaults a JSON Schema declares, or apply them to a JSON file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s schemas/kubernetes.schema.json
+  %(prog)s schemas/app-config.schema.json --apply config.json > config.full.json
+        """
+    )
+    parser.add_argument('schema', help='JSON Schema file')
+    parser.add_argument('--schema-dir', help='Resolve $ref against the schemas in this directory')
+    parser.add_argument('--apply', metavar='FILE', help='JSON file to fill in; printed to stdout')
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.schema, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        registry = SchemaRegistry(args.schema_dir) if args.schema_dir else None
+        base_uri = registry.base_uri(args.schema) if registry is not None else ''
+        tree = build_defaults_tree(schema, registry, base_uri)
+    except (OSError, json.JSONDecodeError, SchemaResolutionError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.apply:
+        try:
+            with open(args.apply, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        applied = apply_defaults(data, tree)
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(f"✓ {applied} default(s) applied", file=sys.stderr)
+        return 0
+
+    for path, default in iter_defaults(tree):
+        print(f"{path} = {json.dumps(default)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Kind-based Schema Dispatch
+
+Builds a table mapping (apiVersion, kind) to a schema file from the schemas
+in a directory, so a mixed directory of Kubernetes manifests can be
+validated in one pass: each document is parsed once and checked against
+the schema declared for its resource type.
+
+A schema takes part in dispatch when its top-level "kind" property has a
+"const" or "enum"; "apiVersion" is read the same way, and a schema that
+leaves apiVersion unconstrained matches the kind under any apiVersion.
+
+Used by validate_yaml.py and validate_json.py --dispatch.
+
+Usage:
+    python schema_dispatch.py schemas/
+    python schema_dispatch.py schemas/ --lookup apps/v1 Deployment
+
+Examples:
+    python schema_dispatch.py ../../schemas
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from schema_registry import SchemaRegistry
+
+# apiVersion of None matches any apiVersion
+DispatchKey = Tuple[Optional[str], str]
+
+
+def constrained_values(prop: Any) -> Optional[List[str]]:
+    """Return the string values a property schema allows via const/enum, or None."""
+    if not isinstance(prop, dict):
+        return None
+    if isinstance(prop.get('const'), str):
+        return [prop['const']]
+    if isinstance(prop.get('enum'), list):
+        return [value for value in prop['enum'] if isinstance(value, str)] or None
+    return None
+
+
+class SchemaDispatcher:
+    """Lookup table from (apiVersion, kind) to schema file path."""
+
+    def __init__(self, registry: SchemaRegistry):
+        """
+        Build the table from every schema indexed by a registry.
+
+        Args:
+            registry: Registry of the schema directory
+        """
+        self.table: Dict[DispatchKey, str] = {}
+        self.conflicts: List[str] = []
+
+        for uri, path in sorted(registry.paths.items(), key=lambda item: str(item[1])):
+            if not uri.startswith('file:'):
+                continue  # Same document under its $id
+            properties = registry.documents[uri].get('properties', {})
+            kinds = constrained_values(properties.get('kind'))
+            if not kinds:
+                continue
+            api_versions = constrained_values(properties.get('apiVersion')) or [None]
+
+            for api_version in api_versions:
+                for kind in kinds:
+                    key = (api_version, kind)
+                    if key in self.table:
+                        self.conflicts.append(
+                            f"{format_key(key)}: {path} ignored, already served by {self.table[key]}"
+                        )
+                        continue
+                    self.table[key] = str(path)
+
+    def schema_for(self, document: Any) -> Optional[str]:
+        """
+        Return the schema path for a document, or None if no schema applies.
+
+        Args:
+            document: Parsed YAML/JSON document
+        """
+        if not isinstance(document, dict):
+            return None
+        kind = document.get('kind')
+        if not isinstance(kind, str):
+            return None
+        api_version = document.get('apiVersion')
+        if isinstance(api_version, str) and (api_version, kind) in self.table:
+            return self.table[(api_version, kind)]
+        return self.table.get((None, kind))
+
+
+def format_key(key: DispatchKey) -> str:
+    api_version, kind = key
+    return f"{api_version or '*'} {kind}"
+
+
+def describe(document: Any) -> str:
+    """Short resource type label for messages, e.g. 'v1 ConfigMap'."""
+    if isinstance(document, dict) and isinstance(document.get('kind'), str):
+        return f"{document.get('apiVersion', '?')} {document['kind']}"
+    return type(document).__name__
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show the (apiVersion, kind) to schema dispatch table of a schema directory',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s schemas/
+  %(prog)s schemas/ --lookup apps/v1 Deployment
+        """
+    )
+    parser.add_argument('schema_dir', help='Directory containing JSON Schema files')
+    parser.add_argument('--lookup', nargs=2, metavar=('API_VERSION', 'KIND'),
+                        help='Print the schema selected for a resource type')
+
+    args = parser.parse_args()
+
+    dispatcher = SchemaDispatcher(SchemaRegistry(args.schema_dir))
+
+    if args.lookup:
+        api_version, kind = args.lookup
+        schema_path = dispatcher.schema_for({'apiVersion': api_version, 'kind': kind})
+        if schema_path is None:
+            print(f"No schema for {api_version} {kind}", file=sys.stderr)
+            return 1
+        print(schema_path)
+        return 0
+
+    for conflict in dispatcher.conflicts:
+        print(f"Warning: {conflict}", file=sys.stderr)
+    for key, schema_path in sorted(dispatcher.table.items(), key=lambda item: (item[0][1], item[0][0] or '')):
+        print(f"{format_key(key)} -> {schema_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Local Schema Registry
+
+Indexes every JSON Schema under a directory by its $id so that $ref lookups
+such as "https://example.com/schemas/kubernetes.schema.json#/properties/spec"
+are served from memory instead of the network. Resolved sub-schemas are
+cached, so each reference is resolved once per process no matter how many
+files are validated.
+
+Used by validate_json.py --schema-dir and by the schema compiler.
+
+Usage:
+    python schema_registry.py schemas/
+    python schema_registry.py schemas/ --resolve https://example.com/schemas/app-config.schema.json#/properties/app
+
+Examples:
+    python schema_registry.py ../../schemas
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from urllib.parse import unquote, urldefrag, urljoin
+
+try:
+    import referencing
+    import referencing.jsonschema
+    HAS_REFERENCING = True
+except ImportError:
+    HAS_REFERENCING = False
+
+
+class SchemaResolutionError(Exception):
+    """Raised when a $ref cannot be resolved from the local registry."""
+    pass
+
+
+def resolve_pointer(document: Any, fragment: str) -> Any:
+    """
+    Follow a JSON pointer fragment such as "/definitions/port" into a document.
+
+    Raises:
+        SchemaResolutionError: If the pointer does not exist
+    """
+    target = document
+    for part in filter(None, unquote(fragment).split('/')):
+        part = part.replace('~1', '/').replace('~0', '~')
+        try:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise SchemaResolutionError(f"Unresolvable JSON pointer: #{fragment}")
+    return target
+
+
+class SchemaRegistry:
+    """In-memory index of local schemas keyed by $id."""
+
+    def __init__(self, schema_dir: str):
+        """
+        Index every *.json schema under a directory.
+
+        Args:
+            schema_dir: Directory to scan recursively
+        """
+        self.schema_dir = Path(schema_dir)
+        self.documents: Dict[str, Any] = {}
+        self.paths: Dict[str, Path] = {}
+        self._resolved: Dict[str, Any] = {}
+        self._registry = None
+
+        digest = hashlib.sha256()
+        for path in sorted(self.schema_dir.rglob('*.json')):
+            raw = path.read_bytes()
+            try:
+                schema = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # Not a schema; data files may live alongside
+            if not isinstance(schema, dict):
+                continue
+
+            digest.update(path.name.encode() + b'\0' + raw)
+            # Every schema is reachable by file URI; those with $id by that too
+            self._register(path.resolve().as_uri(), schema, path)
+            if isinstance(schema.get('$id'), str):
+                self._register(schema['$id'], schema, path)
+
+        # Changes whenever any indexed schema changes (used for cache keys)
+        self.fingerprint = digest.hexdigest()[:16]
+
+    def _register(self, uri: str, schema: Any, path: Path) -> None:
+        uri = urldefrag(uri)[0]
+        self.documents[uri] = schema
+        self.paths[uri] = path
+
+    def base_uri(self, schema_path: str) -> str:
+        """Return the base URI of a schema file: its $id if indexed, else its file URI."""
+        file_uri = Path(schema_path).resolve().as_uri()
+        schema = self.documents.get(file_uri)
+        if isinstance(schema, dict) and isinstance(schema.get('$id'), str):
+            return urldefrag(schema['$id'])[0]
+        return file_uri
+
+    def document(self, uri: str) -> Any:
+        """Return the whole schema document registered under a URI."""
+        uri = urldefrag(uri)[0]
+        if uri not in self.documents:
+            raise SchemaResolutionError(f"No local schema with $id {uri} in {self.schema_dir}")
+        return self.documents[uri]
+
+    def resolve(self, ref: str, base_uri: str = '') -> Tuple[str, Any]:
+        """
+        Resolve a $ref against a base URI.
+
+        Args:
+            ref: Reference as written in the schema
+            base_uri: URI of the document containing the reference
+
+        Returns:
+            Tuple of (absolute_uri, subschema)
+
+        Raises:
+            SchemaResolutionError: If the document or pointer does not exist
+        """
+        absolute = urljoin(base_uri, ref)
+        if absolute in self._resolved:
+            return absolute, self._resolved[absolute]
+
+        document_uri, fragment = urldefrag(absolute)
+        try:
+            target = resolve_pointer(self.document(document_uri), fragment)
+        except SchemaResolutionError as e:
+            raise SchemaResolutionError(f"Unresolvable $ref {absolute}: {e}")
+
+        self._resolved[absolute] = target
+        return absolute, target
+
+    def validator_kwargs(self, schema: Any) -> Dict[str, Any]:
+        """
+        Keyword arguments that make a jsonschema validator resolve refs locally.
+
+        Returns registry= for jsonschema >= 4.18 and resolver= for older
+        versions; neither falls back to network retrieval.
+        """
+        if HAS_REFERENCING:
+            return {'registry': self.jsonschema_registry()}
+
+        import jsonschema
+        return {'resolver': jsonschema.RefResolver(
+            base_uri=schema.get('$id', '') if isinstance(schema, dict) else '',
+            referrer=schema,
+            store=dict(self.documents),
+        )}
+
+    def jsonschema_registry(self) -> Any:
+        """Build (once) a crawled referencing.Registry of every indexed schema."""
+        if self._registry is None:
+            draft7 = referencing.jsonschema.DRAFT7
+            resources = [
+                (uri, referencing.Resource.from_contents(schema, default_specification=draft7))
+                for uri, schema in self.documents.items()
+            ]
+            self._registry = referencing.Registry().with_resources(resources).crawl()
+        return self._registry
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Index local JSON Schemas by $id and resolve references offline',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s schemas/
+  %(prog)s schemas/ --resolve https://example.com/schemas/kubernetes.schema.json#/properties/metadata
+        """
+    )
+    parser.add_argument('schema_dir', help='Directory containing JSON Schema files')
+    parser.add_argument('--resolve', metavar='REF', help='Resolve a reference and print the sub-schema')
+
+    args = parser.parse_args()
+
+    if not Path(args.schema_dir).is_dir():
+        print(f"Error: Not a directory: {args.schema_dir}", file=sys.stderr)
+        return 1
+
+    registry = SchemaRegistry(args.schema_dir)
+
+    if args.resolve:
+        try:
+            uri, subschema = registry.resolve(args.resolve)
+        except SchemaResolutionError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(subschema, indent=2))
+        return 0
+
+    for uri, path in sorted(registry.paths.items()):
+        if not uri.startswith('file:'):
+            print(f"{uri} -> {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Secret Scanner Baseline
+
+Records the findings of check_secrets.py that were reviewed and accepted,
+so later scans only report new ones.
+
+A baseline file holds one fingerprint per line: the first 128 bits (32 hex
+digits) of the SHA-256 of the file path, the pattern name and the matched
+value. Line numbers are not part of it, so edits elsewhere in a file keep
+its findings known, while a changed value or a new file is reported again.
+The file never contains the secrets themselves.
+
+Baselines are loaded into a set, so checking a finding is one hash lookup
+instead of a comparison per entry. Baselines of more than SET_LIMIT
+fingerprints are loaded into a Bloom filter instead, which takes 6 bytes
+per fingerprint rather than ~100; a new finding is then wrongly suppressed
+with a probability of about 3e-7. The filter uses 8 hash positions rather
+than the memory-optimal 22, since setting bits is what makes loading slow.
+
+Usage:
+    python check_secrets.py . --baseline .secrets-baseline --update-baseline
+    python check_secrets.py . --baseline .secrets-baseline
+    python secret_baseline.py .secrets-baseline
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from typing import Iterable, Union
+
+# Hex digits of the SHA-256 kept per fingerprint
+FINGERPRINT_LENGTH = 32
+
+# Larger baselines are loaded into a Bloom filter
+SET_LIMIT = 1_000_000
+BLOOM_BITS_PER_ENTRY = 48
+BLOOM_HASHES = 8  # False positive rate (1 - e^(-8/48))^8, about 3e-7
+
+HEADER = (f"# check_secrets.py baseline: sha256(path, pattern, value)[:{FINGERPRINT_LENGTH}] "
+          f"per line\n")
+
+
+def fingerprint(path: str, secret_type: str, value: str) -> str:
+    """
+    Fingerprint one finding.
+
+    Args:
+        path: File path, relative to the directory the scan runs from
+            ('./a/b.yaml' and 'a/b.yaml' are the same file)
+        secret_type: Pattern name, e.g. 'password'
+        value: Matched value
+    """
+    path = os.path.normpath(path).replace(os.sep, '/')
+    data = '\0'.join((path, secret_type, value)).encode('utf-8', errors='surrogateescape')
+    return hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over fingerprints (hex strings)."""
+
+    def __init__(self, capacity: int, bits_per_entry: int = BLOOM_BITS_PER_ENTRY,
+                 hashes: int = BLOOM_HASHES):
+        self.size = max(capacity, 1) * bits_per_entry
+        self.hashes = hashes
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint: str) -> range:
+        # Fingerprints are already uniform hashes: split one into two halves
+        # and derive the k positions by double hashing (first + i * second)
+        value = int(fingerprint, 16)
+        first, second = value >> 64, (value & 0xFFFFFFFFFFFFFFFF) | 1
+        return range(first, first + self.hashes * second, second)
+
+    def add(self, fingerprint: str) -> None:
+        bits, size = self.bits, self.size
+        for position in self._positions(fingerprint):
+            position %= size
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        bits, size = self.bits, self.size
+        for position in self._positions(fingerprint):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+Baseline = Union[set, BloomFilter]
+
+
+def load(path: str) -> Baseline:
+    """
+    Load a baseline file.
+
+    Returns:
+        A set of fingerprints, or a BloomFilter for more than SET_LIMIT of them
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    # Estimated from the file size, so large baselines go straight into the
+    # filter without ever being held as a set
+    estimated = os.path.getsize(path) // (FINGERPRINT_LENGTH + 1)
+    baseline: Baseline = BloomFilter(estimated) if estimated > SET_LIMIT else set()
+    with open(path, 'r', encoding='ascii') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                baseline.add(line)
+    return baseline
+
+
+def write(path: str, fingerprints: Iterable[str]) -> int:
+    """Write fingerprints as a baseline file, sorted so diffs stay readable; returns the count."""
+    unique = sorted(set(fingerprints))
+    with open(path, 'w', encoding='ascii') as f:
+        f.write(HEADER)
+        f.writelines(f"{entry}\n" for entry in unique)
+    return len(unique)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show what a check_secrets.py baseline file holds',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s .secrets-baseline
+  %(prog)s .secrets-baseline --check config.yaml password 'hunter2'
+
+Create or refresh a baseline with:
+  check_secrets.py . --baseline .secrets-baseline --update-baseline
+        """
+    )
+    parser.add_argument('baseline', help='Baseline file')
+    parser.add_argument('--check', nargs=3, metavar=('PATH', 'PATTERN', 'VALUE'),
+                        help='Tell whether one finding is in the baseline')
+
+    args = parser.parse_args()
+
+    try:
+        baseline = load(args.baseline)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.check:
+        known = fingerprint(*args.check) in baseline
+        print(f"{'✓ known' if known else '✗ not in baseline'}: {' '.join(args.check[:2])}")
+        return 0 if known else 1
+
+    if isinstance(baseline, BloomFilter):
+        print(f"{args.baseline}: Bloom filter ({baseline.size} bits, {baseline.hashes} hashes)")
+    else:
+        print(f"{args.baseline}: {len(baseline)} fingerprint(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
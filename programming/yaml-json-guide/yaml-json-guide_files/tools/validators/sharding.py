@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Deterministic File Sharding
+
+Splits a file set into N shards balanced by file size, for running the
+validators on several CI machines in parallel with --shard K/N. The split
+depends only on the file paths and sizes, so every machine computes the
+same assignment regardless of argument or filesystem order.
+
+Files are assigned largest first to the currently lightest shard (longest
+processing time first), which keeps every shard within one file of the
+ideal share.
+
+Usage:
+    python sharding.py --shard 2/4 **/*.yaml
+    python sharding.py --summary 4 **/*.yaml
+
+Examples:
+    python validate_yaml.py **/*.yaml --shard $CI_NODE_INDEX/$CI_NODE_TOTAL
+"""
+
+import argparse
+import heapq
+import os
+import sys
+from typing import Iterable, List, Tuple
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a "K/N" shard specification (K is 1-based).
+
+    Raises:
+        argparse.ArgumentTypeError: If the specification is malformed
+    """
+    try:
+        index, total = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{spec}' (expected K/N, e.g. 1/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{spec}' (K must be between 1 and N)")
+    return index, total
+
+
+def file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0  # Missing files still get a shard so the error is reported once
+
+
+def assign_shards(paths: Iterable[str], total: int) -> List[List[str]]:
+    """
+    Split paths into `total` size-balanced shards.
+
+    Args:
+        paths: File paths (duplicates are ignored)
+        total: Number of shards
+
+    Returns:
+        List of shards, each a sorted list of paths
+    """
+    weighted = sorted(((file_size(p), p) for p in set(paths)), key=lambda item: (-item[0], item[1]))
+
+    # (bytes assigned, files assigned, shard index): ties go to the emptier, then lower shard
+    heap = [(0, 0, i) for i in range(total)]
+    shards: List[List[str]] = [[] for _ in range(total)]
+    for size, path in weighted:
+        load, count, index = heapq.heappop(heap)
+        shards[index].append(path)
+        heapq.heappush(heap, (load + size, count + 1, index))
+
+    return [sorted(shard) for shard in shards]
+
+
+def select_shard(paths: Iterable[str], shard: Tuple[int, int]) -> List[str]:
+    """Return the paths belonging to shard (K, N)."""
+    index, total = shard
+    return assign_shards(paths, total)[index - 1]
+
+
+def add_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --shard option to an argparse parser."""
+    parser.add_argument('--shard', type=parse_shard, metavar='K/N',
+                        help='Only process shard K of N (deterministic, balanced by file size)')
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Show how files are split into size-balanced shards',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --shard 2/4 **/*.yaml
+  %(prog)s --summary 4 **/*.yaml **/*.json
+        """
+    )
+    parser.add_argument('files', nargs='+', help='Files to split')
+    group = parser.add_mutually_exclusive_group(required=True)
+    add_argument(group)
+    group.add_argument('--summary', type=int, metavar='N', help='Print size and file count of N shards')
+
+    args = parser.parse_args()
+
+    if args.shard:
+        for path in select_shard(args.files, args.shard):
+            print(path)
+        return 0
+
+    if args.summary < 1:
+        parser.error("--summary must be at least 1")
+    for index, shard in enumerate(assign_shards(args.files, args.summary), start=1):
+        size = sum(file_size(p) for p in shard)
+        print(f"shard {index}/{args.summary}: {len(shard)} file(s), {size} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
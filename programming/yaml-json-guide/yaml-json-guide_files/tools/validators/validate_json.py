@@ -7,6 +7,16 @@ Validates JSON files for syntax errors and optionally validates against JSON Sch
 Usage:
     python validate_json.py file.json
     python validate_json.py file.json --schema schema.json
+    python validate_json.py file.json --schema schema.json --compiled
+    python validate_json.py file.json --schema schema.json --max-errors 20
+    python validate_json.py file.json --schema schema.json --schema-dir schemas/
+    python validate_json.py manifests/*.json --dispatch schemas/
+    python validate_json.py config/ --schema schema.json --watch
+    python validate_json.py export.json --schema users.schema.json --stream-array
+    python validate_json.py export.json --schema users.schema.json --columnar
+    python validate_json.py **/*.json --schema schema.json --shard 1/4
+    python validate_json.py **/*.json --schema schema.json --stats --stats-json stats.json
+    python validate_json.py config.json --schema schema.json --apply-defaults --defaults-output out/
     python validate_json.py file1.json file2.json
 
 Examples:
@@ -18,8 +28,14 @@ Examples:
 import argparse
 import json
 import sys
+import time
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, List, Tuple, Optional
+from typing import Any, Callable, Iterator, List, Tuple, Optional
+
+# Maps an instance path to (line, column); only called for invalid documents
+Locate = Optional[Callable[[Tuple], Optional[Tuple[int, int]]]]
 
 try:
     import jsonschema
@@ -27,6 +43,22 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    from yaml_locator import NodeLocator, format_location
+    HAS_LOCATOR = True
+except ImportError:
+    HAS_LOCATOR = False  # PyYAML not installed: errors are reported without positions
+
+import file_stats
+from columnar import extend_validator
+from file_watcher import is_within, iter_watched_files, watch
+from json_stream import StreamDecodeError, iter_json_array
+from schema_compiler import SchemaCompileError, load_compiled_validator
+from schema_defaults import DefaultsNode, apply_defaults, build_defaults_tree
+from schema_dispatch import SchemaDispatcher, describe
+from schema_registry import SchemaRegistry
+from sharding import add_argument as add_shard_argument, select_shard
+
 
 def load_json(file_path: str) -> Tuple[bool, Any, str]:
     """
@@ -47,8 +79,11 @@ def load_json(file_path: str) -> Tuple[bool, Any, str]:
         return False, None, f"Not a file: {file_path}"
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with file_stats.phase('read'):
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        with file_stats.phase('parse'):
+            data = json.loads(content)
         return True, data, "Valid JSON"
 
     except json.JSONDecodeError as e:
@@ -59,39 +94,391 @@ def load_json(file_path: str) -> Tuple[bool, Any, str]:
         return False, None, f"Unexpected error: {e}"
 
 
-def validate_against_schema(data: Any, schema_path: str) -> Tuple[bool, str]:
+@lru_cache(maxsize=None)
+def load_schema(schema_path: str) -> Any:
+    """Load a JSON Schema file once per process."""
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def format_path(path: Any) -> str:
+    """Format an instance path such as ('spec', 'containers', 0) as $.spec.containers[0]."""
+    parts = ['$']
+    for part in path:
+        parts.append(f"[{part}]" if isinstance(part, int) else f".{part}")
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def get_registry(schema_dir: Optional[str]) -> Optional[SchemaRegistry]:
+    """Index a schema directory once per process (None when no directory is given)."""
+    return SchemaRegistry(schema_dir) if schema_dir else None
+
+
+@lru_cache(maxsize=None)
+def get_dispatcher(schema_dir: str) -> SchemaDispatcher:
+    """Build the (apiVersion, kind) dispatch table of a schema directory once per process."""
+    return SchemaDispatcher(get_registry(schema_dir))
+
+
+@lru_cache(maxsize=None)
+def get_defaults_tree(schema_path: str, schema_dir: Optional[str] = None) -> Optional[DefaultsNode]:
+    """Precompute the defaults tree of a schema file once per process."""
+    registry = get_registry(schema_dir)
+    base_uri = registry.base_uri(schema_path) if registry is not None else ''
+    return build_defaults_tree(load_schema(schema_path), registry, base_uri)
+
+
+def fill_defaults(data: Any, schema_path: Optional[str] = None,
+                  dispatch_dir: Optional[str] = None,
+                  schema_dir: Optional[str] = None) -> int:
+    """
+    Apply schema defaults to parsed data in place.
+
+    Args:
+        data: Parsed JSON data
+        schema_path: Schema whose defaults apply to the whole document
+        dispatch_dir: Instead, pick each resource's schema by apiVersion and kind
+            (a top-level array is a list of resources)
+        schema_dir: Directory of local schemas used to resolve $ref
+
+    Returns:
+        Number of values filled in
+    """
+    if dispatch_dir is None:
+        return apply_defaults(data, get_defaults_tree(schema_path, schema_dir)) if schema_path else 0
+
+    dispatcher = get_dispatcher(dispatch_dir)
+    applied = 0
+    for document in (data if isinstance(data, list) else [data]):
+        document_schema = dispatcher.schema_for(document)
+        if document_schema is not None:
+            applied += apply_defaults(document, get_defaults_tree(document_schema, schema_dir))
+    return applied
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema_path: str, schema_dir: Optional[str] = None, columnar: bool = False) -> Any:
+    """Build a jsonschema validator for a schema file once per process."""
+    schema = load_schema(schema_path)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    if columnar:
+        validator_class = extend_validator(validator_class)
+
+    registry = get_registry(schema_dir)
+    if registry is None:
+        return validator_class(schema)
+    return validator_class(schema, **registry.validator_kwargs(schema))
+
+
+def clear_schema_caches() -> None:
+    """Forget every loaded schema, registry and validator (e.g. after a schema file changed)."""
+    for cached in (load_schema, get_registry, get_dispatcher, get_defaults_tree, get_validator):
+        cached.cache_clear()
+
+
+def iter_schema_errors(data: Any, schema_path: str, compiled: bool = False,
+                       cache_dir: Optional[str] = None,
+                       schema_dir: Optional[str] = None,
+                       columnar: bool = False) -> Iterator[Tuple[Tuple, str]]:
+    """
+    Lazily yield schema violations, computing each one only when requested.
+
+    Args:
+        data: Parsed JSON data
+        schema_path: Path to JSON Schema file
+        compiled: Use the cached compiled validator instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        schema_dir: Directory of local schemas used to resolve $ref
+        columnar: Check large arrays of records column by column (jsonschema only)
+
+    Yields:
+        Tuples of (instance_path, error_message)
+    """
+    if compiled:
+        try:
+            validator = load_compiled_validator(schema_path, cache_dir=cache_dir,
+                                                registry=get_registry(schema_dir))
+        except SchemaCompileError:
+            validator = None  # Fall back to jsonschema for unsupported features
+
+        if validator is not None:
+            yield from validator.iter_errors(data)
+            return
+
+    for error in get_validator(schema_path, schema_dir, columnar).iter_errors(data):
+        yield tuple(error.absolute_path), error.message
+
+
+def format_where(path: Tuple, locate: Locate = None) -> str:
+    """Format an instance path, followed by its line and column when locate is given."""
+    if locate is None:
+        return format_path(path)
+    return format_path(path) + format_location(locate(path))
+
+
+def format_schema_errors(errors: List[Tuple[Tuple, str]], limit: int, locate: Locate = None) -> str:
+    """Format collected schema errors, noting when collection stopped early."""
+    if len(errors) == 1 or limit == 1:
+        path, message = errors[0]
+        return f"Schema validation error at {format_where(path, locate)}: {message}"
+
+    shown = errors[:limit]
+    count = f"{len(shown)}+" if len(errors) > limit else str(len(shown))
+    lines = [f"{count} schema validation errors:"]
+    lines.extend(f"    {format_where(path, locate)}: {message}" for path, message in shown)
+    if len(errors) > limit:
+        lines.append(f"    (stopped after {limit} errors)")
+    return "\n".join(lines)
+
+
+def validate_against_schema(data: Any, schema_path: str, compiled: bool = False,
+                            cache_dir: Optional[str] = None,
+                            max_errors: Optional[int] = None,
+                            schema_dir: Optional[str] = None,
+                            locate: Locate = None,
+                            columnar: bool = False) -> Tuple[bool, str]:
     """
     Validate JSON data against a schema.
 
+    By default the most relevant error is reported, which requires computing
+    every error first. With max_errors set, errors are produced lazily and
+    collection stops after max_errors, so max_errors=1 is the cheapest check.
+
+    Positions are not tracked while loading; locate is only called for the
+    errors being reported, so valid data never pays for it.
+
     Args:
         data: Parsed JSON data
         schema_path: Path to JSON Schema file
+        compiled: Use the cached compiled validator instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        max_errors: Stop after this many errors (None: report the best match)
+        schema_dir: Directory of local schemas used to resolve $ref
+        locate: Optional function mapping an instance path to (line, column)
+        columnar: Check large arrays of records column by column (jsonschema only)
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not HAS_JSONSCHEMA:
+    if not compiled and not HAS_JSONSCHEMA:
         return False, "jsonschema library not installed. Run: pip install jsonschema"
 
     try:
-        # Load schema
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-
-        # Validate
-        jsonschema.validate(instance=data, schema=schema)
-        return True, "Valid against schema"
+        if max_errors is None and not compiled:
+            validator = get_validator(schema_path, schema_dir, columnar)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+            if error is None:
+                return True, "Valid against schema"
+            where = f" at {format_where(tuple(error.absolute_path), locate)}" if locate is not None else ""
+            return False, f"Schema validation error{where}: {error.message}"
+
+        limit = max_errors or 1
+        # Fetch one extra error to know whether the output was truncated
+        fetch = limit + 1 if limit > 1 else 1
+        errors = list(islice(iter_schema_errors(data, schema_path, compiled, cache_dir, schema_dir,
+                                                columnar),
+                             fetch))
+        if not errors:
+            return True, "Valid against schema"
+        return False, format_schema_errors(errors, limit, locate)
 
     except json.JSONDecodeError as e:
         return False, f"Invalid schema JSON: {e}"
-    except jsonschema.ValidationError as e:
-        return False, f"Schema validation error: {e.message}"
-    except jsonschema.SchemaError as e:
-        return False, f"Invalid schema: {e.message}"
+    except OSError as e:
+        return False, f"Cannot read schema: {e}"
     except Exception as e:
+        if HAS_JSONSCHEMA and isinstance(e, jsonschema.SchemaError):
+            return False, f"Invalid schema: {e.message}"
         return False, f"Schema validation error: {e}"
 
 
+def validate_dispatched(data: Any, dispatch_dir: str, compiled: bool = False,
+                        cache_dir: Optional[str] = None,
+                        max_errors: Optional[int] = None,
+                        locate: Locate = None,
+                        columnar: bool = False,
+                        schema_dir: Optional[str] = None) -> Tuple[bool, str]:
+    """
+    Validate each resource against the schema selected by its apiVersion and kind.
+
+    A top-level array is treated as a list of resources. Resources whose
+    type has no schema in dispatch_dir are skipped.
+
+    Args:
+        data: Parsed JSON data
+        dispatch_dir: Directory whose schemas form the dispatch table
+        compiled: Use the cached compiled validators instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        max_errors: Per-resource error limit; 1 also stops at the first invalid resource
+        locate: Optional function mapping an instance path of data to (line, column)
+        columnar: Check large arrays of records column by column (jsonschema only)
+        schema_dir: Directory of local schemas used to resolve $ref
+            (default: dispatch_dir)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    dispatcher = get_dispatcher(dispatch_dir)
+    schema_dir = schema_dir or dispatch_dir
+    documents = data if isinstance(data, list) else [data]
+    failures = []
+    checked = 0
+
+    for index, document in enumerate(documents):
+        schema_path = dispatcher.schema_for(document)
+        if schema_path is None:
+            continue
+        checked += 1
+        document_locate = locate
+        if locate is not None and isinstance(data, list):
+            document_locate = lambda path, index=index: locate((index,) + tuple(path))
+        schema_valid, message = validate_against_schema(
+            document, schema_path, compiled=compiled, cache_dir=cache_dir,
+            max_errors=max_errors, schema_dir=schema_dir, locate=document_locate,
+            columnar=columnar
+        )
+        if not schema_valid:
+            label = f"item[{index}] ({describe(document)})" if isinstance(data, list) else describe(document)
+            failures.append(f"{label}: {message}")
+            if max_errors == 1:
+                break
+
+    if failures:
+        return False, "\n  ".join(failures)
+    skipped = len(documents) - checked
+    suffix = f", {skipped} without a schema" if skipped else ""
+    return True, f"Valid ({checked} resource(s) valid against their schema{suffix})"
+
+
+def item_error_checker(schema_path: str, compiled: bool = False,
+                       cache_dir: Optional[str] = None,
+                       schema_dir: Optional[str] = None) -> Callable[[Any], Iterator[Tuple[Tuple, str]]]:
+    """
+    Return a function yielding the schema errors of one element of a top-level array.
+
+    The element is checked against the schema's "items" sub-schema, with
+    references still resolved relative to the whole schema.
+    """
+    if compiled:
+        try:
+            module = load_compiled_validator(schema_path, cache_dir=cache_dir,
+                                             registry=get_registry(schema_dir), entry='/items')
+            return module.iter_errors
+        except SchemaCompileError:
+            pass  # Fall back to jsonschema for unsupported features
+
+    validator = get_validator(schema_path, schema_dir)
+    items = load_schema(schema_path).get('items', True)
+
+    def check(element: Any) -> Iterator[Tuple[Tuple, str]]:
+        for error in validator.descend(element, items):
+            yield tuple(error.relative_path), error.message
+
+    return check
+
+
+def validate_array_stream(file_path: str, schema_path: Optional[str] = None,
+                          compiled: bool = False, cache_dir: Optional[str] = None,
+                          max_errors: Optional[int] = None,
+                          schema_dir: Optional[str] = None) -> Tuple[bool, str]:
+    """
+    Validate a top-level JSON array element by element while it is parsed.
+
+    Memory use is bounded by the largest element, not the array length.
+    Only the schema's "items", "minItems" and "maxItems" keywords apply at
+    the top level; keywords needing the whole array (uniqueItems, contains)
+    are not checked.
+
+    Args:
+        file_path: Path to JSON file whose top-level value is an array
+        schema_path: Path to JSON Schema file (None: syntax check only)
+        compiled: Use the cached compiled validator instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        max_errors: Stop after this many errors across all elements (default 1)
+        schema_dir: Directory of local schemas used to resolve $ref
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        return False, f"File not found: {file_path}"
+
+    if not path.is_file():
+        return False, f"Not a file: {file_path}"
+
+    limit = max_errors or 1
+    errors: List[Tuple[Tuple, str]] = []
+    count = 0
+
+    try:
+        check = None
+        schema = {}
+        if schema_path:
+            if not compiled and not HAS_JSONSCHEMA:
+                return False, "jsonschema library not installed. Run: pip install jsonschema"
+            schema = load_schema(schema_path)
+            if isinstance(schema.get('items'), list):
+                return False, "Streaming validation needs a single 'items' schema, not a list"
+            check = item_error_checker(schema_path, compiled, cache_dir, schema_dir)
+
+        # Reading and parsing are interleaved, so both count as 'parse'
+        with file_stats.phase('parse'), open(path, 'r', encoding='utf-8') as f:
+            for index, element in iter_json_array(f):
+                count += 1
+                if check is None:
+                    continue
+                with file_stats.phase('validate'):
+                    for item_path, message in islice(check(element), limit - len(errors)):
+                        errors.append(((index,) + tuple(item_path), message))
+                if len(errors) >= limit:
+                    break
+
+        if len(errors) < limit and 'minItems' in schema and count < schema['minItems']:
+            errors.append(((), f"array has {count} items, fewer than minItems {schema['minItems']}"))
+        if len(errors) < limit and 'maxItems' in schema and count > schema['maxItems']:
+            errors.append(((), f"array has {count} items, more than maxItems {schema['maxItems']}"))
+
+    except StreamDecodeError as e:
+        return False, f"JSON syntax error at line {e.lineno}, column {e.colno} (item {e.index}): {e.msg}"
+    except json.JSONDecodeError as e:
+        return False, f"Invalid schema JSON: {e}"
+    except UnicodeDecodeError as e:
+        return False, f"Encoding error: {e}"
+    except Exception as e:
+        return False, f"Unexpected error: {e}"
+
+    if errors:
+        return False, format_schema_errors(errors, limit)
+    if schema_path:
+        return True, f"Valid JSON array ({count} items valid against schema)"
+    return True, f"Valid JSON array ({count} items)"
+
+
+def report_results(results: List[Tuple[str, bool, str]], quiet: bool = False) -> bool:
+    """Print per-file results and a summary; return True if every file is valid."""
+    all_valid = all(is_valid for _, is_valid, _ in results)
+
+    # Print results
+    for file_path, is_valid, message in results:
+        if is_valid:
+            if not quiet:
+                print(f"✓ {file_path}: {message}")
+        else:
+            print(f"✗ {file_path}: {message}", file=sys.stderr)
+
+    # Summary
+    if len(results) > 1:
+        valid_count = sum(1 for _, is_valid, _ in results if is_valid)
+        total_count = len(results)
+        print(f"\n{valid_count}/{total_count} files valid", file=sys.stderr if not all_valid else sys.stdout)
+
+    return all_valid
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -102,51 +489,173 @@ Examples:
   %(prog)s config.json
   %(prog)s file1.json file2.json
   %(prog)s data.json --schema schema.json
+  %(prog)s data.json --schema schema.json --compiled
+  %(prog)s **/*.json --schema schema.json --shard 2/4
+  %(prog)s **/*.json --schema schema.json --fail-fast
+  %(prog)s data.json --schema schema.json --max-errors 50
+  %(prog)s data.json --schema schemas/app.json --schema-dir schemas/
+  %(prog)s manifests/*.json --dispatch schemas/ --compiled
   %(prog)s **/*.json --quiet
+  %(prog)s config/ --schema schema.json --compiled --watch
+  %(prog)s export.json --schema users.schema.json --stream-array --max-errors 100
+  %(prog)s export.json --schema users.schema.json --columnar
+  %(prog)s **/*.json --schema schema.json --stats --stats-top 5 --stats-json stats.json
+  %(prog)s config.json --schema schemas/app-config.schema.json --apply-defaults --defaults-output out/
         """
     )
     parser.add_argument('files', nargs='+', help='JSON files to validate')
-    parser.add_argument('--schema', help='JSON Schema file for validation')
+    schema_group = parser.add_mutually_exclusive_group()
+    schema_group.add_argument('--schema', help='JSON Schema file for validation')
+    schema_group.add_argument('--dispatch', metavar='SCHEMA_DIR',
+                              help='Validate each resource against the schema in SCHEMA_DIR '
+                                   'declared for its apiVersion and kind')
+    parser.add_argument('--compiled', action='store_true',
+                        help='Validate with a compiled schema module (cached on disk)')
+    parser.add_argument('--schema-cache', help='Directory for compiled schema modules')
+    parser.add_argument('--schema-dir',
+                        help='Resolve $ref against the schemas in this directory (offline)')
+    errors_group = parser.add_mutually_exclusive_group()
+    errors_group.add_argument('--fail-fast', action='store_true',
+                              help='Stop at the first schema error in the first invalid file')
+    errors_group.add_argument('--max-errors', type=int, metavar='N',
+                              help='Report up to N schema errors per file')
+    parser.add_argument('--stream-array', action='store_true',
+                        help="Parse a top-level array incrementally, validating each element "
+                             "against the schema's 'items' (constant memory)")
+    parser.add_argument('--columnar', action='store_true',
+                        help='Check large arrays of flat records column by column, re-checking '
+                             'only failing rows record by record')
+    parser.add_argument('--apply-defaults', action='store_true',
+                        help="Fill in missing properties from the schema's 'default' values "
+                             "before validating")
+    parser.add_argument('--defaults-output', metavar='DIR',
+                        help='With --apply-defaults, write each completed file to DIR')
     parser.add_argument('--quiet', action='store_true', help='Only show errors')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and revalidate files (or directories) as they change; '
+                             'a changed schema revalidates every file')
+    parser.add_argument('--poll', action='store_true', help='With --watch, poll instead of using inotify')
+    add_shard_argument(parser)
+    file_stats.add_arguments(parser)
 
     args = parser.parse_args()
 
-    if args.schema and not HAS_JSONSCHEMA:
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    if args.shard and args.watch:
+        parser.error("--shard cannot be combined with --watch")
+    if args.dispatch and args.stream_array:
+        parser.error("--dispatch cannot be combined with --stream-array")
+    if args.columnar and (args.compiled or args.stream_array):
+        parser.error("--columnar cannot be combined with --compiled or --stream-array")
+    if args.apply_defaults and not (args.schema or args.dispatch):
+        parser.error("--apply-defaults requires --schema or --dispatch")
+    if args.apply_defaults and args.stream_array:
+        parser.error("--apply-defaults cannot be combined with --stream-array")
+    if args.defaults_output and not args.apply_defaults:
+        parser.error("--defaults-output requires --apply-defaults")
+    max_errors = 1 if args.fail_fast else args.max_errors
+    schema_dir = args.schema_dir or args.dispatch
+
+    if (args.schema or args.dispatch) and not args.compiled and not HAS_JSONSCHEMA:
         print("Warning: jsonschema not installed. Schema validation disabled.", file=sys.stderr)
         print("Install with: pip install jsonschema", file=sys.stderr)
 
-    all_valid = True
-    results = []
+    def check(file_path: str) -> Tuple[bool, str]:
+        with file_stats.track_file(file_path):
+            return check_file(file_path)
+
+    def check_file(file_path: str) -> Tuple[bool, str]:
+        if args.stream_array:
+            return validate_array_stream(
+                file_path, args.schema, compiled=args.compiled, cache_dir=args.schema_cache,
+                max_errors=max_errors, schema_dir=schema_dir
+            )
 
-    for file_path in args.files:
         # Validate JSON syntax
         is_valid, data, message = load_json(file_path)
 
+        # Positions are recovered by reparsing, and only for files that fail
+        locate = NodeLocator(file_path).locator() if HAS_LOCATOR else None
+
+        applied = 0
+        if is_valid and args.apply_defaults:
+            with file_stats.phase('defaults'):
+                try:
+                    applied = fill_defaults(data, args.schema, args.dispatch, schema_dir)
+                except Exception as e:
+                    return False, f"Cannot apply schema defaults: {e}"
+
         # Validate against schema if provided
-        if is_valid and args.schema and HAS_JSONSCHEMA:
-            schema_valid, schema_message = validate_against_schema(data, args.schema)
+        if is_valid and args.dispatch and (HAS_JSONSCHEMA or args.compiled):
+            with file_stats.phase('validate'):
+                is_valid, message = validate_dispatched(
+                    data, args.dispatch, compiled=args.compiled, cache_dir=args.schema_cache,
+                    max_errors=max_errors, locate=locate, columnar=args.columnar,
+                    schema_dir=schema_dir
+                )
+        elif is_valid and args.schema and (HAS_JSONSCHEMA or args.compiled):
+            with file_stats.phase('validate'):
+                schema_valid, schema_message = validate_against_schema(
+                    data, args.schema, compiled=args.compiled, cache_dir=args.schema_cache,
+                    max_errors=max_errors, schema_dir=schema_dir, locate=locate,
+                    columnar=args.columnar
+                )
             if not schema_valid:
                 is_valid = False
                 message = schema_message
 
+        if is_valid and args.apply_defaults:
+            message = f"{message}, {applied} default(s) applied"
+            if args.defaults_output:
+                with file_stats.phase('write'):
+                    output_path = Path(args.defaults_output) / Path(file_path).name
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + '\n',
+                                           encoding='utf-8')
+
+        return is_valid, message
+
+    stats = file_stats.enable_from_args(args, 'validate_json.py')
+
+    if args.watch:
+        files = iter_watched_files(args.files, ('.json',))
+    else:
+        files = args.files
+    if args.shard:
+        files = select_shard(files, args.shard)
+
+    all_valid = True
+    results = []
+
+    for file_path in files:
+        is_valid, message = check(file_path)
         results.append((file_path, is_valid, message))
 
         if not is_valid:
             all_valid = False
-
-    # Print results
-    for file_path, is_valid, message in results:
-        if is_valid:
-            if not args.quiet:
-                print(f"✓ {file_path}: {message}")
-        else:
-            print(f"✗ {file_path}: {message}", file=sys.stderr)
-
-    # Summary
-    if len(results) > 1:
-        valid_count = sum(1 for _, is_valid, _ in results if is_valid)
-        total_count = len(results)
-        print(f"\n{valid_count}/{total_count} files valid", file=sys.stderr if not all_valid else sys.stdout)
+            if args.fail_fast:
+                break
+
+    report_results(results, quiet=args.quiet)
+    file_stats.finish(stats, args)
+
+    if args.watch:
+        schema_paths = [path for path in (args.schema, args.dispatch, args.schema_dir) if path]
+
+        def revalidate(changed: List[str]) -> None:
+            start = time.perf_counter()
+            if any(is_within(path, schema_paths) for path in changed):
+                # Validators are cached per schema: rebuild them and recheck everything
+                clear_schema_caches()
+                print(f"\n--- {time.strftime('%H:%M:%S')} schema changed ---")
+                changed = iter_watched_files(args.files, ('.json',))
+            else:
+                print(f"\n--- {time.strftime('%H:%M:%S')} {len(changed)} file(s) changed ---")
+            report_results([(path, *check(path)) for path in changed], quiet=args.quiet)
+            print(f"(revalidated in {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+        return watch(args.files + schema_paths, revalidate, ('.json',), force_polling=args.poll)
 
     return 0 if all_valid else 1
 
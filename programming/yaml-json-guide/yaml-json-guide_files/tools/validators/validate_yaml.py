@@ -2,21 +2,33 @@
 """
 YAML Validator
 
-Validates YAML files for syntax errors and common issues.
+Validates YAML files for syntax errors and common issues, and optionally
+validates every document of a multi-document stream against a JSON Schema.
 
 Usage:
     python validate_yaml.py file.yaml
     python validate_yaml.py file1.yaml file2.yaml file3.yaml
+    python validate_yaml.py bundle.yaml --schema schema.json
+    python validate_yaml.py k8s/ --dispatch schemas/
+    python validate_yaml.py config/ --watch
+    python validate_yaml.py **/*.yaml --lint
+    python validate_yaml.py broken.yaml --all-errors
+    python validate_yaml.py **/*.yaml --audit-types
+    python validate_yaml.py k8s/ --dispatch schemas/ --core-schema
+    python validate_yaml.py **/*.yaml --shard 1/4
+    python validate_yaml.py **/*.yaml --stats --stats-json stats.json
 
 Examples:
     python validate_yaml.py config.yaml
     python validate_yaml.py **/*.yaml
+    python validate_yaml.py k8s/*.yaml --schema schemas/kubernetes.schema.json
 """
 
 import argparse
 import sys
+import time
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import yaml
@@ -24,14 +36,85 @@ except ImportError:
     print("Error: PyYAML is not installed. Run: pip install PyYAML", file=sys.stderr)
     sys.exit(1)
 
+import file_stats
+from file_watcher import is_within, iter_watched_files, watch
+from schema_dispatch import SchemaDispatcher, describe
+from sharding import add_argument as add_shard_argument, select_shard
+from validate_json import HAS_JSONSCHEMA, clear_schema_caches, get_dispatcher, validate_against_schema
+from yaml_core_schema import core_schema_loader, safe_loader
+from yaml_lint import Linter, LintingLoader, format_problems, has_errors, iter_linted_documents, load_config
+from yaml_locator import NodeLocator
+from yaml_recovery import find_syntax_errors
+from yaml_type_audit import audit_content, format_findings
 
-def validate_yaml_file(file_path: str, strict: bool = False) -> Tuple[bool, str]:
+
+def lint_summary(message: str, problems: List[Any]) -> Tuple[bool, str]:
+    """Append lint problems to a success message; lint errors make the file invalid."""
+    if not problems:
+        return True, message
+    if has_errors(problems):
+        return False, f"{len(problems)} lint problem(s):\n{format_problems(problems)}"
+    return True, f"{message}, {len(problems)} lint warning(s):\n{format_problems(problems)}"
+
+
+def linting_loader(core_schema: bool = False) -> type:
+    """Loader class for linted parsing, optionally with the YAML 1.2 core schema."""
+    return core_schema_loader(LintingLoader) if core_schema else LintingLoader
+
+
+def python_loader_error(error: yaml.YAMLError, content: str, core_schema: bool = False) -> yaml.YAMLError:
+    """
+    Return the error the pure-Python loader reports for the same text.
+
+    libyaml's errors carry no source snippet and are sometimes worded
+    differently ("did not find expected ',' or ']'"), so failed text is
+    parsed again with yaml.SafeLoader; valid files never pay for it.
+    """
+    mark = getattr(error, 'problem_mark', None)
+    if mark is None or mark.get_snippet() is not None:
+        return error  # Already from the pure-Python loader
+    loader = core_schema_loader(yaml.SafeLoader) if core_schema else yaml.SafeLoader
+    try:
+        for _ in yaml.load_all(content, Loader=loader):
+            pass
+    except yaml.YAMLError as e:
+        return e
+    return error
+
+
+def format_syntax_error(error: yaml.YAMLError, content: str, all_errors: bool = False,
+                        core_schema: bool = False) -> str:
+    """Describe a syntax error; with all_errors, rescan the file to list every error."""
+    if all_errors:
+        problems = find_syntax_errors(content)
+        if len(problems) > 1:
+            return f"{len(problems)} YAML syntax errors:\n" + "\n".join(f"    {p}" for p in problems)
+    return f"YAML syntax error: {python_loader_error(error, content, core_schema)}"
+
+
+def audit_message(content: str) -> Optional[str]:
+    """Describe implicit type conversions in YAML text, or None if there are none."""
+    findings = audit_content(content)
+    if not findings:
+        return None
+    return f"{len(findings)} implicit type conversion(s):\n{format_findings(findings)}"
+
+
+def validate_yaml_file(file_path: str, strict: bool = False,
+                       lint_config: Optional[Dict[str, Any]] = None,
+                       all_errors: bool = False,
+                       audit_types: bool = False,
+                       core_schema: bool = False) -> Tuple[bool, str]:
     """
     Validate a YAML file.
 
     Args:
         file_path: Path to YAML file
         strict: Enable strict validation
+        lint_config: Lint rules to apply in the same scanner pass (None: no linting)
+        all_errors: On a syntax error, recover and report every syntax error
+        audit_types: Fail on unquoted values YAML 1.1 turns into booleans, numbers or dates
+        core_schema: Resolve plain scalars with the YAML 1.2 core schema
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -45,30 +128,181 @@ def validate_yaml_file(file_path: str, strict: bool = False) -> Tuple[bool, str]
         return False, f"Not a file: {file_path}"
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with file_stats.phase('read'):
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
         # Check for tabs (common error)
         if '\t' in content:
             lines_with_tabs = [i+1 for i, line in enumerate(content.split('\n')) if '\t' in line]
             return False, f"Tabs found in lines: {lines_with_tabs} (YAML requires spaces only)"
 
-        # Parse YAML
-        data = yaml.safe_load(content)
+        # Parse YAML (every document of a multi-document stream)
+        linter = Linter(lint_config) if lint_config is not None else None
+        with file_stats.phase('parse'):
+            if linter is None:
+                documents = list(yaml.load_all(content, Loader=safe_loader(core_schema)))
+            else:
+                documents = list(iter_linted_documents(content, linter, linting_loader(core_schema)))
 
         # Strict checks
-        if strict and data is None:
+        if strict and all(document is None for document in documents):
             return False, "File is empty or contains only comments"
 
+        if audit_types:
+            with file_stats.phase('audit'):
+                message = audit_message(content)
+            if message:
+                return False, message
+
+        if linter is not None:
+            return lint_summary("Valid YAML", linter.sorted_problems())
         return True, "Valid YAML"
 
     except yaml.YAMLError as e:
-        return False, f"YAML syntax error: {e}"
+        message = format_syntax_error(e, content, all_errors, core_schema)
+        if linter is not None and linter.problems:
+            return False, f"{message}\n{format_problems(linter.sorted_problems())}"
+        return False, message
+    except UnicodeDecodeError as e:
+        return False, f"Encoding error: {e}"
+    except Exception as e:
+        return False, f"Unexpected error: {e}"
+
+
+def validate_yaml_stream(file_path: str, schema_path: Optional[str], compiled: bool = False,
+                         cache_dir: Optional[str] = None,
+                         max_errors: Optional[int] = None,
+                         schema_dir: Optional[str] = None,
+                         dispatcher: Optional[SchemaDispatcher] = None,
+                         lint_config: Optional[Dict[str, Any]] = None,
+                         all_errors: bool = False,
+                         audit_types: bool = False,
+                         core_schema: bool = False) -> Tuple[bool, str]:
+    """
+    Validate each document of a YAML stream against a JSON Schema.
+
+    Documents are validated as soon as they are parsed and released before
+    the next one is read, so memory is bounded by the largest document.
+    Loading uses the fast loader without positions; only if a document fails
+    is the file composed again to report the line and column of each error.
+    With lint_config the whole file is read first, since line rules need the
+    text, and linting happens in the same scanner pass as loading.
+
+    Args:
+        file_path: Path to YAML file (may contain several documents)
+        schema_path: Path to JSON Schema file (ignored when dispatcher is given)
+        compiled: Use the cached compiled validator instead of jsonschema
+        cache_dir: Compiled schema cache directory
+        max_errors: Per-document error limit; 1 also stops at the first invalid document
+        schema_dir: Directory of local schemas used to resolve $ref
+        dispatcher: Pick each document's schema by apiVersion and kind; documents
+            without a matching schema are skipped
+        lint_config: Lint rules to apply while loading (None: no linting)
+        all_errors: On a syntax error, recover and report every syntax error
+        audit_types: Fail on unquoted values YAML 1.1 turns into booleans, numbers or dates
+        core_schema: Resolve plain scalars with the YAML 1.2 core schema
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        return False, f"File not found: {file_path}"
+
+    if not path.is_file():
+        return False, f"Not a file: {file_path}"
+
+    failures = []
+    count = 0
+    skipped = 0
+    locator = NodeLocator(file_path)  # Composes the file on first use only
+    linter = Linter(lint_config) if lint_config is not None else None
+
+    try:
+        # Reading and parsing are interleaved, so both count as 'parse'
+        with file_stats.phase('parse'), open(path, 'r', encoding='utf-8') as f:
+            if linter is None:
+                documents = yaml.load_all(f, Loader=safe_loader(core_schema))
+            else:
+                documents = iter_linted_documents(f.read(), linter, linting_loader(core_schema))
+
+            for index, document in enumerate(documents):
+                count += 1
+                if document is None:
+                    continue  # Empty document, e.g. a trailing '---'
+
+                document_schema = schema_path
+                if dispatcher is not None:
+                    document_schema = dispatcher.schema_for(document)
+                    if document_schema is None:
+                        skipped += 1
+                        continue
+
+                with file_stats.phase('validate'):
+                    schema_valid, message = validate_against_schema(
+                        document, document_schema, compiled=compiled, cache_dir=cache_dir,
+                        max_errors=max_errors, schema_dir=schema_dir,
+                        locate=locator.locator(index)
+                    )
+                if not schema_valid:
+                    label = f" ({describe(document)})" if dispatcher is not None else ""
+                    failures.append(f"document[{index}]{label}: {message}")
+                    if max_errors == 1:
+                        break
+
+    except yaml.YAMLError as e:
+        if all_errors:
+            failures.append(format_syntax_error(e, path.read_text(encoding='utf-8'), all_errors))
+        else:
+            failures.append(f"document[{count}]: YAML syntax error: {e}")
     except UnicodeDecodeError as e:
         return False, f"Encoding error: {e}"
     except Exception as e:
         return False, f"Unexpected error: {e}"
 
+    if audit_types and not failures:
+        with file_stats.phase('audit'):
+            message = audit_message(path.read_text(encoding='utf-8'))
+        if message:
+            failures.append(message)
+
+    problems = linter.sorted_problems() if linter is not None else []
+
+    if failures:
+        if problems:
+            failures.append(f"{len(problems)} lint problem(s):\n{format_problems(problems)}")
+        return False, "\n  ".join(failures)
+
+    if dispatcher is not None:
+        message = (f"Valid YAML ({count - skipped} document(s) valid against their schema"
+                   f"{f', {skipped} without a schema' if skipped else ''})")
+    else:
+        message = f"Valid YAML ({count} document(s) valid against schema)"
+    return lint_summary(message, problems)
+
+
+def report_results(results: List[Tuple[str, bool, str]], quiet: bool = False) -> bool:
+    """Print per-file results and a summary; return True if every file is valid."""
+    all_valid = all(is_valid for _, is_valid, _ in results)
+
+    # Print results
+    for file_path, is_valid, message in results:
+        if is_valid:
+            if not quiet:
+                print(f"✓ {file_path}: {message}")
+        else:
+            print(f"✗ {file_path}: {message}", file=sys.stderr)
+
+    # Summary
+    if len(results) > 1:
+        valid_count = sum(1 for _, is_valid, _ in results if is_valid)
+        total_count = len(results)
+        print(f"\n{valid_count}/{total_count} files valid", file=sys.stderr if not all_valid else sys.stdout)
+
+    return all_valid
+
 
 def main() -> int:
     """Main entry point."""
@@ -79,38 +313,135 @@ def main() -> int:
 Examples:
   %(prog)s config.yaml
   %(prog)s file1.yaml file2.yaml
+  %(prog)s **/*.yaml --shard 2/4
   %(prog)s **/*.yaml --strict
+  %(prog)s bundle.yaml --schema schema.json
+  %(prog)s k8s/*.yaml --schema schema.json --compiled --fail-fast
+  %(prog)s k8s/*.yaml --dispatch schemas/ --compiled
+  %(prog)s config/ --watch
+  %(prog)s **/*.yaml --lint --lint-config .yamllint.yml
+  %(prog)s broken.yaml --all-errors
+  %(prog)s **/*.yaml --audit-types
+  %(prog)s k8s/*.yaml --dispatch schemas/ --core-schema
+  %(prog)s **/*.yaml --stats --stats-top 5 --stats-json stats.json
         """
     )
     parser.add_argument('files', nargs='+', help='YAML files to validate')
     parser.add_argument('--strict', action='store_true', help='Enable strict validation')
+    schema_group = parser.add_mutually_exclusive_group()
+    schema_group.add_argument('--schema', help='JSON Schema file applied to every document')
+    schema_group.add_argument('--dispatch', metavar='SCHEMA_DIR',
+                              help='Validate each document against the schema in SCHEMA_DIR '
+                                   'declared for its apiVersion and kind')
+    parser.add_argument('--compiled', action='store_true',
+                        help='Validate with a compiled schema module (cached on disk)')
+    parser.add_argument('--schema-cache', help='Directory for compiled schema modules')
+    parser.add_argument('--schema-dir',
+                        help='Resolve $ref against the schemas in this directory (offline)')
+    errors_group = parser.add_mutually_exclusive_group()
+    errors_group.add_argument('--fail-fast', action='store_true',
+                              help='Stop at the first schema error in the first invalid file')
+    errors_group.add_argument('--max-errors', type=int, metavar='N',
+                              help='Report up to N schema errors per document')
+    parser.add_argument('--lint', action='store_true',
+                        help='Apply lint rules (trailing-spaces, line-length, indentation, '
+                             'document-start, truthy) in the same pass as parsing')
+    parser.add_argument('--lint-config', metavar='FILE',
+                        help='yamllint-style config for --lint (default: ./.yamllint*)')
+    parser.add_argument('--all-errors', action='store_true',
+                        help='Report every syntax error in a file, not just the first')
+    parser.add_argument('--audit-types', action='store_true',
+                        help="Fail on unquoted values that YAML 1.1 turns into booleans, "
+                             "numbers or dates (e.g. NO, 1.10, 0755)")
+    parser.add_argument('--core-schema', action='store_true',
+                        help='Resolve unquoted values with the YAML 1.2 core schema '
+                             '(yes/no/on/off and dates stay strings, 0755 is decimal)')
     parser.add_argument('--quiet', action='store_true', help='Only show errors')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and revalidate files (or directories) as they change; '
+                             'a changed schema revalidates every file')
+    parser.add_argument('--poll', action='store_true', help='With --watch, poll instead of using inotify')
+    add_shard_argument(parser)
+    file_stats.add_arguments(parser)
 
     args = parser.parse_args()
 
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    if args.shard and args.watch:
+        parser.error("--shard cannot be combined with --watch")
+    max_errors = 1 if args.fail_fast else args.max_errors
+    schema_dir = args.schema_dir or args.dispatch
+    lint_config = load_config(args.lint_config) if args.lint or args.lint_config else None
+
+    if (args.schema or args.dispatch) and not args.compiled and not HAS_JSONSCHEMA:
+        print("Error: jsonschema not installed. Run: pip install jsonschema", file=sys.stderr)
+        return 1
+
+    def check(file_path: str) -> Tuple[bool, str]:
+        with file_stats.track_file(file_path):
+            return check_file(file_path)
+
+    def check_file(file_path: str) -> Tuple[bool, str]:
+        # Cached, but looked up per file so --watch picks up a rebuilt table
+        dispatcher = get_dispatcher(args.dispatch) if args.dispatch else None
+        if args.schema or dispatcher is not None:
+            return validate_yaml_stream(
+                file_path, args.schema, compiled=args.compiled,
+                cache_dir=args.schema_cache, max_errors=max_errors,
+                schema_dir=schema_dir, dispatcher=dispatcher, lint_config=lint_config,
+                all_errors=args.all_errors, audit_types=args.audit_types,
+                core_schema=args.core_schema
+            )
+        return validate_yaml_file(file_path, strict=args.strict, lint_config=lint_config,
+                                  all_errors=args.all_errors, audit_types=args.audit_types,
+                                  core_schema=args.core_schema)
+
+    stats = file_stats.enable_from_args(args, 'validate_yaml.py')
+
+    if args.watch:
+        files = iter_watched_files(args.files, ('.yaml', '.yml'))
+    else:
+        files = args.files
+    if args.shard:
+        files = select_shard(files, args.shard)
+
     all_valid = True
     results = []
 
-    for file_path in args.files:
-        is_valid, message = validate_yaml_file(file_path, strict=args.strict)
+    for file_path in files:
+        is_valid, message = check(file_path)
         results.append((file_path, is_valid, message))
 
         if not is_valid:
             all_valid = False
+            if args.fail_fast:
+                break
 
-    # Print results
-    for file_path, is_valid, message in results:
-        if is_valid:
-            if not args.quiet:
-                print(f"✓ {file_path}: {message}")
-        else:
-            print(f"✗ {file_path}: {message}", file=sys.stderr)
+    report_results(results, quiet=args.quiet)
+    file_stats.finish(stats, args)
 
-    # Summary
-    if len(results) > 1:
-        valid_count = sum(1 for _, is_valid, _ in results if is_valid)
-        total_count = len(results)
-        print(f"\n{valid_count}/{total_count} files valid", file=sys.stderr if not all_valid else sys.stdout)
+    if args.watch:
+        schema_paths = [path for path in (args.schema, args.dispatch, args.schema_dir) if path]
+
+        def revalidate(changed: List[str]) -> None:
+            start = time.perf_counter()
+            if any(is_within(path, schema_paths) for path in changed):
+                # Validators are cached per schema: rebuild them and recheck everything
+                clear_schema_caches()
+                print(f"\n--- {time.strftime('%H:%M:%S')} schema changed ---")
+                changed = iter_watched_files(args.files, ('.yaml', '.yml'))
+            else:
+                changed = [path for path in changed if path.endswith(('.yaml', '.yml'))]
+                if not changed:
+                    return  # Only other .json files
+                print(f"\n--- {time.strftime('%H:%M:%S')} {len(changed)} file(s) changed ---")
+            report_results([(path, *check(path)) for path in changed], quiet=args.quiet)
+            print(f"(revalidated in {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+        # .json too, for the schemas in --dispatch/--schema-dir directories
+        return watch(args.files + schema_paths, revalidate, ('.yaml', '.yml', '.json'),
+                     force_polling=args.poll)
 
     return 0 if all_valid else 1
 
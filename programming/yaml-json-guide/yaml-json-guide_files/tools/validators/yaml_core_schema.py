@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+YAML 1.2 Core Schema Loader
+
+PyYAML resolves plain scalars with the YAML 1.1 rules: 'yes', 'NO' and 'on'
+become booleans, 0755 is octal, 22:22 is a base-60 integer and 2024-01-05
+becomes a date that json.dumps cannot serialize. The YAML 1.2 core schema
+only knows null, true/false, decimal/0o/0x integers and plain floats;
+everything else, timestamps included, stays a string.
+
+Scalars are resolved through a table keyed by their first character: most
+values (names, hosts, paths, images) start with a character that can only
+be a string and are resolved with one dictionary lookup, and the rest are
+checked with set membership and str/float parsing instead of the resolver's
+regular expressions.
+
+Merge keys ('<<: *defaults') are still honoured, as most real files use them.
+
+Usage (from Python):
+    from yaml_core_schema import CoreSchemaLoader
+    data = yaml.load(text, Loader=CoreSchemaLoader)
+
+    python yaml_core_schema.py config.yaml
+
+Examples:
+    python yaml_core_schema.py ../../exercises/advanced/exercise-14-debug-error/buggy-config.yaml
+"""
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+import yaml
+
+NULL_TAG = 'tag:yaml.org,2002:null'
+BOOL_TAG = 'tag:yaml.org,2002:bool'
+INT_TAG = 'tag:yaml.org,2002:int'
+FLOAT_TAG = 'tag:yaml.org,2002:float'
+STR_TAG = 'tag:yaml.org,2002:str'
+MERGE_TAG = 'tag:yaml.org,2002:merge'
+
+NULL_VALUES = frozenset({'~', 'null', 'Null', 'NULL'})
+BOOL_VALUES = frozenset({'true', 'True', 'TRUE', 'false', 'False', 'FALSE'})
+SPECIAL_FLOATS = frozenset(
+    sign + value
+    for sign in ('', '+', '-')
+    for value in ('.inf', '.Inf', '.INF')
+) | {'.nan', '.NaN', '.NAN'}
+
+OCTAL_DIGITS = frozenset('01234567')
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+FLOAT_CHARS = frozenset('0123456789.eE+-')
+
+
+def _null(value: str) -> str:
+    return NULL_TAG if value in NULL_VALUES else STR_TAG
+
+
+def _bool(value: str) -> str:
+    return BOOL_TAG if value in BOOL_VALUES else STR_TAG
+
+
+def _merge(value: str) -> str:
+    return MERGE_TAG if value == '<<' else STR_TAG
+
+
+def _number(value: str) -> str:
+    if value in SPECIAL_FLOATS:
+        return FLOAT_TAG
+    digits = value[1:] if value[0] in '+-' else value
+    if digits.isdigit() and digits.isascii():
+        return INT_TAG
+    prefix, rest = value[:2], value[2:]
+    if rest and ((prefix == '0o' and OCTAL_DIGITS.issuperset(rest))
+                 or (prefix == '0x' and HEX_DIGITS.issuperset(rest))):
+        return INT_TAG
+    if FLOAT_CHARS.issuperset(value):
+        # Within this alphabet float() accepts exactly the core schema's float syntax
+        try:
+            float(value)
+        except ValueError:
+            return STR_TAG
+        return FLOAT_TAG
+    return STR_TAG
+
+
+# First character -> resolver; any other first character means a string
+FIRST_CHAR: Dict[str, Callable[[str], str]] = {
+    '~': _null, 'n': _null, 'N': _null,
+    't': _bool, 'T': _bool, 'f': _bool, 'F': _bool,
+    '<': _merge,
+    **{ch: _number for ch in '0123456789+-.'},
+}
+
+
+def resolve_scalar(value: str) -> str:
+    """
+    Return the core schema tag of a plain scalar.
+
+    Args:
+        value: Plain (unquoted) scalar text
+
+    Returns:
+        Tag URI (null, bool, int, float, str or merge)
+    """
+    if not value:
+        return NULL_TAG
+    resolver = FIRST_CHAR.get(value[0])
+    return resolver(value) if resolver is not None else STR_TAG
+
+
+class CoreSchemaResolver(yaml.resolver.Resolver):
+    """Resolver using the YAML 1.2 core schema for plain scalars."""
+
+    def resolve(self, kind: Any, value: Any, implicit: Any) -> str:
+        if kind is yaml.ScalarNode and implicit[0]:
+            return resolve_scalar(value)
+        return super().resolve(kind, value, implicit)
+
+
+class CoreSchemaConstructor(yaml.constructor.SafeConstructor):
+    """SafeConstructor reading integers the YAML 1.2 way (0755 is decimal, 0o755 octal)."""
+
+    def construct_yaml_int(self, node: Any) -> int:
+        value = self.construct_scalar(node)
+        if value[:2] == '0o':
+            return int(value[2:], 8)
+        if value[:2] == '0x':
+            return int(value[2:], 16)
+        if value.lstrip('+-').isdigit():
+            return int(value)
+        return super().construct_yaml_int(node)  # Explicit '!!int' with YAML 1.1 syntax
+
+
+CoreSchemaConstructor.add_constructor(INT_TAG, CoreSchemaConstructor.construct_yaml_int)
+
+
+@lru_cache(maxsize=None)
+def core_schema_loader(base: type) -> type:
+    """
+    Return a variant of a SafeLoader-style loader class using the core schema.
+
+    Works for yaml.SafeLoader, yaml.CSafeLoader and their subclasses (e.g.
+    the linting loader), so every loader in tools/ can opt in.
+
+    Args:
+        base: Loader class built on SafeConstructor and Resolver
+    """
+    return type(f'CoreSchema{base.__name__}', (CoreSchemaConstructor, CoreSchemaResolver, base), {})
+
+
+CoreSchemaLoader = core_schema_loader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def safe_loader(core_schema: bool = False) -> type:
+    """Fastest safe loader class, optionally with the YAML 1.2 core schema."""
+    if core_schema:
+        return CoreSchemaLoader
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Load YAML files with the YAML 1.2 core schema and print them as JSON',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s config.yaml
+        """
+    )
+    parser.add_argument('files', nargs='+', help='YAML files to load')
+
+    args = parser.parse_args()
+
+    failed = False
+    for file_path in args.files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                documents = list(yaml.load_all(f, Loader=CoreSchemaLoader))
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            print(f"✗ {file_path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        for document in documents:
+            print(json.dumps(document, indent=2, ensure_ascii=False))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
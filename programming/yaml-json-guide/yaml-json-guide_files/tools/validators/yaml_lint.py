@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+YAML Lint Engine
+
+Lints YAML files with pluggable rules applied during the same scanner pass
+that parses the documents, so validate_yaml.py --lint reads and tokenizes
+each file once instead of running yamllint as a separate pass.
+
+Built-in rules (a subset of yamllint's, with the same names and options):
+    trailing-spaces   Whitespace at the end of a line
+    line-length       Lines longer than 'max' characters
+    indentation       Block indentation by 'spaces' and 'indent-sequences'
+    document-start    Required (or forbidden) '---' at the start of documents
+    truthy            Plain scalars YAML 1.1 reads as booleans
+
+Configuration uses yamllint's format and is read from .yamllint,
+.yamllint.yaml or .yamllint.yml in the current directory; options for
+rules this engine does not implement are ignored.
+
+Usage:
+    python yaml_lint.py config.yaml
+    python yaml_lint.py **/*.yaml --config .yamllint.yml
+
+Examples:
+    python yaml_lint.py k8s/*.yaml
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Type
+
+import yaml
+
+CONFIG_FILES = ('.yamllint', '.yamllint.yaml', '.yamllint.yml')
+
+# Plain scalars YAML 1.1 (and PyYAML) resolve to booleans
+TRUTHY_VALUES = {
+    'yes', 'Yes', 'YES', 'no', 'No', 'NO',
+    'true', 'True', 'TRUE', 'false', 'False', 'FALSE',
+    'on', 'On', 'ON', 'off', 'Off', 'OFF',
+}
+
+
+class LintProblem(NamedTuple):
+    """A single lint finding."""
+    line: int
+    column: int
+    level: str
+    rule: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.line}:{self.column}  {self.level}  {self.message}  ({self.rule})"
+
+
+class LintRule:
+    """
+    Base class for rules.
+
+    Subclasses set name and defaults and override check_line and/or
+    check_token; the engine only calls the hooks a rule overrides.
+    """
+
+    name = ''
+    defaults: Dict[str, Any] = {}
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = {'level': 'error', **self.defaults, **options}
+        self.level = self.options['level']
+
+    def problem(self, line: int, column: int, message: str) -> LintProblem:
+        return LintProblem(line, column, self.level, self.name, message)
+
+    def check_line(self, number: int, line: str) -> Iterator[LintProblem]:
+        """Check one line of text (1-based number, without newline)."""
+        return iter(())
+
+    def check_token(self, token: Any, previous: Any) -> Iterator[LintProblem]:
+        """Check one scanner token; previous is the token before it."""
+        return iter(())
+
+
+RULES: Dict[str, Type[LintRule]] = {}
+
+
+def register_rule(rule_class: Type[LintRule]) -> Type[LintRule]:
+    """Class decorator adding a rule to the registry under its name."""
+    RULES[rule_class.name] = rule_class
+    return rule_class
+
+
+@register_rule
+class TrailingSpaces(LintRule):
+    name = 'trailing-spaces'
+
+    def check_line(self, number: int, line: str) -> Iterator[LintProblem]:
+        stripped = line.rstrip(' \t')
+        if len(stripped) != len(line):
+            yield self.problem(number, len(stripped) + 1, "trailing spaces")
+
+
+def _is_non_breakable_inline_mapping(line: str) -> bool:
+    """Whether a line is "key: <one word>", scanned as yamllint does."""
+    loader = yaml.SafeLoader(line)
+    try:
+        while loader.peek_token():
+            if isinstance(loader.get_token(), yaml.BlockMappingStartToken):
+                while loader.peek_token():
+                    if isinstance(loader.get_token(), yaml.ValueToken):
+                        scalar = loader.get_token()
+                        if isinstance(scalar, yaml.ScalarToken):
+                            return ' ' not in line[scalar.start_mark.column:]
+    except yaml.scanner.ScannerError:
+        pass
+    return False
+
+
+@register_rule
+class LineLength(LintRule):
+    name = 'line-length'
+    defaults = {'max': 80, 'allow-non-breakable-words': True, 'allow-non-breakable-inline-mappings': False}
+
+    def check_line(self, number: int, line: str) -> Iterator[LintProblem]:
+        limit = self.options['max']
+        if len(line) <= limit:
+            return
+        inline_mappings = self.options['allow-non-breakable-inline-mappings']
+        if self.options['allow-non-breakable-words'] or inline_mappings:
+            # A single long word (URL, hash) after the indentation, "- " or "# " is allowed
+            start = len(line) - len(line.lstrip(' '))
+            if start < len(line):
+                if line[start] == '#':
+                    start = len(line) - len(line[start:].lstrip('#')) + 1
+                elif line[start] == '-':
+                    start += 2
+                if ' ' not in line[start:]:
+                    return
+                # "key: <long word>" only with allow-non-breakable-inline-mappings
+                if inline_mappings and _is_non_breakable_inline_mapping(line):
+                    return
+        yield self.problem(number, limit + 1, f"line too long ({len(line)} > {limit} characters)")
+
+
+@register_rule
+class Indentation(LintRule):
+    name = 'indentation'
+    defaults = {'spaces': 'consistent', 'indent-sequences': True}
+
+    def __init__(self, options: Dict[str, Any]):
+        super().__init__(options)
+        self.spaces = self.options['spaces']
+        self.indent_sequences = self.options['indent-sequences']
+        self.stack: List[Any] = []  # [kind, column] of open block collections
+
+    def wrong(self, token: Any, expected: int) -> LintProblem:
+        mark = token.start_mark
+        return self.problem(mark.line + 1, mark.column + 1,
+                            f"wrong indentation: expected {expected} but found {mark.column}")
+
+    def check_token(self, token: Any, previous: Any) -> Iterator[LintProblem]:
+        if isinstance(token, (yaml.BlockMappingStartToken, yaml.BlockSequenceStartToken)):
+            kind = 'map' if isinstance(token, yaml.BlockMappingStartToken) else 'seq'
+            column = token.start_mark.column
+            # "- key: value" and "- - item" start a collection on the entry's line
+            compact = (isinstance(previous, yaml.BlockEntryToken)
+                       and previous.start_mark.line == token.start_mark.line)
+
+            if not self.stack:
+                if column != 0:
+                    yield self.wrong(token, 0)
+            elif not compact:
+                parent_column = self.stack[-1][1]
+                delta = column - parent_column
+                if kind == 'seq' and self.indent_sequences is False:
+                    if delta != 0:
+                        yield self.wrong(token, parent_column)
+                elif kind == 'seq' and self.indent_sequences == 'whatever':
+                    pass
+                else:
+                    if self.spaces == 'consistent' and delta > 0:
+                        self.spaces = delta
+                    if delta != self.spaces:
+                        yield self.wrong(token, parent_column + self.spaces)
+            self.stack.append([kind, column])
+
+        elif isinstance(token, yaml.BlockEndToken):
+            if self.stack:
+                self.stack.pop()
+
+        elif isinstance(token, yaml.BlockEntryToken) and self.stack:
+            # An entry at the column of its parent mapping is an unindented sequence
+            kind, column = self.stack[-1]
+            if kind == 'map' and token.start_mark.column == column and self.indent_sequences is True:
+                spaces = 2 if self.spaces == 'consistent' else self.spaces
+                yield self.wrong(token, column + spaces)
+
+        elif isinstance(token, yaml.StreamStartToken):
+            self.stack = []
+
+
+@register_rule
+class DocumentStart(LintRule):
+    name = 'document-start'
+    defaults = {'level': 'warning', 'present': True}
+
+    def __init__(self, options: Dict[str, Any]):
+        super().__init__(options)
+        self.expecting = False
+
+    def check_token(self, token: Any, previous: Any) -> Iterator[LintProblem]:
+        if isinstance(token, (yaml.StreamStartToken, yaml.DocumentEndToken)):
+            self.expecting = True
+            return
+        if isinstance(token, yaml.DocumentStartToken):
+            if not self.options['present']:
+                mark = token.start_mark
+                yield self.problem(mark.line + 1, mark.column + 1, 'found forbidden document start "---"')
+            self.expecting = False
+        elif self.expecting and not isinstance(token, (yaml.DirectiveToken, yaml.StreamEndToken)):
+            if self.options['present']:
+                yield self.problem(token.start_mark.line + 1, 1, 'missing document start "---"')
+            self.expecting = False
+
+
+@register_rule
+class Truthy(LintRule):
+    name = 'truthy'
+    defaults = {'level': 'warning', 'allowed-values': ['true', 'false'], 'check-keys': True}
+
+    def __init__(self, options: Dict[str, Any]):
+        super().__init__(options)
+        self.allowed = set(self.options['allowed-values'])
+        self.message = f"truthy value should be one of [{', '.join(sorted(self.allowed))}]"
+
+    def check_token(self, token: Any, previous: Any) -> Iterator[LintProblem]:
+        if (isinstance(token, yaml.ScalarToken) and token.plain
+                and token.value in TRUTHY_VALUES and token.value not in self.allowed):
+            if isinstance(previous, yaml.KeyToken) and not self.options['check-keys']:
+                return
+            mark = token.start_mark
+            yield self.problem(mark.line + 1, mark.column + 1, self.message)
+
+
+DEFAULT_CONFIG: Dict[str, Dict[str, Any]] = {name: {} for name in RULES}
+
+
+def load_config(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load rule options from a yamllint-style configuration file.
+
+    Args:
+        path: Configuration file (None: look for .yamllint* in the current directory)
+
+    Returns:
+        Mapping of enabled rule name to its options
+    """
+    if path is None:
+        path = next((name for name in CONFIG_FILES if Path(name).is_file()), None)
+    config = {name: dict(options) for name, options in DEFAULT_CONFIG.items()}
+    if path is None:
+        return config
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    for name, options in (data.get('rules') or {}).items():
+        if name not in RULES:
+            continue  # yamllint rule without a native implementation
+        if options == 'disable':
+            config.pop(name, None)
+        elif options == 'enable':
+            config[name] = {}
+        elif isinstance(options, dict):
+            config[name] = {**config.get(name, {}), **options}
+    return config
+
+
+class Linter:
+    """Runs the enabled rules over the lines and tokens of one file."""
+
+    def __init__(self, config: Dict[str, Dict[str, Any]]):
+        rules = [RULES[name](options) for name, options in config.items()]
+        self.line_rules = [r for r in rules if type(r).check_line is not LintRule.check_line]
+        self.token_rules = [r for r in rules if type(r).check_token is not LintRule.check_token]
+        self.problems: List[LintProblem] = []
+        self.previous = None
+
+    def feed_lines(self, content: str) -> None:
+        for number, line in enumerate(content.split('\n'), start=1):
+            line = line.rstrip('\r')
+            for rule in self.line_rules:
+                self.problems.extend(rule.check_line(number, line))
+
+    def feed_token(self, token: Any) -> None:
+        for rule in self.token_rules:
+            self.problems.extend(rule.check_token(token, self.previous))
+        self.previous = token
+
+    def sorted_problems(self) -> List[LintProblem]:
+        return sorted(self.problems, key=lambda p: (p.line, p.column))
+
+
+class LintingLoader(yaml.SafeLoader):
+    """SafeLoader that hands every token the parser consumes to a Linter."""
+
+    def __init__(self, stream: Any, linter: Linter):
+        super().__init__(stream)
+        self.linter = linter
+
+    def get_token(self) -> Any:
+        token = super().get_token()
+        self.linter.feed_token(token)
+        return token
+
+
+def iter_linted_documents(content: str, linter: Linter,
+                          loader_class: Type[LintingLoader] = LintingLoader) -> Iterator[Any]:
+    """
+    Yield the documents of a YAML stream while linting it in the same pass.
+
+    Args:
+        content: YAML text
+        linter: Linter collecting the problems
+        loader_class: LintingLoader or a subclass (e.g. with the YAML 1.2 core schema)
+
+    Raises:
+        yaml.YAMLError: On the first syntax error (problems found so far are kept)
+    """
+    linter.feed_lines(content)
+    loader = loader_class(content, linter)
+    try:
+        while loader.check_data():
+            yield loader.get_data()
+    finally:
+        loader.dispose()
+
+
+def has_errors(problems: List[LintProblem]) -> bool:
+    return any(problem.level == 'error' for problem in problems)
+
+
+def format_problems(problems: List[LintProblem]) -> str:
+    return "\n".join(f"    {problem}" for problem in problems)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Lint YAML files in a single pass (yamllint-compatible rule names)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s config.yaml
+  %(prog)s **/*.yaml --config .yamllint.yml
+        """
+    )
+    parser.add_argument('files', nargs='+', help='YAML files to lint')
+    parser.add_argument('--config', help='yamllint-style configuration file')
+
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    failed = False
+
+    for file_path in args.files:
+        linter = Linter(config)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            for _ in iter_linted_documents(content, linter):
+                pass
+        except yaml.YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
+            line, column = (mark.line + 1, mark.column + 1) if mark else (0, 0)
+            linter.problems.append(LintProblem(line, column, 'error', 'syntax', str(getattr(e, 'problem', e))))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"✗ {file_path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+
+        problems = linter.sorted_problems()
+        if problems:
+            print(f"{file_path}\n{format_problems(problems)}")
+        failed = failed or has_errors(problems)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+YAML Node Locator
+
+Maps an instance path such as ('spec', 'containers', 0, 'image') to the line
+and column where that value appears in a YAML (or JSON) file.
+
+Positions need the node graph with its marks, which the fast loaders throw
+away. The validators therefore load files the fast way and only create a
+NodeLocator once a document has failed validation; the file is composed
+(not constructed) on the first lookup, so valid files pay nothing.
+
+Usage:
+    python yaml_locator.py deployment.yaml spec.template.spec.containers.0.image
+    python yaml_locator.py bundle.yaml metadata.name --document 2
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import yaml
+
+# Composing keeps marks with either loader; libyaml is just faster
+ComposeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+Location = Tuple[int, int]
+
+
+class NodeLocator:
+    """Resolves instance paths of the documents in one file to (line, column)."""
+
+    def __init__(self, file_path: str, content: Optional[str] = None):
+        self.file_path = file_path
+        self.content = content  # Text already read by the caller, composed instead of the file
+        self._documents: Optional[List[Any]] = None
+
+    def _document(self, index: int) -> Any:
+        if self._documents is None:
+            try:
+                if self.content is not None:
+                    self._documents = list(yaml.compose_all(self.content, Loader=ComposeLoader))
+                else:
+                    with open(self.file_path, 'r', encoding='utf-8') as f:
+                        self._documents = list(yaml.compose_all(f, Loader=ComposeLoader))
+            except (OSError, UnicodeDecodeError, yaml.YAMLError):
+                self._documents = []  # No positions, e.g. JSON that is not valid YAML
+        return self._documents[index] if index < len(self._documents) else None
+
+    def locate(self, path: Sequence[Any], document_index: int = 0) -> Optional[Location]:
+        """
+        Return the 1-based (line, column) of the deepest node on a path.
+
+        When the path leads to a missing key (e.g. a required property), the
+        position of the closest existing ancestor is returned.
+
+        Args:
+            path: Instance path (keys and list indexes)
+            document_index: Index of the document in a multi-document stream
+
+        Returns:
+            (line, column), or None if the file cannot be composed
+        """
+        node = self._document(document_index)
+        if node is None:
+            return None
+
+        for part in path:
+            child = find_child(node, part)
+            if child is None:
+                break
+            node = child
+
+        return node.start_mark.line + 1, node.start_mark.column + 1
+
+    def locator(self, document_index: int = 0) -> Callable[[Sequence[Any]], Optional[Location]]:
+        """Return a path -> location function for one document."""
+        return lambda path: self.locate(path, document_index)
+
+
+def find_child(node: Any, part: Any) -> Any:
+    """Return the value node for a mapping key or sequence index, or None."""
+    if isinstance(node, yaml.SequenceNode):
+        if isinstance(part, int) and 0 <= part < len(node.value):
+            return node.value[part]
+        return None
+
+    if isinstance(node, yaml.MappingNode):
+        wanted = str(part).lower() if isinstance(part, bool) else str(part)
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == wanted:
+                return value_node
+        # Keys inherited through merge keys ('<<: *defaults')
+        for key_node, value_node in node.value:
+            if key_node.tag == 'tag:yaml.org,2002:merge':
+                sources = value_node.value if isinstance(value_node, yaml.SequenceNode) else [value_node]
+                for source in sources:
+                    found = find_child(source, part)
+                    if found is not None:
+                        return found
+    return None
+
+
+def format_location(location: Optional[Location]) -> str:
+    """Format a location as ' (line L, column C)', or '' when unknown."""
+    if location is None:
+        return ''
+    return f" (line {location[0]}, column {location[1]})"
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Print the line and column of a value in a YAML or JSON file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s deployment.yaml spec.template.spec.containers.0.image
+  %(prog)s bundle.yaml metadata.name --document 2
+        """
+    )
+    parser.add_argument('file', help='YAML or JSON file')
+    parser.add_argument('path', help='Dotted path; numeric parts are list indexes')
+    parser.add_argument('--document', type=int, default=0, help='Document index (default: 0)')
+
+    args = parser.parse_args()
+
+    path = [int(part) if part.isdigit() else part for part in args.path.split('.') if part]
+    location = NodeLocator(args.file).locate(path, args.document)
+    if location is None:
+        print(f"Error: cannot locate {args.path} in {args.file}", file=sys.stderr)
+        return 1
+
+    print(f"{args.file}:{location[0]}:{location[1]}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
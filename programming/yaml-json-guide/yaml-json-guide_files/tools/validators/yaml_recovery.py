@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Recovering YAML Syntax Checker
+
+Reports every syntax error in a YAML file in one pass instead of stopping at
+the first one. After an error the checker resynchronizes at the next line
+that is indented no deeper than the failing line, and continues parsing
+from there as a fragment dedented to that line's indentation. Fragments end
+at the first less-indented line, where parsing resumes at the outer level.
+
+Every line is fed to the parser once (plus the parser's small read-ahead
+after an error), so the run time is linear in the file size. Errors after
+the first can occasionally be follow-on errors of an earlier one.
+
+Usage:
+    python yaml_recovery.py broken.yaml
+    python yaml_recovery.py broken.yaml --max-errors 20
+
+Examples:
+    python yaml_recovery.py ../../exercises/beginner/exercise-03-fix-broken-yaml/broken.yaml
+"""
+
+import argparse
+import re
+import sys
+from typing import List, NamedTuple, Optional
+
+import yaml
+
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Lines that cannot start a fragment (they close or continue a flow collection)
+CONTINUATION_PREFIXES = (']', '}', ',')
+
+# Characters handed to the parser per read; bounds the re-read after each error
+READ_AHEAD = 1024
+
+ALIAS = re.compile(r'\*([^\s,\[\]{}]+)')
+
+
+class SyntaxProblem(NamedTuple):
+    """One syntax error (1-based line and column)."""
+    line: int
+    column: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column}: {self.message}"
+
+
+def indentation(line: str) -> int:
+    return len(line) - len(line.lstrip(' '))
+
+
+def is_blank(line: str) -> bool:
+    """True for empty and comment-only lines, which never end a block."""
+    stripped = line.strip()
+    return not stripped or stripped.startswith('#')
+
+
+def is_sequence_entry(line: str) -> bool:
+    stripped = line.lstrip(' ')
+    return stripped == '-' or stripped.startswith('- ')
+
+
+class _FragmentReader:
+    """
+    File-like view of lines[start:] dedented by `indent`.
+
+    Stops before the first non-blank line indented less than `indent` (or,
+    for a fragment of sequence entries, before a sibling that is not an
+    entry), and records that line's index in `stop`.
+    """
+
+    def __init__(self, lines: List[str], start: int, indent: int):
+        self.lines = lines
+        self.index = start
+        self.indent = indent
+        self.sequence = is_sequence_entry(lines[start])
+        self.stop = len(lines)
+
+    def _ends_fragment(self, line: str) -> bool:
+        if is_blank(line):
+            return False
+        column = indentation(line)
+        if column < self.indent:
+            return True
+        return self.sequence and column == self.indent and not is_sequence_entry(line)
+
+    def read(self, size: int = -1) -> str:
+        size = READ_AHEAD if size < 0 else min(size, READ_AHEAD)
+        chunks = []
+        total = 0
+        while self.index < self.stop and total < size:
+            line = self.lines[self.index]
+            if self._ends_fragment(line):
+                self.stop = self.index
+                break
+            text = line[self.indent:] if indentation(line) >= self.indent else line.lstrip(' ')
+            chunks.append(text + '\n')
+            total += len(text) + 1
+            self.index += 1
+        return ''.join(chunks)
+
+
+def _message(error: yaml.YAMLError) -> str:
+    problem = getattr(error, 'problem', None)
+    context = getattr(error, 'context', None)
+    if problem and context:
+        return f"{problem} ({context})"
+    return problem or context or str(error)
+
+
+def _is_cross_fragment_alias(error: yaml.YAMLError, lines: List[str], line: int, column: int) -> bool:
+    """True for an 'undefined alias' whose anchor was defined before the fragment started."""
+    if not isinstance(error, yaml.composer.ComposerError) or 'undefined alias' not in (error.problem or ''):
+        return False
+    match = ALIAS.match(lines[line], column)
+    if match is None:
+        return False
+    anchor = re.compile(r'&' + re.escape(match.group(1)) + r'(?![^\s,\[\]{}])')
+    return any(anchor.search(text) for text in lines[:line])
+
+
+def find_syntax_errors(content: str, max_errors: Optional[int] = None) -> List[SyntaxProblem]:
+    """
+    Parse a YAML stream and return every syntax error found.
+
+    Args:
+        content: YAML text (may contain several documents)
+        max_errors: Stop after this many errors (None: no limit)
+
+    Returns:
+        List of SyntaxProblem in file order (empty if the file is valid)
+    """
+    lines = content.split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    problems: List[SyntaxProblem] = []
+    start, indent = 0, 0
+
+    while start < len(lines):
+        reader = _FragmentReader(lines, start, indent)
+        try:
+            for _ in yaml.load_all(reader, Loader=SafeLoader):
+                pass
+        except yaml.YAMLError as error:
+            mark = getattr(error, 'problem_mark', None) or getattr(error, 'context_mark', None)
+            if (getattr(error, 'context', None) or '').startswith('while scanning a quoted scalar'):
+                # An unclosed quote runs to the end of the file; blame and resync at its start
+                mark = error.context_mark or mark
+            line = min(start + (mark.line if mark else 0), max(reader.index - 1, start))
+            column = (mark.column if mark else 0) + (indent if indentation(lines[line]) >= indent else 0)
+
+            if not (start > 0 and _is_cross_fragment_alias(error, lines, line, column)):
+                problems.append(SyntaxProblem(line + 1, column + 1, _message(error)))
+                if max_errors is not None and len(problems) >= max_errors:
+                    break
+
+            # Resynchronize at the next line no deeper than the failing one
+            limit = indentation(lines[line])
+            start = line + 1
+            while start < len(lines) and (
+                    is_blank(lines[start])
+                    or indentation(lines[start]) > limit
+                    or lines[start].lstrip(' ').startswith(CONTINUATION_PREFIXES)):
+                start += 1
+        else:
+            # Fragment parsed cleanly; continue with the less-indented remainder
+            start = reader.stop
+            while start < len(lines) and is_blank(lines[start]):
+                start += 1
+
+        if start < len(lines):
+            indent = indentation(lines[start])
+
+    return problems
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Report every syntax error in YAML files, not just the first',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s broken.yaml
+  %(prog)s **/*.yaml --max-errors 20
+        """
+    )
+    parser.add_argument('files', nargs='+', help='YAML files to check')
+    parser.add_argument('--max-errors', type=int, metavar='N', help='Stop after N errors per file')
+
+    args = parser.parse_args()
+
+    failed = False
+    for file_path in args.files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                problems = find_syntax_errors(f.read(), args.max_errors)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"✗ {file_path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+
+        if problems:
+            failed = True
+            print(f"✗ {file_path}: {len(problems)} syntax error(s)", file=sys.stderr)
+            for problem in problems:
+                print(f"    {problem}", file=sys.stderr)
+        else:
+            print(f"✓ {file_path}: Valid YAML")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+YAML Implicit-Type Audit
+
+Flags unquoted scalars that YAML 1.1 (and therefore PyYAML) silently turns
+into something other than the string that was probably intended:
+
+    country: NO          -> False        (the "Norway problem")
+    version: 1.10        -> 1.1          (float drops the trailing zero)
+    mode: 0755           -> 493          (octal)
+    ports: 22:22         -> 1342         (base-60 integer)
+    released: 2024-01-05 -> date         (not JSON-serializable)
+
+The audit runs over scanner tokens only; no Python objects are built, so it
+is cheap enough for every file in every commit.
+
+Usage:
+    python yaml_type_audit.py config.yaml
+    python yaml_type_audit.py **/*.yaml
+
+Examples:
+    python yaml_type_audit.py ../../exercises/advanced/exercise-14-debug-error/buggy-config.yaml
+"""
+
+import argparse
+import re
+import sys
+from typing import Iterator, List, NamedTuple, Optional
+
+import yaml
+
+ScanLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_resolver = yaml.resolver.Resolver()
+
+# Only scalars starting with one of these can resolve to a non-string type
+CANDIDATE_FIRST_CHARS = frozenset(
+    ch for ch, resolvers in _resolver.yaml_implicit_resolvers.items()
+    if ch is not None and any(tag not in ('tag:yaml.org,2002:null', 'tag:yaml.org,2002:merge',
+                                          'tag:yaml.org,2002:value', 'tag:yaml.org,2002:yaml')
+                              for tag, _ in resolvers)
+)
+
+OCTAL = re.compile(r'^[-+]?0[0-7_]+$')
+
+
+class TypeFinding(NamedTuple):
+    """An unquoted scalar that resolves to a surprising type."""
+    line: int
+    column: int
+    value: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column}: {self.message}"
+
+
+def classify(value: str) -> Optional[str]:
+    """
+    Explain how YAML 1.1 resolves a plain scalar, if a string was likely intended.
+
+    Args:
+        value: Plain scalar text
+
+    Returns:
+        Description of the surprising resolution, or None if unremarkable
+    """
+    if not value or value[0] not in CANDIDATE_FIRST_CHARS:
+        return None
+
+    tag = _resolver.resolve(yaml.ScalarNode, value, (True, False))
+
+    if tag == 'tag:yaml.org,2002:bool':
+        if value.lower() in ('true', 'false'):
+            return None
+        return f"'{value}' becomes boolean {value.lower() in ('yes', 'on')}"
+
+    if tag == 'tag:yaml.org,2002:int':
+        if ':' in value:
+            return f"'{value}' becomes base-60 integer {yaml.safe_load(value)}"
+        if OCTAL.match(value) and value.strip('+-0_'):
+            return f"'{value}' becomes octal integer {yaml.safe_load(value)}"
+        return None
+
+    if tag == 'tag:yaml.org,2002:float':
+        if ':' in value:
+            return f"'{value}' becomes base-60 float {yaml.safe_load(value)}"
+        if value.lstrip('+-').lower() in ('.inf', '.nan'):
+            return None
+        number = yaml.safe_load(value)
+        if repr(number) != value.lstrip('+').replace('_', ''):
+            return f"'{value}' becomes float {number!r}"
+        return None
+
+    if tag == 'tag:yaml.org,2002:timestamp':
+        kind = 'date' if len(value) <= 10 else 'datetime'
+        return f"'{value}' becomes a {kind} (not JSON-serializable)"
+
+    return None
+
+
+def iter_findings(stream) -> Iterator[TypeFinding]:
+    """
+    Yield findings for every plain scalar (keys included) in a YAML stream.
+
+    Args:
+        stream: YAML text or file object
+
+    Raises:
+        yaml.YAMLError: If the stream cannot be tokenized
+    """
+    for token in yaml.scan(stream, Loader=ScanLoader):
+        if type(token) is yaml.ScalarToken and token.plain:
+            message = classify(token.value)
+            if message is not None:
+                mark = token.start_mark
+                yield TypeFinding(mark.line + 1, mark.column + 1, token.value,
+                                  f"{message}; quote it if a string is meant")
+
+
+def audit_content(content: str) -> List[TypeFinding]:
+    """Return all findings for YAML text."""
+    return list(iter_findings(content))
+
+
+def format_findings(findings: List[TypeFinding]) -> str:
+    return "\n".join(f"    {finding}" for finding in findings)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Flag unquoted YAML values that implicitly become booleans, numbers or dates',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s config.yaml
+  %(prog)s **/*.yaml
+        """
+    )
+    parser.add_argument('files', nargs='+', help='YAML files to audit')
+
+    args = parser.parse_args()
+
+    flagged = 0
+    for file_path in args.files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                findings = audit_content(f.read())
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            print(f"✗ {file_path}: {e}", file=sys.stderr)
+            flagged += 1
+            continue
+
+        if findings:
+            flagged += 1
+            print(f"⚠️  {file_path}: {len(findings)} implicit type conversion(s)\n{format_findings(findings)}",
+                  file=sys.stderr)
+
+    if flagged:
+        print(f"\n{flagged}/{len(args.files)} file(s) need attention", file=sys.stderr)
+        return 1
+    print(f"✓ No implicit type surprises in {len(args.files)} file(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())